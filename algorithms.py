@@ -0,0 +1,268 @@
+# algorithms.py
+# Prebuilt algorithms: QFT / inverse QFT, Grover, Deutsch-Jozsa and
+# Bernstein-Vazirani. Each has a gate-level Circuit (for the circuit view and
+# for verification; phase oracles are one DIAGONAL operation, or Z gates when
+# the oracle is a parity, and verify() expands them to X / multi-controlled Z / X)
+# and a fast path on QuantumSimulator: QFT as np.fft on the
+# reshaped state (O(n·2^n)), oracles as one vectorized phase flip and the
+# diffuser as one in-place reflection about the mean.
+
+import numpy as np # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD
+from circuit import Circuit, DIAGONAL, execute
+
+
+def _register(simulator, qubits):
+    """Daftar qubit register (default semua qubit)"""
+    return list(range(simulator.num_qubits)) if qubits is None else [int(q) for q in qubits]
+
+
+def qft_circuit(num_qubits, qubits=None, inverse=False):
+    """Circuit QFT gate-level (H, controlled-phase, SWAP); qubits[0] = bit paling signifikan"""
+    qubits = list(range(num_qubits)) if qubits is None else list(qubits)
+    k = len(qubits)
+    ops = []
+    for j in range(k):
+        ops.append(("H", [qubits[j]], (), ()))
+        for m in range(j + 1, k):
+            ops.append(("P", [qubits[j]], (qubits[m],), (np.pi / 2 ** (m - j),)))
+    for j in range(k // 2):
+        ops.append(("SWAP", [qubits[j], qubits[k - 1 - j]], (), ()))
+    circuit = Circuit(num_qubits)
+    if inverse:
+        # Invers: urutan dibalik, sudut fase dinegasikan
+        ops = [(kind, targets, controls, tuple(-p for p in params)) for kind, targets, controls, params in ops[::-1]]
+    for kind, targets, controls, params in ops:
+        circuit.append(kind, targets, controls, params)
+    return circuit
+
+
+def apply_qft(simulator, qubits=None, inverse=False):
+    """QFT lewat np.fft pada state yang di-reshape: |x⟩ -> Σ_y e^(2πi·xy/N) |y⟩ / sqrt(N)"""
+    qubits = _register(simulator, qubits)
+    n = simulator.num_qubits
+    k = len(qubits)
+    transform = np.fft.fft if inverse else np.fft.ifft
+    if qubits == list(range(n)):
+        simulator.state = transform(simulator.state, norm="ortho")
+        return simulator
+    # Sumbu register dipindah ke belakang dan digabung menjadi satu sumbu 2^k
+    psi = np.moveaxis(simulator.state.reshape((2,) * n), qubits, list(range(n - k, n)))
+    shape = psi.shape
+    out = transform(psi.reshape(-1, 2 ** k), axis=1, norm="ortho").reshape(shape)
+    simulator.state = np.moveaxis(out, list(range(n - k, n)), qubits).reshape(-1)
+    return simulator
+
+
+def _marked_mask(num_register, marked):
+    """Mask boolean 2^k dari daftar indeks atau predikat vektor f(indeks) -> bool"""
+    if callable(marked):
+        return np.asarray(marked(np.arange(2 ** num_register)), dtype=bool)
+    mask = np.zeros(2 ** num_register, dtype=bool)
+    mask[np.asarray(list(marked), dtype=np.int64)] = True
+    return mask
+
+
+def _parity(values):
+    """Paritas bit setiap nilai (lipatan XOR, vektor)"""
+    values = np.asarray(values, dtype=np.int64).copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        values ^= values >> shift
+    return values & 1
+
+
+def _parity_secret(mask):
+    """s jika mask[x] = s·x mod 2 untuk semua x (oracle paritas, mis. x & 1), selain itu None"""
+    k = len(mask).bit_length() - 1
+    if mask[0]:
+        return None
+    secret = sum(1 << j for j in range(k) if mask[1 << j])
+    if not np.array_equal(mask, _parity(np.arange(len(mask)) & secret).astype(bool)):
+        return None
+    return secret
+
+
+def _append_flips(circuit, qubits, values):
+    """Untuk setiap nilai register: X pada bit 0, multi-controlled Z, X kembali (flip fase nilai itu)"""
+    k = len(qubits)
+    for value in values:
+        zeros = [q for i, q in enumerate(qubits) if not (value >> (k - 1 - i)) & 1]
+        for q in zeros:
+            circuit.append("X", [q])
+        circuit.append("Z", [qubits[-1]], qubits[:-1])
+        for q in zeros:
+            circuit.append("X", [q])
+
+
+def phase_oracle_circuit(num_qubits, marked, qubits=None, gate_level=False):
+    """Oracle fase ringkas: Z pada bit s untuk oracle paritas (-1)^(s·x), selain itu satu operasi DIAGONAL ±1
+
+    gate_level=True: dekomposisi X / multi-controlled Z / X per indeks bertanda (referensi verify).
+    """
+    qubits = list(range(num_qubits)) if qubits is None else list(qubits)
+    k = len(qubits)
+    mask = _marked_mask(k, marked)
+    circuit = Circuit(num_qubits)
+    if gate_level:
+        _append_flips(circuit, qubits, np.flatnonzero(mask))
+        return circuit
+    secret = _parity_secret(mask)
+    if secret is not None:
+        for i, q in enumerate(qubits):
+            if (secret >> (k - 1 - i)) & 1:
+                circuit.append("Z", [q])
+        return circuit
+    circuit.append(DIAGONAL, qubits, matrix=np.where(mask, -1.0, 1.0), label="Oracle")
+    return circuit
+
+
+def apply_phase_oracle(simulator, marked, qubits=None):
+    """Oracle fase dalam satu operasi vektor: amplitudo bertanda dikali -1"""
+    qubits = _register(simulator, qubits)
+    if qubits == list(range(simulator.num_qubits)) and not callable(marked):
+        # Register penuh + daftar indeks: flip langsung O(M), tanpa pass pada state
+        psi = simulator.state
+        psi[np.asarray(list(marked), dtype=np.int64)] *= -1
+        simulator.version += 1
+        return simulator
+    mask = _marked_mask(len(qubits), marked)
+    simulator.apply_diagonal(np.where(mask, -1.0, 1.0), qubits)
+    return simulator
+
+
+def gate_level_circuit(circuit):
+    """Salinan circuit dengan setiap operasi DIAGONAL ±1 diuraikan menjadi X / multi-controlled Z / X"""
+    out = Circuit(circuit.num_qubits)
+    for op in circuit:
+        if op.kind != DIAGONAL:
+            out.operations.append(op)
+            continue
+        if not np.allclose(np.abs(op.matrix.real), 1) or not np.allclose(op.matrix.imag, 0):
+            raise ValueError(f"Only ±1 diagonals have an X / multi-controlled Z decomposition, got {op.describe()}")
+        _append_flips(out, list(op.targets), np.flatnonzero(op.matrix.real < 0))
+    return out
+
+
+def diffuser_circuit(num_qubits, qubits=None, gate_level=False):
+    """Diffuser gate-level H (flip fase |0...0⟩) H; sama dengan 2|s⟩⟨s| - I sampai fase global -1"""
+    qubits = list(range(num_qubits)) if qubits is None else list(qubits)
+    circuit = Circuit(num_qubits)
+    for q in qubits:
+        circuit.append("H", [q])
+    circuit.operations += phase_oracle_circuit(num_qubits, [0], qubits, gate_level).operations
+    for q in qubits:
+        circuit.append("H", [q])
+    return circuit
+
+
+def apply_diffuser(simulator, qubits=None):
+    """Refleksi terhadap rata-rata register, in-place: ψ -> 2⟨ψ⟩ - ψ"""
+    qubits = _register(simulator, qubits)
+    psi = simulator.state
+    if qubits == list(range(simulator.num_qubits)):
+        mean = psi.mean()
+        psi *= -1
+        psi += 2 * mean
+    else:
+        tensor = psi.reshape((2,) * simulator.num_qubits)
+        mean = tensor.mean(axis=tuple(qubits), keepdims=True)
+        tensor *= -1
+        tensor += 2 * mean
+    simulator.version += 1
+    return simulator
+
+
+def grover_iterations(num_qubits, num_marked):
+    """Jumlah iterasi optimal floor(π/4 · sqrt(N/M))"""
+    return max(1, int(np.floor(np.pi / 4 * np.sqrt(2 ** num_qubits / max(num_marked, 1)))))
+
+
+def grover_circuit(num_qubits, marked, iterations=None, gate_level=False):
+    """Circuit Grover gate-level (superposisi, lalu oracle + diffuser per iterasi)"""
+    mask = _marked_mask(num_qubits, marked)
+    iterations = grover_iterations(num_qubits, int(mask.sum())) if iterations is None else iterations
+    circuit = Circuit(num_qubits)
+    for q in range(num_qubits):
+        circuit.append("H", [q])
+    oracle = phase_oracle_circuit(num_qubits, np.flatnonzero(mask), gate_level=gate_level)
+    diffuser = diffuser_circuit(num_qubits, gate_level=gate_level)
+    for _ in range(iterations):
+        circuit.operations += oracle.operations + diffuser.operations
+    return circuit
+
+
+def grover_search(num_qubits, marked, iterations=None, simulator=None):
+    """Grover cepat: oracle dan diffuser masing-masing satu operasi vektor per iterasi"""
+    indices = np.flatnonzero(_marked_mask(num_qubits, marked))
+    iterations = grover_iterations(num_qubits, len(indices)) if iterations is None else iterations
+    simulator = QuantumSimulator(num_qubits) if simulator is None else simulator
+    # H pada semua qubit dari |0...0⟩ = superposisi seragam
+    simulator.state = np.full(2 ** num_qubits, 2 ** (-num_qubits / 2))
+    for _ in range(iterations):
+        apply_phase_oracle(simulator, indices)
+        apply_diffuser(simulator)
+    return simulator
+
+
+def _balanced_marked(f):
+    """Indeks bertanda oracle dari fungsi f (callable vektor dikembalikan apa adanya, atau tabel kebenaran 0/1)"""
+    if callable(f):
+        return f
+    return np.flatnonzero(np.asarray(f, dtype=bool))
+
+
+def deutsch_jozsa_circuit(num_qubits, f, gate_level=False):
+    """Circuit Deutsch-Jozsa (oracle fase (-1)^f(x), tanpa qubit ancilla)"""
+    circuit = Circuit(num_qubits)
+    for q in range(num_qubits):
+        circuit.append("H", [q])
+    circuit.operations += phase_oracle_circuit(num_qubits, _balanced_marked(f), gate_level=gate_level).operations
+    for q in range(num_qubits):
+        circuit.append("H", [q])
+    return circuit
+
+
+def deutsch_jozsa(num_qubits, f, simulator=None):
+    """Deutsch-Jozsa cepat; kembalikan ("constant" atau "balanced", P(|0...0⟩))"""
+    simulator = QuantumSimulator(num_qubits) if simulator is None else simulator
+    for q in range(num_qubits):
+        simulator.apply_gate(HADAMARD, q)
+    apply_phase_oracle(simulator, _balanced_marked(f))
+    for q in range(num_qubits):
+        simulator.apply_gate(HADAMARD, q)
+    p_zero = float(simulator.get_probabilities()[0])
+    return ("constant" if p_zero > 0.5 else "balanced"), p_zero
+
+
+def bernstein_vazirani_circuit(num_qubits, secret):
+    """Circuit Bernstein-Vazirani: oracle (-1)^(s·x) = Z pada qubit dengan bit s = 1"""
+    circuit = Circuit(num_qubits)
+    for q in range(num_qubits):
+        circuit.append("H", [q])
+    for q in range(num_qubits):
+        if (secret >> (num_qubits - 1 - q)) & 1:
+            circuit.append("Z", [q])
+    for q in range(num_qubits):
+        circuit.append("H", [q])
+    return circuit
+
+
+def bernstein_vazirani(num_qubits, secret, simulator=None):
+    """Bernstein-Vazirani cepat (oracle paritas sebagai satu flip fase); kembalikan string rahasia"""
+    simulator = QuantumSimulator(num_qubits) if simulator is None else simulator
+    for q in range(num_qubits):
+        simulator.apply_gate(HADAMARD, q)
+    apply_phase_oracle(simulator, lambda values: _parity(values & secret))
+    for q in range(num_qubits):
+        simulator.apply_gate(HADAMARD, q)
+    return int(np.argmax(simulator.get_probabilities()))
+
+
+def verify(circuit, fast_simulator):
+    """Fidelity |⟨ψ_gate|ψ_fast⟩|^2 antara circuit gate-level dan hasil jalur cepat
+
+    Operasi DIAGONAL diuraikan dulu (gate_level_circuit), jadi referensinya selalu gate per gate.
+    """
+    reference = execute(gate_level_circuit(circuit), QuantumSimulator(circuit.num_qubits))
+    return float(abs(np.vdot(reference.state, fast_simulator.state)) ** 2)
@@ -0,0 +1,266 @@
+# batched.py
+# Batched state-vector engine: a (batch, 2^n) array of independent states
+# (input sweeps, parameter sweeps) updated by one vectorized pass per gate.
+# Same qubit convention as simulator.py (qubit 0 = most significant bit).
+
+import numpy as np # type: ignore
+
+from simulator import (
+    DEFAULT_MEMORY_BUDGET, MemoryBudgetError, PRECISIONS, MAX_QUBITS, estimate_memory,
+    _as_controls, _check_controls, _is_diagonal, _is_antidiagonal
+)
+from circuit import GATE_MATRICES, NON_UNITARY, Operation, apply_operation
+from sampler import as_generator
+
+
+# Ukuran blok baris untuk run(): satu blok state (~1 MiB) tetap di cache
+# selama seluruh circuit dijalankan padanya
+BLOCK_BYTES = 2 ** 20
+
+
+def estimate_batch_memory(num_qubits, batch_size, dtype=complex):
+    """Perkiraan memori (byte) untuk batch_size state vector plus buffer kerja"""
+    single = estimate_memory(num_qubits, dtype)
+    return {key: value * batch_size for key, value in single.items()}
+
+
+def check_batch_memory(num_qubits, batch_size, dtype=complex, memory_budget=None):
+    """Cek batch muat dalam anggaran; MemoryBudgetError menyarankan batch_size yang muat"""
+    budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+    if num_qubits > MAX_QUBITS:
+        raise MemoryBudgetError(f"{num_qubits} qubits exceeds the maximum of {MAX_QUBITS}",
+                                {"num_qubits": MAX_QUBITS})
+    estimate = estimate_batch_memory(num_qubits, batch_size, dtype)
+    if estimate["total"] <= budget:
+        return estimate
+    fit = int(budget // estimate_memory(num_qubits, dtype)["total"])
+    raise MemoryBudgetError(f"A batch of {batch_size} {num_qubits}-qubit states needs about "
+                            f"{estimate['total'] / 2 ** 30:.2f} GiB, budget is {budget / 2 ** 30:.2f} GiB; "
+                            f"at most {fit} states fit", {"batch_size": fit})
+
+
+class BatchedSimulator:
+    """Simulator untuk banyak state sekaligus; state berbentuk (batch, 2^n)"""
+    backend_name = "batched"
+
+    def __init__(self, num_qubits, batch_size, precision="complex128", memory_budget=None):
+        if str(np.dtype(precision)) not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+        self.dtype = np.dtype(precision)
+        check_batch_memory(num_qubits, batch_size, self.dtype, memory_budget)
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.batch_size = batch_size
+        self.state = np.zeros((batch_size, self.dim), dtype=self.dtype)
+        self.state[:, 0] = 1.0
+        self.gate_history = []
+        self._buffer = None
+
+    @classmethod
+    def from_basis_states(cls, num_qubits, indices, **kwargs):
+        """Batch dengan anggota ke-i = |indices[i]⟩ (sweep input klasik)"""
+        indices = np.asarray(indices, dtype=np.int64)
+        sim = cls(num_qubits, len(indices), **kwargs)
+        sim.state[:, 0] = 0.0
+        sim.state[np.arange(len(indices)), indices] = 1.0
+        return sim
+
+    @classmethod
+    def from_states(cls, states, **kwargs):
+        """Batch dari array state (batch, 2^n) yang sudah ada"""
+        states = np.asarray(states)
+        num_qubits = int(states.shape[1]).bit_length() - 1
+        sim = cls(num_qubits, len(states), **kwargs)
+        sim.state[:] = states
+        return sim
+
+    def _rows(self, start, stop):
+        """Simulator yang berbagi baris start:stop dari state ini (view, tanpa salinan)"""
+        sub = object.__new__(BatchedSimulator)
+        sub.dtype = self.dtype
+        sub.num_qubits = self.num_qubits
+        sub.dim = self.dim
+        sub.state = self.state[start:stop]
+        sub.batch_size = len(sub.state)
+        sub.gate_history = []
+        sub._buffer = self._buffer
+        return sub
+
+    def run(self, circuit, block_size=None):
+        """Jalankan circuit blok demi blok baris, agar tiap blok tetap di cache untuk semua gate"""
+        for op in circuit:
+            if op.kind in NON_UNITARY or op.condition is not None:
+                raise ValueError(f"Batched runs need unitary, unconditioned circuits, got {op.describe()}")
+        if block_size is None:
+            block_size = max(1, BLOCK_BYTES // (self.dim * self.dtype.itemsize))
+        if self._buffer is None:
+            self._buffer = np.empty(self.state.size, dtype=self.dtype)
+        for start in range(0, self.batch_size, block_size):
+            stop = min(start + block_size, self.batch_size)
+            block = self._rows(start, stop)
+            for op in circuit:
+                if op.matrix.ndim == 3:
+                    op = Operation(op.kind, op.targets, op.controls, op.params, op.matrix[start:stop], op.label)
+                apply_operation(block, op)
+        return self
+
+    def reset(self):
+        """Reset semua anggota batch ke |0...0⟩"""
+        self.state[:] = 0
+        self.state[:, 0] = 1.0
+        self.gate_history = []
+
+    def _gate(self, gate_matrix):
+        """Matrix gate (nama di GATE_MATRICES, matrix bersama, atau satu matrix per anggota batch)"""
+        if isinstance(gate_matrix, str):
+            gate_matrix = GATE_MATRICES[gate_matrix]
+        gate = np.asarray(gate_matrix, dtype=self.dtype)
+        if gate.ndim == 3 and len(gate) != self.batch_size:
+            raise ValueError(f"Got {len(gate)} gate matrices for a batch of {self.batch_size}")
+        return gate
+
+    def _scratch(self, shape):
+        """Dua buffer kerja berbentuk `shape` dari satu buffer seukuran state (dipakai ulang antar gate)"""
+        if self._buffer is None:
+            self._buffer = np.empty(self.state.size, dtype=self.dtype)
+        size = int(np.prod(shape))
+        return self._buffer[:size].reshape(shape), self._buffer[size:2 * size].reshape(shape)
+
+    def _view(self, fixed):
+        """View (batch, 2, ..., 2) dengan qubit di `fixed` dikunci pada bit tertentu (strided, tanpa salinan)"""
+        index = (slice(None),) + tuple(slice(fixed[q], fixed[q] + 1) if q in fixed else slice(None)
+                                       for q in range(self.num_qubits))
+        return self.state.reshape((self.batch_size,) + (2,) * self.num_qubits)[index]
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Gate 2x2 (atau (batch, 2, 2) untuk sweep parameter) ke semua anggota batch dalam satu pass"""
+        controls = _as_controls(control_qubit)
+        _check_controls(target_qubit, controls)
+        gate = self._gate(gate_matrix)
+        if controls:
+            view = self._view({c: 1 for c in controls})
+            index0 = [slice(None)] * view.ndim
+            index1 = [slice(None)] * view.ndim
+            index0[target_qubit + 1] = 0
+            index1[target_qubit + 1] = 1
+            a0 = view[tuple(index0)]
+            a1 = view[tuple(index1)]
+        else:
+            # Tanpa control: sumbu batch dan qubit sebelum target digabung jadi satu sumbu
+            view = self.state.reshape(self.batch_size, 2 ** target_qubit, 2, -1)
+            a0 = view[:, :, 0, :]
+            a1 = view[:, :, 1, :]
+        if gate.ndim == 3:
+            # Satu matrix per anggota: broadcast elemen gate sepanjang sumbu batch
+            g = gate.reshape((self.batch_size, 2, 2) + (1,) * (a0.ndim - 1))
+            g00, g01, g10, g11 = g[:, 0, 0], g[:, 0, 1], g[:, 1, 0], g[:, 1, 1]
+        else:
+            g00, g01, g10, g11 = gate[0, 0], gate[0, 1], gate[1, 0], gate[1, 1]
+            if _is_diagonal(gate):
+                # Z, S, T, CZ, controlled-phase: hanya skala, tanpa salinan
+                if abs(g00 - 1) > 1e-12:
+                    a0 *= g00
+                a1 *= g11
+                return
+        tmp0, tmp1 = self._scratch(a0.shape)
+        np.copyto(tmp0, a0)
+        if gate.ndim == 2 and _is_antidiagonal(gate):
+            # X, Y, CNOT, Toffoli: tukar dua irisan (plus fase)
+            np.multiply(a1, g01, out=a0)
+            np.multiply(tmp0, g10, out=a1)
+            return
+        np.multiply(a1, g01, out=tmp1)
+        a0 *= g00
+        a0 += tmp1
+        a1 *= g11
+        np.multiply(tmp0, g10, out=tmp0)
+        a1 += tmp0
+
+    def apply_matrix(self, matrix, qubits):
+        """Gate k-qubit (2^k x 2^k bersama, atau (batch, 2^k, 2^k)) pada sumbu qubit target"""
+        qubits = list(qubits)
+        k = len(qubits)
+        if k == 1:
+            self.apply_gate(matrix, qubits[0])
+            return
+        gate = self._gate(matrix)
+        axes = [q + 1 for q in qubits]
+        psi = self.state.reshape((self.batch_size,) + (2,) * self.num_qubits)
+        moved = np.moveaxis(psi, axes, list(range(-k, 0)))
+        shape = moved.shape
+        flat = moved.reshape(self.batch_size, -1, 2 ** k)
+        out = flat @ np.swapaxes(gate, -1, -2)
+        self.state[:] = np.moveaxis(out.reshape(shape), list(range(-k, 0)), axes).reshape(self.batch_size, self.dim)
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP dua qubit untuk semua anggota (transpose sumbu, satu salinan)"""
+        if qubit_a == qubit_b:
+            return
+        psi = self.state.reshape((self.batch_size,) + (2,) * self.num_qubits)
+        self.state[:] = np.swapaxes(psi, qubit_a + 1, qubit_b + 1).reshape(self.batch_size, self.dim)
+
+    def norm_drift(self):
+        """Drift norm |‖ψ_b‖ - 1| per anggota batch"""
+        return np.abs(np.linalg.norm(self.state, axis=1) - 1.0)
+
+    def memory_footprint(self):
+        """Pemakaian memori saat ini (byte)"""
+        buffer = self._buffer.nbytes if self._buffer is not None else 0
+        return {"state": self.state.nbytes, "buffer": buffer, "total": self.state.nbytes + buffer}
+
+    def get_probabilities(self):
+        """Probabilitas basis state per anggota batch, bentuk (batch, 2^n)"""
+        probs = np.abs(self.state) ** 2
+        probs /= probs.sum(axis=1, keepdims=True)
+        return probs
+
+    def get_amplitudes(self):
+        """Amplitudo kompleks, bentuk (batch, 2^n)"""
+        return self.state
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal 2^k register terpilih per anggota batch, bentuk (batch, 2^k)"""
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        n = self.num_qubits
+        axes = list(range(n + 2))
+        parts = self.state.view(np.finfo(self.dtype).dtype).reshape((self.batch_size,) + (2,) * n + (2,))
+        kept = [0] + [q + 1 for q in qubits]
+        marginal = np.einsum(parts, axes, parts, axes, kept, dtype=float).reshape(self.batch_size, -1)
+        return marginal / marginal.sum(axis=1, keepdims=True)
+
+    def _distribution(self, qubits):
+        """Probabilitas float64 per baris: semua qubit atau register terpilih"""
+        if qubits is None:
+            probs = self.get_probabilities().astype(float)
+            return probs / probs.sum(axis=1, keepdims=True)
+        return self.marginal_probabilities(qubits)
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Hasil pengukuran per anggota batch, bentuk (batch, shots)"""
+        rng = as_generator(rng)
+        cdf = np.cumsum(self._distribution(qubits), axis=1)
+        cdf /= cdf[:, -1:]
+        dim = cdf.shape[1]
+        # Satu searchsorted untuk seluruh batch: baris ke-b digeser sebesar b
+        offsets = np.arange(self.batch_size)[:, None]
+        draws = rng.random((self.batch_size, shots)) + offsets
+        flat = np.searchsorted((cdf + offsets).ravel(), draws.ravel(), side="right")
+        outcomes = flat.reshape(self.batch_size, shots) - offsets * dim
+        return np.minimum(outcomes, dim - 1)
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """Counts per anggota batch, bentuk (batch, 2^n) atau (batch, 2^k), satu draw multinomial per baris"""
+        return as_generator(rng).multinomial(shots, self._distribution(qubits))
+
+
+def sweep(circuit, values, precision="complex128", memory_budget=None, block_size=None):
+    """Bind array nilai parameter (dict nama -> skalar atau array panjang batch) dan jalankan sekali secara batched"""
+    sizes = {np.size(v) for v in values.values() if np.ndim(v) > 0}
+    if len(sizes) > 1:
+        raise ValueError(f"Sweep arrays must have the same length, got {sorted(sizes)}")
+    batch_size = sizes.pop() if sizes else 1
+    bound = circuit.bind({name: np.ravel(v) if np.ndim(v) > 0 else v for name, v in values.items()})
+    sim = BatchedSimulator(circuit.num_qubits, batch_size, precision, memory_budget)
+    return sim.run(bound, block_size)
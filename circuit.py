@@ -0,0 +1,453 @@
+# circuit.py
+# Circuit intermediate representation and gate-fusion compiler
+# A Circuit is an ordered list of Operation; compile_circuit() rewrites it
+# into an equivalent circuit with fewer passes over the state vector.
+
+import numpy as np # type: ignore
+
+from simulator import (
+    QuantumSimulator, PAULI_X, PAULI_Y, PAULI_Z, HADAMARD, S_GATE, T_GATE, IDENTITY, SWAP,
+    rx_gate, ry_gate, rz_gate, u3_gate, phase_gate, _is_diagonal, _is_antidiagonal
+)
+from sampler import as_generator
+
+
+# Matrix untuk setiap jenis gate (untuk gate controlled: matrix 2x2 pada target,
+# untuk gate multi-target: matrix 2^k x 2^k pada target)
+GATE_MATRICES = {
+    "I": IDENTITY,
+    "H": HADAMARD,
+    "X": PAULI_X,
+    "Y": PAULI_Y,
+    "Z": PAULI_Z,
+    "S": S_GATE,
+    "SDG": S_GATE.conj().T,
+    "T": T_GATE,
+    "TDG": T_GATE.conj().T,
+    "CNOT": PAULI_X,
+    "CY": PAULI_Y,
+    "CZ": PAULI_Z,
+    "CCX": PAULI_X,
+    "SWAP": SWAP,
+}
+
+
+# Gate berparameter: jenis -> (fungsi matrix tervektorisasi, jumlah parameter).
+# Dengan control (mis. kind "RY" + controls) menjadi controlled rotation.
+PARAMETRIC_GATES = {
+    "RX": (rx_gate, 1),
+    "RY": (ry_gate, 1),
+    "RZ": (rz_gate, 1),
+    "P": (phase_gate, 1),
+    "U3": (u3_gate, 3),
+}
+
+
+# Operasi non-unitary di tengah circuit: MEASURE (params = (clbit,)) dan RESET
+NON_UNITARY = ("MEASURE", "RESET")
+
+# Operasi diagonal k-qubit (mis. oracle fase): matrix disimpan sebagai vektor 2^k
+DIAGONAL = "DIAGONAL"
+
+
+class Parameter:
+    """Sudut simbolik dalam circuit; nilainya diberikan lewat Circuit.bind()"""
+    def __init__(self, name):
+        self.name = name
+
+    def __eq__(self, other):
+        return isinstance(other, Parameter) and other.name == self.name
+
+    def __hash__(self):
+        return hash(("Parameter", self.name))
+
+    def __repr__(self):
+        return f"Parameter({self.name!r})"
+
+    def __str__(self):
+        return self.name
+
+
+class Operation:
+    """Satu gate dalam circuit: jenis, qubit target, qubit control, parameter"""
+    def __init__(self, kind, targets, controls=(), params=(), matrix=None, label=None, condition=None):
+        self.kind = kind
+        self.targets = tuple(int(q) for q in targets)
+        self.controls = tuple(int(q) for q in controls)
+        self.params = tuple(params)
+        # Kondisi klasik (clbit, nilai): operasi hanya dijalankan jika bit klasik = nilai
+        self.condition = None if condition is None else (int(condition[0]), int(condition[1]))
+        if kind in NON_UNITARY:
+            if len(self.targets) != 1 or self.controls:
+                raise ValueError(f"{kind} acts on exactly one qubit without controls")
+            if kind == "MEASURE" and len(self.params) != 1:
+                raise ValueError("MEASURE takes the classical bit index as its only parameter")
+        elif kind == DIAGONAL:
+            if matrix is None or self.controls or np.shape(matrix) != (2 ** len(self.targets),):
+                raise ValueError(f"{kind} takes a vector of 2^k phases on its k targets, without controls")
+        elif matrix is None and kind in PARAMETRIC_GATES:
+            function, num_params = PARAMETRIC_GATES[kind]
+            if len(self.params) != num_params:
+                raise ValueError(f"Gate {kind} takes {num_params} parameter(s), got {len(self.params)}")
+            # Parameter simbolik: matrix baru dibuat saat bind()
+            if not self.is_parameterized:
+                matrix = function(*self.params)
+        elif matrix is None:
+            if kind not in GATE_MATRICES:
+                raise ValueError(f"Unknown gate kind '{kind}', pass an explicit matrix")
+            matrix = GATE_MATRICES[kind]
+        self.matrix = None if matrix is None else np.asarray(matrix, dtype=complex)
+        self.label = label
+
+    @property
+    def is_barrier(self):
+        """True jika operasi tidak boleh digabung/dibatalkan oleh compile (measure, reset, kondisi, parameter)"""
+        return self.matrix is None or self.condition is not None
+
+    @property
+    def is_parameterized(self):
+        """True jika masih ada Parameter simbolik yang belum di-bind"""
+        return any(isinstance(p, Parameter) for p in self.params)
+
+    def bind(self, values):
+        """Salinan dengan Parameter diganti nilai (skalar, atau array -> matrix (batch, 2, 2))"""
+        if not self.is_parameterized:
+            return self
+        params = [values[p.name] if isinstance(p, Parameter) else p for p in self.params]
+        return Operation(self.kind, self.targets, self.controls, params, label=self.label, condition=self.condition)
+
+    @property
+    def qubits(self):
+        """Semua qubit yang disentuh operasi (control lalu target)"""
+        return self.controls + self.targets
+
+    def remap(self, mapping):
+        """Salinan operasi dengan indeks qubit dipetakan ulang"""
+        return Operation(self.kind, [mapping[q] for q in self.targets],
+                         [mapping[q] for q in self.controls], self.params,
+                         None if self.is_parameterized else self.matrix, self.label, self.condition)
+
+    def describe(self):
+        """Teks singkat untuk riwayat circuit"""
+        name = self.label or self.kind
+        targets = ", ".join(f"Q{q}" for q in self.targets)
+        suffix = f" if c{self.condition[0]} = {self.condition[1]}" if self.condition else ""
+        if self.kind == "MEASURE":
+            return f"{name}: {targets} → c{self.params[0]}{suffix}"
+        if self.params and self.label is None:
+            name += "(" + ", ".join(_format_param(p) for p in self.params) + ")"
+        if self.controls:
+            controls = ", ".join(f"Q{q}" for q in self.controls)
+            return f"{name}: {controls} → {targets}{suffix}"
+        return f"{name} → {targets}{suffix}"
+
+    def __repr__(self):
+        return f"Operation({self.kind!r}, targets={self.targets}, controls={self.controls})"
+
+
+def _format_param(value):
+    """Teks parameter: nama simbolik, angka, atau jumlah nilai sweep"""
+    if isinstance(value, Parameter):
+        return value.name
+    if np.ndim(value) > 0:
+        return f"[{np.size(value)} values]"
+    return f"{float(value):.3g}"
+
+
+class Circuit:
+    """Intermediate representation circuit: daftar Operation terurut"""
+    def __init__(self, num_qubits, operations=None):
+        self.num_qubits = num_qubits
+        self.operations = list(operations or [])
+
+    def append(self, kind, targets, controls=(), params=(), matrix=None, label=None, condition=None):
+        """Tambahkan operasi ke akhir circuit dan kembalikan Operation-nya"""
+        op = Operation(kind, targets, controls, params, matrix, label, condition)
+        for q in op.qubits:
+            if not 0 <= q < self.num_qubits:
+                raise ValueError(f"Qubit {q} out of range for {self.num_qubits}-qubit circuit")
+        self.operations.append(op)
+        return op
+
+    def copy(self):
+        """Salinan dangkal (Operation dipakai bersama)"""
+        return Circuit(self.num_qubits, self.operations)
+
+    @property
+    def num_clbits(self):
+        """Jumlah bit klasik (indeks tertinggi yang ditulis MEASURE atau dibaca kondisi, plus satu)"""
+        bits = [op.params[0] for op in self.operations if op.kind == "MEASURE"]
+        bits += [op.condition[0] for op in self.operations if op.condition]
+        return max(bits) + 1 if bits else 0
+
+    @property
+    def parameters(self):
+        """Nama Parameter simbolik dalam urutan kemunculan pertama"""
+        names = []
+        for op in self.operations:
+            for p in op.params:
+                if isinstance(p, Parameter) and p.name not in names:
+                    names.append(p.name)
+        return names
+
+    def bind(self, values):
+        """Circuit baru dengan semua Parameter diberi nilai (dict nama -> skalar atau array sweep)"""
+        missing = [name for name in self.parameters if name not in values]
+        if missing:
+            raise ValueError(f"Missing values for parameters {missing}")
+        return Circuit(self.num_qubits, [op.bind(values) for op in self.operations])
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __iter__(self):
+        return iter(self.operations)
+
+
+def apply_operation(simulator, op, clbits=None, rng=None):
+    """Jalankan satu Operation pada simulator (QuantumSimulator atau yang kompatibel)
+
+    clbits: dict bit klasik -> nilai, dibaca oleh kondisi dan ditulis oleh MEASURE.
+    """
+    if op.condition is not None:
+        clbit, value = op.condition
+        if (clbits or {}).get(clbit, 0) != value:
+            return
+    if op.kind == "MEASURE":
+        outcome = simulator.measure_qubit(op.targets[0], rng=rng)
+        if clbits is not None:
+            clbits[op.params[0]] = outcome
+        return
+    if op.kind == "RESET":
+        simulator.reset_qubit(op.targets[0], rng=rng)
+        return
+    if op.is_parameterized:
+        raise ValueError(f"Operation {op.describe()} has unbound parameters, call Circuit.bind() first")
+    if op.kind == DIAGONAL:
+        # Satu pass elementwise jika simulator punya apply_diagonal, selain itu matrix penuh
+        if hasattr(simulator, "apply_diagonal"):
+            simulator.apply_diagonal(op.matrix, op.targets)
+        else:
+            simulator.apply_matrix(np.diag(op.matrix), op.targets)
+    elif len(op.targets) == 1:
+        simulator.apply_gate(op.matrix, op.targets[0], list(op.controls) or None)
+    elif op.controls:
+        raise ValueError("Controlled multi-target operations are not supported")
+    else:
+        simulator.apply_matrix(op.matrix, op.targets)
+    if getattr(simulator, "noise_model", None) is not None:
+        # Channel noise (DensityMatrixSimulator) setelah setiap gate
+        simulator.apply_noise(op)
+
+
+def execute(circuit, simulator, rng=None, clbits=None):
+    """Jalankan seluruh circuit pada simulator (satu shot jika ada measure/reset di tengah)"""
+    rng = as_generator(rng)
+    for op in circuit:
+        apply_operation(simulator, op, clbits, rng)
+    return simulator
+
+
+def _readout_counts(simulator, qubit, outcome, shots, rng):
+    """[(bit tercatat, jumlah shot)] untuk hasil proyeksi outcome, dengan readout error noise_model jika ada"""
+    noise_model = getattr(simulator, "noise_model", None)
+    if noise_model is None:
+        return [(outcome, shots)]
+    ones = rng.binomial(shots, noise_model.confusion_matrix(qubit)[1, outcome])
+    return [(bit, m) for bit, m in ((0, shots - ones), (1, ones)) if m > 0]
+
+
+def sample_circuit(circuit, shots=1000, simulator=None, rng=None):
+    """Counts bit klasik untuk banyak shot dengan measure/reset di tengah circuit
+
+    Prefix bersama dijalankan sekali; di setiap MEASURE/RESET shot dibagi per hasil
+    (binomial) dan hanya cabang dengan shot > 0 yang dilanjutkan, jadi satu state
+    per cabang alih-alih satu simulasi penuh per shot. Kunci hasil: string bit c0 c1 ...
+    """
+    rng = as_generator(rng)
+    if simulator is None:
+        simulator = QuantumSimulator(circuit.num_qubits)
+    ops = circuit.operations
+    width = circuit.num_clbits
+    counts = {}
+    # Tumpukan cabang (simulator, indeks operasi berikutnya, jumlah shot, bit klasik)
+    stack = [(simulator, 0, shots, {})]
+    while stack:
+        sim, start, branch_shots, clbits = stack.pop()
+        for i in range(start, len(ops)):
+            op = ops[i]
+            if op.kind not in NON_UNITARY:
+                apply_operation(sim, op, clbits)
+                continue
+            if op.condition is not None and clbits.get(op.condition[0], 0) != op.condition[1]:
+                continue
+            qubit = op.targets[0]
+            p1 = sim.marginal_probabilities([qubit])[1]
+            ones = rng.binomial(branch_shots, min(max(p1, 0.0), 1.0))
+            branches = [(outcome, n) for outcome, n in ((0, branch_shots - ones), (1, ones)) if n > 0]
+            for j, (outcome, n) in enumerate(branches):
+                # Cabang terakhir memakai ulang state ini, cabang lain mendapat salinan
+                branch = sim if j == len(branches) - 1 else sim.copy()
+                if op.kind == "RESET":
+                    branch.reset_qubit(qubit, outcome)
+                    stack.append((branch, i + 1, n, dict(clbits)))
+                    continue
+                branch.measure_qubit(qubit, outcome)
+                # Bit klasik per shot dari readout error (satu state proyeksi, bisa dua nilai bit)
+                reported = _readout_counts(branch, qubit, outcome, n, rng)
+                for k, (bit, m) in enumerate(reported):
+                    state = branch if k == len(reported) - 1 else branch.copy()
+                    stack.append((state, i + 1, m, {**clbits, op.params[0]: bit}))
+            break
+        else:
+            key = "".join(str(clbits.get(c, 0)) for c in range(width))
+            counts[key] = counts.get(key, 0) + branch_shots
+    return dict(sorted(counts.items()))
+
+
+def local_matrix(op, qubits):
+    """Matrix operasi pada sub-register qubits (qubits[0] = bit paling signifikan)"""
+    k = len(qubits)
+    mapping = {q: i for i, q in enumerate(qubits)}
+    local_op = op.remap(mapping)
+    sim = QuantumSimulator(k)
+    full = np.zeros((2 ** k, 2 ** k), dtype=complex)
+    for col in range(2 ** k):
+        sim.state = np.zeros(2 ** k, dtype=complex)
+        sim.state[col] = 1.0
+        apply_operation(sim, local_op)
+        full[:, col] = sim.state
+    return full
+
+
+def _is_inverse_pair(first, second):
+    """True jika second membatalkan first (qubit sama, matrix second·first = I)"""
+    if first.is_barrier or second.is_barrier:
+        return False
+    if first.targets != second.targets or set(first.controls) != set(second.controls):
+        return False
+    if first.matrix.shape != second.matrix.shape:
+        return False
+    if first.kind == DIAGONAL or second.kind == DIAGONAL:
+        return first.kind == second.kind and np.allclose(second.matrix * first.matrix, 1)
+    return np.allclose(second.matrix @ first.matrix, np.eye(len(first.matrix)))
+
+
+def _cancel_inverses(ops):
+    """Hapus pasangan gate bersebelahan yang saling invers (H·H, X·X, CNOT·CNOT, ...)"""
+    out = []
+    for op in ops:
+        touched = set(op.qubits)
+        for i in range(len(out) - 1, -1, -1):
+            if touched & set(out[i].qubits):
+                if _is_inverse_pair(out[i], op):
+                    del out[i]
+                    break
+                out.append(op)
+                break
+        else:
+            out.append(op)
+    return out
+
+
+def _fuse_single_qubit(ops):
+    """Gabungkan rangkaian gate single-qubit pada qubit yang sama menjadi satu matrix 2x2"""
+    out = []
+    pending = {}
+
+    def flush(q):
+        run = pending.pop(q, None)
+        if run is None:
+            return
+        if len(run) == 1:
+            out.append(run[0])
+            return
+        matrix = IDENTITY
+        for op in run:
+            matrix = op.matrix @ matrix
+        if matrix.ndim == 3 or not np.allclose(matrix, IDENTITY):
+            out.append(Operation("U", [q], matrix=matrix,
+                                 label="·".join(op.label or op.kind for op in reversed(run))))
+
+    for op in ops:
+        if len(op.targets) == 1 and not op.controls and not op.is_barrier and op.kind != DIAGONAL:
+            pending.setdefault(op.targets[0], []).append(op)
+            continue
+        for q in op.qubits:
+            flush(q)
+        out.append(op)
+    for q in sorted(pending):
+        flush(q)
+    return out
+
+
+def _is_diagonal_or_permutation(op):
+    """True jika op diagonal atau permutasi (plus fase): simulator menundanya tanpa pass pada state"""
+    if op.kind == DIAGONAL:
+        return True
+    if len(op.targets) == 1:
+        return _is_diagonal(op.matrix) or _is_antidiagonal(op.matrix)
+    return op.matrix.shape == (4, 4) and np.allclose(op.matrix, SWAP)
+
+
+def _merge_two_qubit(ops):
+    """Gabungkan blok gate yang hanya menyentuh pasangan qubit yang sama menjadi satu 4x4
+
+    Blok yang semuanya diagonal/permutasi (CNOT, CZ, CP, SWAP, ...) dibiarkan: U4 padat
+    akan menggantikan jalur fase dan permutasi tertunda dengan satu pass penuh.
+    """
+    out = []
+    blocks = {}
+
+    def close(block):
+        for q in block["qubits"]:
+            blocks.pop(q, None)
+        if len(block["ops"]) == 1 or all(_is_diagonal_or_permutation(op) for op in block["ops"]):
+            out.extend(block["ops"])
+            return
+        matrix = np.eye(4, dtype=complex)
+        for op in block["ops"]:
+            matrix = local_matrix(op, block["qubits"]) @ matrix
+        out.append(Operation("U4", block["qubits"], matrix=matrix,
+                             label="·".join(op.label or op.kind for op in reversed(block["ops"]))))
+
+    for op in ops:
+        support = op.qubits
+        if op.is_barrier or op.matrix.ndim == 3:
+            # Measure/reset, kondisi, parameter simbolik / sweep: tidak digabung, jadi pembatas blok
+            for block in {id(blocks[q]): blocks[q] for q in support if q in blocks}.values():
+                close(block)
+            out.append(op)
+            continue
+        open_blocks = {id(blocks[q]): blocks[q] for q in support if q in blocks}
+        if len(open_blocks) == 1 and set(support) <= set(next(iter(open_blocks.values()))["qubits"]):
+            next(iter(open_blocks.values()))["ops"].append(op)
+            continue
+        for block in open_blocks.values():
+            close(block)
+        if len(support) == 2:
+            block = {"qubits": tuple(sorted(support)), "ops": [op]}
+            for q in support:
+                blocks[q] = block
+        else:
+            out.append(op)
+    for block in {id(b): b for b in blocks.values()}.values():
+        close(block)
+    return out
+
+
+def compile_circuit(circuit, cancel_inverses=True, fuse_single=True, merge_two_qubit=True):
+    """Optimasi circuit; kembalikan (circuit hasil compile, laporan jumlah gate)"""
+    ops = list(circuit.operations)
+    report = {"gates_before": len(ops)}
+    if cancel_inverses:
+        ops = _cancel_inverses(ops)
+        report["after_cancel"] = len(ops)
+    if fuse_single:
+        ops = _fuse_single_qubit(ops)
+        report["after_fuse"] = len(ops)
+    if merge_two_qubit:
+        ops = _merge_two_qubit(ops)
+        report["after_merge"] = len(ops)
+    report["gates_after"] = len(ops)
+    return Circuit(circuit.num_qubits, ops), report
@@ -0,0 +1,263 @@
+# density.py
+# Density-matrix engine with Kraus noise channels
+# ρ is stored as a (2^n, 2^n) array; viewed as a (2,)*2n tensor, axis q is the
+# row index of qubit q and axis n+q its column index (same qubit order as
+# simulator.py). Gates and channels are applied as local superoperators
+# Σ K ⊗ K* on those 2k axes, never as 4^n x 4^n matrices.
+
+import numpy as np # type: ignore
+
+from simulator import DEFAULT_MEMORY_BUDGET, MemoryBudgetError, SWAP, _as_controls, _check_controls
+from sampler import Sampler, as_generator
+
+
+# Batas qubit density matrix (ρ 4^n elemen; 14 qubit = 4 GiB complex128)
+MAX_DENSITY_QUBITS = 14
+
+
+def depolarizing(p):
+    """Kraus channel depolarizing satu qubit: ρ -> (1-p)ρ + p·I/2"""
+    if not 0 <= p <= 1:
+        raise ValueError(f"Depolarizing probability must be in [0, 1], got {p}")
+    paulis = [np.eye(2), np.array([[0, 1], [1, 0]]), np.array([[0, -1j], [1j, 0]]), np.diag([1, -1])]
+    weights = [1 - 3 * p / 4] + [p / 4] * 3
+    return [np.sqrt(w) * np.asarray(m, dtype=complex) for w, m in zip(weights, paulis)]
+
+
+def amplitude_damping(gamma):
+    """Kraus channel amplitude damping (relaksasi |1⟩ -> |0⟩ dengan probabilitas gamma)"""
+    if not 0 <= gamma <= 1:
+        raise ValueError(f"Damping probability must be in [0, 1], got {gamma}")
+    return [np.array([[1, 0], [0, np.sqrt(1 - gamma)]], dtype=complex),
+            np.array([[0, np.sqrt(gamma)], [0, 0]], dtype=complex)]
+
+
+def phase_damping(lam):
+    """Kraus channel phase damping (koherensi off-diagonal dikali sqrt(1 - lam))"""
+    if not 0 <= lam <= 1:
+        raise ValueError(f"Damping probability must be in [0, 1], got {lam}")
+    return [np.array([[1, 0], [0, np.sqrt(1 - lam)]], dtype=complex),
+            np.array([[0, 0], [0, np.sqrt(lam)]], dtype=complex)]
+
+
+def superoperator(kraus_ops):
+    """Superoperator Σ K ⊗ K* (indeks baris-lalu-kolom) dari daftar Kraus"""
+    return sum(np.kron(k, k.conj()) for k in (np.asarray(k, dtype=complex) for k in kraus_ops))
+
+
+class NoiseModel:
+    """Noise per jenis gate, per qubit, dan readout error; dipakai saat circuit dijalankan"""
+    def __init__(self):
+        # Daftar (kraus, kinds atau None, qubits atau None)
+        self.gate_errors = []
+        self.qubit_errors = []
+        # qubit (atau None = semua) -> (p01, p10)
+        self.readout_errors = {}
+
+    def add_gate_error(self, kraus_ops, kinds, qubits=None):
+        """Channel satu qubit setelah gate jenis `kinds`, pada setiap qubit yang disentuh gate"""
+        self.gate_errors.append((list(kraus_ops), set(kinds), None if qubits is None else set(qubits)))
+        return self
+
+    def add_qubit_error(self, kraus_ops, qubits):
+        """Channel satu qubit setelah setiap gate yang menyentuh qubit ini"""
+        self.qubit_errors.append((list(kraus_ops), None, set(qubits)))
+        return self
+
+    def add_readout_error(self, p01, p10, qubits=None):
+        """Readout error: baca 1 saat 0 dengan probabilitas p01, baca 0 saat 1 dengan p10"""
+        for qubit in (qubits if qubits is not None else [None]):
+            self.readout_errors[qubit] = (float(p01), float(p10))
+        return self
+
+    def channels_for(self, op):
+        """Pasangan (kraus, qubit) yang diterapkan setelah Operation ini"""
+        channels = []
+        for kraus_ops, kinds, qubits in self.gate_errors + self.qubit_errors:
+            if kinds is not None and op.kind not in kinds:
+                continue
+            for qubit in op.qubits:
+                if qubits is None or qubit in qubits:
+                    channels.append((kraus_ops, qubit))
+        return channels
+
+    def confusion_matrix(self, qubit):
+        """Matrix 2x2 P(baca | sebenarnya) untuk qubit ini (identitas jika tanpa readout error)"""
+        p01, p10 = self.readout_errors.get(qubit, self.readout_errors.get(None, (0.0, 0.0)))
+        return np.array([[1 - p01, p10], [p01, 1 - p10]])
+
+
+class DensityMatrixSimulator:
+    """Simulator density matrix (state campuran, noise Kraus); antarmuka sama dengan QuantumSimulator"""
+    backend_name = "density_matrix"
+
+    def __init__(self, num_qubits, noise_model=None, memory_budget=None):
+        budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+        needed = 2 * 16 * 4 ** num_qubits
+        if num_qubits > MAX_DENSITY_QUBITS or needed > budget:
+            fit = min(MAX_DENSITY_QUBITS, int(np.log2(max(budget // 32, 1)) // 2))
+            raise MemoryBudgetError(f"A {num_qubits}-qubit density matrix needs about {needed / 2 ** 30:.2f} GiB; "
+                                    f"at most {fit} qubits fit", {"num_qubits": fit})
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.noise_model = noise_model
+        self.reset()
+
+    def reset(self):
+        """Reset ρ ke |0...0⟩⟨0...0|"""
+        self.rho = np.zeros((self.dim, self.dim), dtype=complex)
+        self.rho[0, 0] = 1.0
+        self.gate_history = []
+
+    def copy(self):
+        """Salinan independen"""
+        other = DensityMatrixSimulator.__new__(DensityMatrixSimulator)
+        other.num_qubits = self.num_qubits
+        other.dim = self.dim
+        other.noise_model = self.noise_model
+        other.rho = self.rho.copy()
+        other.gate_history = list(self.gate_history)
+        return other
+
+    @classmethod
+    def from_statevector(cls, state, noise_model=None):
+        """ρ = |ψ⟩⟨ψ| dari state vector"""
+        state = np.asarray(state, dtype=complex)
+        sim = cls(int(len(state)).bit_length() - 1, noise_model)
+        sim.rho = np.outer(state, state.conj())
+        return sim
+
+    def apply_superoperator(self, superop, qubits):
+        """Kontraksi superoperator (4^k x 4^k) pada sumbu baris+kolom qubit terpilih"""
+        qubits = list(qubits)
+        n = self.num_qubits
+        k = len(qubits)
+        axes = qubits + [n + q for q in qubits]
+        tensor = self.rho.reshape((2,) * (2 * n))
+        sop = np.asarray(superop, dtype=complex).reshape((2,) * (4 * k))
+        out = np.tensordot(sop, tensor, axes=(list(range(2 * k, 4 * k)), axes))
+        self.rho = np.ascontiguousarray(np.moveaxis(out, list(range(2 * k)), axes)).reshape(self.dim, self.dim)
+
+    def apply_kraus(self, kraus_ops, qubits):
+        """Channel Kraus pada qubit terpilih: ρ -> Σ K ρ K†"""
+        self.apply_superoperator(superoperator(kraus_ops), qubits)
+
+    def apply_matrix(self, matrix, qubits):
+        """Unitary k-qubit: ρ -> U ρ U† sebagai superoperator lokal U ⊗ U*"""
+        qubits = list(qubits)
+        if len(qubits) == 2 and np.allclose(matrix, SWAP):
+            self.apply_swap(*qubits)
+            return
+        self.apply_kraus([matrix], qubits)
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Aplikasikan gate (control_qubit: int atau list) tanpa noise"""
+        controls = _as_controls(control_qubit)
+        _check_controls(target_qubit, controls)
+        gate = np.asarray(gate_matrix, dtype=complex)
+        if controls:
+            # Matrix lokal pada (controls..., target): blok terakhir = gate
+            local = np.eye(2 ** (len(controls) + 1), dtype=complex)
+            local[-2:, -2:] = gate
+            self.apply_matrix(local, controls + [target_qubit])
+        else:
+            self.apply_matrix(gate, [target_qubit])
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP dua qubit: tukar sumbu baris dan kolomnya"""
+        if qubit_a == qubit_b:
+            return
+        n = self.num_qubits
+        tensor = self.rho.reshape((2,) * (2 * n))
+        tensor = np.swapaxes(np.swapaxes(tensor, qubit_a, qubit_b), n + qubit_a, n + qubit_b)
+        self.rho = np.ascontiguousarray(tensor).reshape(self.dim, self.dim)
+
+    def apply_noise(self, op):
+        """Channel noise model setelah Operation (dipanggil oleh circuit.apply_operation)"""
+        if self.noise_model is None:
+            return
+        for kraus_ops, qubit in self.noise_model.channels_for(op):
+            self.apply_kraus(kraus_ops, [qubit])
+
+    def _project(self, qubit, outcome):
+        """Proyeksi ρ ke hasil qubit = outcome dan normalisasi ulang"""
+        n = self.num_qubits
+        tensor = self.rho.reshape((2,) * (2 * n))
+        index = [slice(None)] * (2 * n)
+        index[qubit] = 1 - outcome
+        tensor[tuple(index)] = 0
+        index[qubit] = slice(None)
+        index[n + qubit] = 1 - outcome
+        tensor[tuple(index)] = 0
+        self.rho /= np.trace(self.rho).real
+
+    def measure_qubit(self, qubit, outcome=None, rng=None):
+        """Pengukuran di tengah circuit: proyeksi ρ; hasil yang dilaporkan melewati readout error"""
+        rng = as_generator(rng)
+        p1 = self.marginal_probabilities([qubit])[1]
+        if outcome is None:
+            outcome = int(rng.random() < p1)
+        if (p1 if outcome else 1 - p1) <= 0:
+            raise ValueError(f"Outcome {outcome} on qubit {qubit} has zero probability")
+        self._project(qubit, outcome)
+        if self.noise_model is None:
+            return int(outcome)
+        # Outcome yang dipaksakan hanya menentukan proyeksi; bit yang dilaporkan tetap lewat readout error
+        confusion = self.noise_model.confusion_matrix(qubit)
+        return int(rng.random() < confusion[1, outcome])
+
+    def reset_qubit(self, qubit, outcome=None, rng=None):
+        """Reset qubit ke |0⟩: channel reset (deterministik), atau proyeksi + flip jika outcome diberikan"""
+        if outcome is None:
+            self.apply_kraus([np.array([[1, 0], [0, 0]]), np.array([[0, 1], [0, 0]])], [qubit])
+            return None
+        self.measure_qubit(qubit, outcome)
+        if outcome:
+            self.apply_gate(np.array([[0, 1], [1, 0]]), qubit)
+        return outcome
+
+    def get_probabilities(self):
+        """Probabilitas basis state (diagonal ρ, tanpa readout error)"""
+        return np.clip(self.rho.diagonal().real, 0.0, None)
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal 2^k register terpilih (qubits[0] = bit paling signifikan)"""
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        probs = self.get_probabilities().reshape((2,) * self.num_qubits)
+        others = tuple(q for q in range(self.num_qubits) if q not in qubits)
+        marginal = probs.sum(axis=others).transpose(np.argsort(np.argsort(qubits)))
+        marginal = marginal.reshape(-1)
+        return marginal / marginal.sum()
+
+    def readout_probabilities(self, qubits=None):
+        """Distribusi hasil yang terbaca: marginal register dengan matrix konfusi readout per qubit"""
+        qubits = list(range(self.num_qubits)) if qubits is None else list(qubits)
+        probs = self.marginal_probabilities(qubits).reshape((2,) * len(qubits))
+        if self.noise_model is not None and self.noise_model.readout_errors:
+            for axis, qubit in enumerate(qubits):
+                confusion = self.noise_model.confusion_matrix(qubit)
+                probs = np.moveaxis(np.tensordot(confusion, probs, axes=(1, axis)), 0, axis)
+        return probs.reshape(-1)
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Simulasi pengukuran (dengan readout error): indeks per shot"""
+        return Sampler(self.readout_probabilities(qubits)).sample(shots, rng)
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """Hasil pengukuran (dengan readout error) sebagai (indeks, counts)"""
+        return Sampler(self.readout_probabilities(qubits)).counts(shots, rng)
+
+    def purity(self):
+        """Tr(ρ²): 1 untuk state murni, 1/2^n untuk campuran maksimal"""
+        return float(np.vdot(self.rho, self.rho).real)
+
+    def fidelity(self, state):
+        """Fidelity ⟨ψ|ρ|ψ⟩ terhadap state vector murni"""
+        state = np.asarray(state, dtype=complex)
+        return float(np.vdot(state, self.rho @ state).real)
+
+    def memory_footprint(self):
+        """Pemakaian memori saat ini (byte)"""
+        return {"state": self.rho.nbytes, "total": self.rho.nbytes}
@@ -0,0 +1,141 @@
+# entanglement.py
+# Entanglement analytics for pure states. A bipartition A|B turns ψ into a
+# 2^|A| x 2^|B| matrix (a plain reshape for contiguous prefix cuts, one
+# moveaxis copy otherwise); its singular values are the Schmidt coefficients,
+# from which the von Neumann and Rényi entropies follow. Large cuts can ask for
+# only the top-k singular values (randomized subspace iteration). Results are
+# cached per simulator and state version, and a scan over the contiguous cuts
+# gives the entanglement profile and the bond dimension an MPS would need.
+
+import weakref
+
+import numpy as np # type: ignore
+
+from simulator import _cache_put
+from mps import DEFAULT_MAX_BOND
+
+
+# Koefisien Schmidt di bawah ini dianggap nol saat menghitung rank
+SCHMIDT_TOLERANCE = 1e-10
+
+# Entri cache spektrum per simulator (dikosongkan saat versi state berubah)
+SPECTRUM_CACHE_SIZE = 64
+
+# Kolom tambahan dan iterasi power untuk SVD top-k acak (eksak untuk spektrum rank rendah,
+# makin kasar bila spektrum datar, mis. state acak dengan entanglement maksimal)
+OVERSAMPLING = 8
+POWER_ITERATIONS = 4
+
+# Cache per simulator: simulator -> (versi state, {kunci potongan: koefisien})
+_SPECTRUM_CACHE = weakref.WeakKeyDictionary()
+
+
+def _state_of(target):
+    """State vector dari simulator atau array (density matrix ditolak: entropi potongan hanya untuk state murni)"""
+    if hasattr(target, "rho"):
+        raise ValueError("Entanglement entropy of a bipartition needs a pure state, got a density matrix")
+    if hasattr(target, "state"):
+        return np.asarray(target.state)
+    if hasattr(target, "get_amplitudes"):
+        return np.asarray(target.get_amplitudes())
+    return np.asarray(target)
+
+
+def _cut_matrix(state, qubits):
+    """Matrix 2^|A| x 2^|B| dengan baris = qubit subsystem A (view jika A prefiks 0..k-1)"""
+    n = len(state).bit_length() - 1
+    k = len(qubits)
+    if list(qubits) == list(range(k)):
+        return state.reshape(2 ** k, -1)
+    return np.moveaxis(state.reshape((2,) * n), list(qubits), list(range(k))).reshape(2 ** k, -1)
+
+
+def _top_singular_values(matrix, k, rng):
+    """k nilai singular terbesar lewat iterasi subspace acak (Halko et al.), O(rows·cols·k)"""
+    # Kerja di sisi yang lebih pendek sebagai kolom acak
+    if matrix.shape[0] < matrix.shape[1]:
+        matrix = matrix.conj().T
+    width = min(k + OVERSAMPLING, matrix.shape[1])
+    probe = rng.normal(size=(matrix.shape[1], width)) + 1j * rng.normal(size=(matrix.shape[1], width))
+    basis, _ = np.linalg.qr(matrix @ probe)
+    for _ in range(POWER_ITERATIONS):
+        basis, _ = np.linalg.qr(matrix.conj().T @ basis)
+        basis, _ = np.linalg.qr(matrix @ basis)
+    return np.linalg.svd(basis.conj().T @ matrix, compute_uv=False)[:k]
+
+
+def schmidt_coefficients(target, qubits, top_k=None):
+    """Koefisien Schmidt (menurun) untuk potongan qubits | sisanya; top_k: hanya k terbesar
+
+    Hasil di-cache per simulator sampai state berubah (QuantumSimulator.version).
+    """
+    state = _state_of(target)
+    n = len(state).bit_length() - 1
+    qubits = [int(q) for q in qubits]
+    if len(set(qubits)) != len(qubits) or not all(0 <= q < n for q in qubits):
+        raise ValueError(f"Qubits {qubits} must be distinct and within 0..{n - 1}")
+    # Entropi simetris: potongan dikanonkan ke sisi yang memuat qubit 0
+    side = qubits if 0 in qubits else [q for q in range(n) if q not in qubits]
+    key = (tuple(sorted(side)), top_k)
+    version = getattr(target, "version", None)
+    cache = None
+    if version is not None:
+        cached_version, cache = _SPECTRUM_CACHE.get(target, (None, None))
+        if cached_version != version:
+            cache = {}
+            _SPECTRUM_CACHE[target] = (version, cache)
+        if key in cache:
+            return cache[key]
+    matrix = _cut_matrix(state, sorted(side))
+    if top_k is None or 2 * top_k >= min(matrix.shape):
+        coefficients = np.linalg.svd(matrix, compute_uv=False)
+        coefficients = coefficients if top_k is None else coefficients[:top_k]
+    else:
+        coefficients = _top_singular_values(matrix, top_k, np.random.default_rng(0))
+    if cache is not None:
+        _cache_put(cache, key, coefficients, SPECTRUM_CACHE_SIZE)
+    return coefficients
+
+
+def spectrum_entropy(coefficients, alpha=1.0):
+    """Entropi (bit) dari koefisien Schmidt: von Neumann untuk alpha = 1, Rényi S_α untuk lainnya
+
+    Dengan spektrum top-k, bobot yang hilang (1 - Σλ) tidak ikut dihitung.
+    """
+    weights = np.asarray(coefficients) ** 2
+    weights = weights[weights > SCHMIDT_TOLERANCE ** 2]
+    if alpha == 1:
+        return float(-np.sum(weights * np.log2(weights)))
+    if alpha == np.inf:
+        return float(-np.log2(weights.max()))
+    return float(np.log2(np.sum(weights ** alpha)) / (1 - alpha))
+
+
+def entanglement_entropy(target, qubits, alpha=1.0, top_k=None):
+    """Entropi keterikatan (bit) subsystem qubits terhadap sisa register"""
+    return spectrum_entropy(schmidt_coefficients(target, qubits, top_k), alpha)
+
+
+def schmidt_rank(coefficients):
+    """Jumlah koefisien Schmidt di atas SCHMIDT_TOLERANCE"""
+    return int(np.sum(np.asarray(coefficients) > SCHMIDT_TOLERANCE))
+
+
+def entanglement_profile(target, alpha=1.0, top_k=None, max_bond=DEFAULT_MAX_BOND):
+    """Scan semua potongan berurutan 0..c-1 | c..n-1: entropi dan rank Schmidt per potongan
+
+    Rank maksimum = bond dimension yang dibutuhkan MPS untuk state ini tanpa truncation;
+    "mps_recommended" True jika rank itu muat di max_bond. Dengan top_k, rank dibatasi k (batas bawah).
+    """
+    n = len(_state_of(target)).bit_length() - 1
+    cuts = list(range(1, n))
+    spectra = [schmidt_coefficients(target, range(c), top_k) for c in cuts]
+    ranks = np.array([schmidt_rank(s) for s in spectra], dtype=np.int64)
+    max_rank = int(ranks.max()) if len(ranks) else 1
+    return {
+        "cuts": cuts,
+        "entropies": np.array([spectrum_entropy(s, alpha) for s in spectra]),
+        "schmidt_ranks": ranks,
+        "max_rank": max_rank,
+        "mps_recommended": max_rank <= max_bond,
+    }
@@ -0,0 +1,166 @@
+# gradients.py
+# Exact gradients of ⟨ψ(θ)|H|ψ(θ)⟩ over parameterized circuits (Parameter /
+# Circuit.bind). Adjoint mode runs the circuit forward once, forms λ = H|ψ⟩,
+# then sweeps the gates in reverse, un-applying each gate on ψ and λ and
+# reading ∂⟨H⟩/∂θ = 2·Re⟨λ|∂U ψ⟩ from a 2x2 overlap of the two states: a
+# constant number of state-vector passes per gate for all parameters at once.
+# Parameter-shift mode (two or four circuit runs per parameter occurrence) is for
+# cross-checking. Both accept batched parameter sets through BatchedSimulator.
+
+import numpy as np # type: ignore
+
+from batched import BatchedSimulator, sweep
+from circuit import Circuit, Operation, Parameter, PARAMETRIC_GATES, NON_UNITARY, DIAGONAL
+from observables import apply_observable, expectation
+
+
+# Frekuensi ω tiap parameter di dalam matrix gate (entri = c + a·cos(ωθ) + b·sin(ωθ))
+PARAMETER_FREQUENCIES = {
+    "RX": (0.5,),
+    "RY": (0.5,),
+    "RZ": (0.5,),
+    "P": (1.0,),
+    "U3": (0.5, 1.0, 1.0),
+}
+
+# Aturan parameter-shift (geseran, koefisien): ∂⟨H⟩ = Σ c·[⟨H⟩(θ + s) - ⟨H⟩(θ - s)].
+# Generator dengan spektrum {±1/2} atau {0, 1} memberi ⟨H⟩ frekuensi 1 (dua term);
+# rotasi ω = 1/2 yang di-control punya spektrum {0, ±1/2} (frekuensi 1/2 dan 1, empat term).
+TWO_TERM_SHIFT = ((np.pi / 2, 0.5),)
+FOUR_TERM_SHIFT = (
+    (np.pi / 2, (np.sqrt(2) + 1) / (4 * np.sqrt(2))),
+    (3 * np.pi / 2, -(np.sqrt(2) - 1) / (4 * np.sqrt(2))),
+)
+
+
+def _occurrences(circuit):
+    """Daftar (indeks op, posisi parameter, nama Parameter) untuk setiap pemakaian Parameter"""
+    found = []
+    for i, op in enumerate(circuit):
+        if op.kind in NON_UNITARY or op.condition is not None:
+            raise ValueError(f"Gradients need unitary, unconditioned circuits, got {op.describe()}")
+        for j, p in enumerate(op.params):
+            if isinstance(p, Parameter):
+                if op.kind not in PARAMETER_FREQUENCIES:
+                    raise ValueError(f"Gate {op.kind} has no known derivative")
+                found.append((i, j, p.name))
+    return found
+
+
+def _prepare(circuit, values):
+    """Nilai sebagai skalar atau array (batch,), ukuran batch, dan apakah input skalar"""
+    values = {name: np.ravel(v) if np.ndim(v) > 0 else float(v) for name, v in values.items()}
+    sizes = {len(v) for v in values.values() if np.ndim(v) > 0}
+    if len(sizes) > 1:
+        raise ValueError(f"Parameter arrays must have the same length, got {sorted(sizes)}")
+    missing = [name for name in circuit.parameters if name not in values]
+    if missing:
+        raise ValueError(f"Missing values for parameters {missing}")
+    scalar = not sizes
+    return values, (sizes.pop() if sizes else 1), scalar
+
+
+def _result(value, gradients, scalar):
+    """Float untuk input skalar, array (batch,) untuk input batch"""
+    if scalar:
+        return float(value[0]), {name: float(g[0]) for name, g in gradients.items()}
+    return value, gradients
+
+
+def _apply(sim, op, matrix):
+    """Terapkan matrix pengganti untuk op (mis. U† atau U^T) dengan target/control yang sama"""
+    if op.kind == DIAGONAL:
+        sim.apply_matrix(np.diag(matrix), op.targets)
+    elif len(op.targets) == 1:
+        sim.apply_gate(matrix, op.targets[0], list(op.controls) or None)
+    else:
+        sim.apply_matrix(matrix, op.targets)
+
+
+def derivative_matrix(op, position):
+    """∂U/∂θ untuk parameter ke-`position` dari op yang sudah di-bind: ω/2·[U(θ + π/2ω) - U(θ - π/2ω)]"""
+    function, _ = PARAMETRIC_GATES[op.kind]
+    omega = PARAMETER_FREQUENCIES[op.kind][position]
+    shift = np.pi / (2 * omega)
+    plus = list(op.params)
+    minus = list(op.params)
+    plus[position] = plus[position] + shift
+    minus[position] = minus[position] - shift
+    return omega / 2 * (function(*plus) - function(*minus))
+
+
+def _overlap(lam_conj, psi, op, num_qubits):
+    """M[b, a, c] = Σ conj(λ[..a..])·ψ[..c..] pada qubit target, control dikunci di 1 (tanpa salinan state)"""
+    batch = len(psi)
+    index = (slice(None),) + tuple(1 if q in op.controls else slice(None) for q in range(num_qubits))
+    # Sumbu target bergeser ke kiri sebanyak control di depannya
+    axis = 1 + op.targets[0] - sum(c < op.targets[0] for c in op.controls)
+    views = [np.moveaxis(s.reshape((batch,) + (2,) * num_qubits)[index], axis, 1) for s in (lam_conj, psi)]
+    rest = list(range(3, views[0].ndim + 1))
+    return np.einsum(views[0], [0, 1] + rest, views[1], [0, 2] + rest, [0, 1, 2])
+
+
+def adjoint_gradient(circuit, observable, values):
+    """⟨H⟩ dan gradien semua Parameter lewat diferensiasi adjoint (satu forward + satu sweep mundur)
+
+    values: dict nama -> skalar, atau array panjang batch untuk banyak set parameter.
+    Hasil (nilai, {nama: gradien}); float untuk input skalar, array (batch,) untuk batch.
+    """
+    occurrences = _occurrences(circuit)
+    values, batch, scalar = _prepare(circuit, values)
+    n = circuit.num_qubits
+    bound = circuit.bind(values)
+    psi = sweep(circuit, values)
+    # λ disimpan sebagai conj(λ): update-nya U^T, dan overlap cukup einsum dua operand
+    lam = BatchedSimulator.from_states(np.conj(apply_observable(psi.state, observable)))
+    value = np.einsum("bi,bi->b", psi.state, lam.state).real
+    gradients = {name: np.zeros(batch) for name in circuit.parameters}
+    by_op = {}
+    for i, j, name in occurrences:
+        by_op.setdefault(i, []).append((j, name))
+    for i in range(len(bound.operations) - 1, -1, -1):
+        op = bound.operations[i]
+        # Transpose matrix; diagonal (vektor) adalah transpose-nya sendiri
+        transpose = op.matrix if op.kind == DIAGONAL else np.swapaxes(op.matrix, -1, -2)
+        _apply(psi, op, np.conj(transpose))
+        if i in by_op:
+            overlap = _overlap(lam.state, psi.state, op, n)
+            for j, name in by_op[i]:
+                derivative = np.broadcast_to(derivative_matrix(op, j), (batch, 2, 2))
+                gradients[name] += 2 * np.einsum("bac,bac->b", derivative, overlap).real
+        _apply(lam, op, transpose)
+    return _result(value, gradients, scalar)
+
+
+def parameter_shift_gradient(circuit, observable, values):
+    """⟨H⟩ dan gradien lewat aturan parameter-shift (dua atau empat run circuit per pemakaian Parameter)"""
+    occurrences = _occurrences(circuit)
+    values, batch, scalar = _prepare(circuit, values)
+    bound = circuit.bind(values)
+    value = np.atleast_1d(expectation(sweep(circuit, values), observable))
+    gradients = {name: np.zeros(batch) for name in circuit.parameters}
+    for i, j, name in occurrences:
+        op = bound.operations[i]
+        controlled = op.controls and PARAMETER_FREQUENCIES[op.kind][j] == 0.5
+        for shift, coefficient in (FOUR_TERM_SHIFT if controlled else TWO_TERM_SHIFT):
+            for sign in (1, -1):
+                params = list(op.params)
+                params[j] = params[j] + sign * shift
+                shifted = bound.operations[:i] + [Operation(op.kind, op.targets, op.controls, params, label=op.label)] \
+                    + bound.operations[i + 1:]
+                sim = BatchedSimulator(circuit.num_qubits, batch).run(Circuit(circuit.num_qubits, shifted))
+                gradients[name] += sign * coefficient * expectation(sim, observable)
+    return _result(value, gradients, scalar)
+
+
+GRADIENT_METHODS = {
+    "adjoint": adjoint_gradient,
+    "parameter_shift": parameter_shift_gradient,
+}
+
+
+def gradient(circuit, observable, values, method="adjoint"):
+    """Gradien ⟨H⟩ terhadap semua Parameter circuit; method "adjoint" (default) atau "parameter_shift" untuk cek silang"""
+    if method not in GRADIENT_METHODS:
+        raise ValueError(f"Unknown gradient method '{method}', expected one of {list(GRADIENT_METHODS)}")
+    return GRADIENT_METHODS[method](circuit, observable, values)
@@ -7,6 +7,18 @@ import io
 # Import translations
 from translations import TRANSLATIONS, AVAILABLE_LANGUAGES, get_text, get_gate_description
 
+# Import simulation engine
+from simulator import (
+    QuantumSimulator, MemoryBudgetError,
+    MAX_QUBITS, DEFAULT_MEMORY_BUDGET, PRECISIONS, estimate_memory
+)
+from stabilizer import AutoSimulator
+from circuit import GATE_MATRICES, PARAMETRIC_GATES
+from algorithms import qft_circuit, grover_circuit, deutsch_jozsa_circuit, bernstein_vazirani_circuit
+from bloch import bloch_vectors, reduced_density_matrix
+from statecache import shared_cache
+from timeline import Timeline
+
 # Initialize language in session state before page config
 if 'language' not in st.session_state:
     st.session_state.language = "English"
@@ -20,145 +32,149 @@ st.set_page_config(
     layout="wide"
 )
 
-class QuantumSimulator:
-    """Simulator quantum computing sederhana"""
-    def __init__(self, num_qubits):
-        self.num_qubits = num_qubits
-        self.dim = 2 ** num_qubits
-        self.state = np.zeros(self.dim, dtype=complex)
-        self.state[0] = 1.0
-        self.gate_history = []
-
-    def reset(self):
-        """Reset state ke |0...0⟩"""
-        self.state = np.zeros(self.dim, dtype=complex)
-        self.state[0] = 1.0
-        self.gate_history = []
-    
-    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
-        """Aplikasikan gate ke qubit tertentu"""
-        if control_qubit is not None:
-        
-            full_gate = self._create_cnot_matrix(control_qubit, target_qubit)
-        else:
-        
-            full_gate = self._expand_gate(gate_matrix, target_qubit)
-        
-        self.state = full_gate @ self.state
-        self.state /= np.linalg.norm(self.state)
-    
-    def _expand_gate(self, gate, target):
-        """Ekspansi gate single-qubit ke sistem multi-qubit"""
-        I = np.eye(2)
-        matrices = []
-        
-        for i in range(self.num_qubits):
-            if i == target:
-                matrices.append(gate)
-            else:
-                matrices.append(I)
-        
 
-        result = matrices[0]
-        for m in matrices[1:]:
-            result = np.kron(result, m)
-        
-        return result
-    
-    def _create_cnot_matrix(self, control, target):
-        """Buat matrix CNOT untuk control dan target qubit"""
+# Maximum number of basis states drawn in the plots and listed in the state panel
+MAX_DISPLAYED_STATES = 32
 
-        dim = self.dim
-        cnot = np.eye(dim, dtype=complex)
-        
-        for i in range(dim):
-            bits = [(i >> k) & 1 for k in range(self.num_qubits)]
-            
-            if bits[control] == 1:
-            
-                bits[target] = 1 - bits[target]
-                j = sum(b << k for k, b in enumerate(bits))
-                
-            
-                cnot[i, i] = 0
-                cnot[i, j] = 1
-        
-        return cnot
-    
-    def get_probabilities(self):
-        """Hitung probabilitas pengukuran setiap basis state"""
-        return np.abs(self.state) ** 2
-    
-    def get_amplitudes(self):
-        """Dapatkan amplitudo kompleks"""
-        return self.state
-    
-    def measure(self, shots=1000):
-        """Simulasi pengukuran"""
-        probs = self.get_probabilities()
-        outcomes = np.random.choice(self.dim, size=shots, p=probs)
-        return outcomes
-
-
-
-PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
-PAULI_Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
-PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
+# Upper bound of the shots slider; counts come from one multinomial draw,
+# so the cost does not grow with the number of shots
+MAX_SHOTS = 1_000_000
 
+# Qubits measured by default in the histogram (larger registers can pick a subset)
+MAX_MEASURED_QUBITS = 5
 
-HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+# Largest register for which prebuilt algorithms are offered (Grover's gate count grows as sqrt(2^n))
+MAX_ALGORITHM_QUBITS = 12
 
+# Most recent operations listed in the circuit history (older ones are summarized in one line)
+MAX_HISTORY_ROWS = 50
 
-S_GATE = np.array([[1, 0], [0, 1j]], dtype=complex)
-T_GATE = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex)
+# Bloch spheres drawn at once, and largest subset whose reduced density matrix is listed
+MAX_BLOCH_QUBITS = 8
+MAX_RDM_QUBITS = 3
 
-
-IDENTITY = np.eye(2, dtype=complex)
+ALGORITHMS = ["algorithm_qft", "algorithm_iqft", "algorithm_grover", "algorithm_dj", "algorithm_bv"]
 
 
 def get_gate_info(lang):
     """Get gate info with translated descriptions"""
     return {
         "Hadamard (H)": {
-            "matrix": HADAMARD,
+            "kind": "H",
+            "matrix": GATE_MATRICES["H"],
             "desc": get_gate_description(lang, "Hadamard (H)"),
             "emoji": "🌊"
         },
         "Pauli-X": {
-            "matrix": PAULI_X,
+            "kind": "X",
+            "matrix": GATE_MATRICES["X"],
             "desc": get_gate_description(lang, "Pauli-X"),
             "emoji": "🔄"
         },
         "Pauli-Y": {
-            "matrix": PAULI_Y,
+            "kind": "Y",
+            "matrix": GATE_MATRICES["Y"],
             "desc": get_gate_description(lang, "Pauli-Y"),
             "emoji": "🔃"
         },
         "Pauli-Z": {
-            "matrix": PAULI_Z,
+            "kind": "Z",
+            "matrix": GATE_MATRICES["Z"],
             "desc": get_gate_description(lang, "Pauli-Z"),
             "emoji": "⚡"
         },
         "S Gate": {
-            "matrix": S_GATE,
+            "kind": "S",
+            "matrix": GATE_MATRICES["S"],
             "desc": get_gate_description(lang, "S Gate"),
             "emoji": "📐"
         },
         "T Gate": {
-            "matrix": T_GATE,
+            "kind": "T",
+            "matrix": GATE_MATRICES["T"],
             "desc": get_gate_description(lang, "T Gate"),
             "emoji": "🎯"
+        },
+        "Rx": {
+            "kind": "RX",
+            "matrix": None,
+            "desc": get_gate_description(lang, "Rx"),
+            "emoji": "🌀"
+        },
+        "Ry": {
+            "kind": "RY",
+            "matrix": None,
+            "desc": get_gate_description(lang, "Ry"),
+            "emoji": "🌀"
+        },
+        "Rz": {
+            "kind": "RZ",
+            "matrix": None,
+            "desc": get_gate_description(lang, "Rz"),
+            "emoji": "🌀"
         }
     }
 
 
+def get_multi_qubit_gate_info(lang):
+    """Get multi-qubit gate info (kind, matrix, number of controls/targets, translated info)"""
+    return {
+        "CNOT": {
+            "kind": "CNOT",
+            "matrix": GATE_MATRICES["CNOT"],
+            "num_controls": 1,
+            "num_targets": 1,
+            "info": get_text(lang, "cnot_info")
+        },
+        "CZ": {
+            "kind": "CZ",
+            "matrix": GATE_MATRICES["CZ"],
+            "num_controls": 1,
+            "num_targets": 1,
+            "info": get_text(lang, "cz_info")
+        },
+        "SWAP": {
+            "kind": "SWAP",
+            "matrix": GATE_MATRICES["SWAP"],
+            "num_controls": 0,
+            "num_targets": 2,
+            "info": get_text(lang, "swap_info")
+        },
+        "CCX (Toffoli)": {
+            "kind": "CCX",
+            "matrix": GATE_MATRICES["CCX"],
+            "num_controls": 2,
+            "num_targets": 1,
+            "info": get_text(lang, "ccx_info")
+        }
+    }
+
+
+def select_basis_states(weights, limit=MAX_DISPLAYED_STATES):
+    """Indeks basis state yang ditampilkan: semua, atau `limit` dengan bobot terbesar"""
+    if len(weights) <= limit:
+        return np.arange(len(weights))
+    return np.sort(np.argpartition(weights, -limit)[-limit:])
+
+
+def format_bytes(num_bytes):
+    """Ukuran byte yang mudah dibaca"""
+    for unit in ["B", "KiB", "MiB", "GiB"]:
+        if num_bytes < 1024 or unit == "GiB":
+            return f"{num_bytes:.1f} {unit}"
+        num_bytes /= 1024
+
+
 def plot_state_vector(simulator, lang):
     """Visualisasi state vector (amplitudo dan fase)"""
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
     amplitudes = simulator.get_amplitudes()
     probabilities = simulator.get_probabilities()
-    basis_states = [bin(i)[2:].zfill(simulator.num_qubits) for i in range(simulator.dim)]
+    indices = select_basis_states(probabilities)
+    amplitudes = amplitudes[indices]
+    probabilities = probabilities[indices]
+    basis_states = [bin(i)[2:].zfill(simulator.num_qubits) for i in indices]
     
 
     colors = plt.cm.viridis(probabilities / probabilities.max() if probabilities.max() > 0 else probabilities)
@@ -194,24 +210,38 @@ def plot_state_vector(simulator, lang):
     ax2.grid(axis='y', alpha=0.3, linestyle='--')
     ax2.axhline(y=0, color='black', linestyle='-', linewidth=0.8)
     
+    if simulator.num_qubits > 4:
+        ax1.tick_params(axis='x', rotation=90)
+        ax2.tick_params(axis='x', rotation=90)
+    
     plt.tight_layout()
     return fig
 
-def plot_measurement_histogram(simulator, shots, lang):
-    """Histogram hasil pengukuran"""
-    outcomes = simulator.measure(shots)
-    basis_states = [bin(i)[2:].zfill(simulator.num_qubits) for i in range(simulator.dim)]
-    
-    counts = np.bincount(outcomes, minlength=simulator.dim)
+def plot_measurement_histogram(simulator, shots, lang, qubits=None):
+    """Histogram hasil pengukuran (semua qubit, atau hanya register `qubits`)"""
+    qubits = list(range(simulator.num_qubits)) if qubits is None else list(qubits)
+    indices, counts = simulator.measure_counts(shots, qubits=qubits)
+    
+    dim = 2 ** len(qubits)
+    if dim <= MAX_DISPLAYED_STATES:
+        counts = np.bincount(indices, weights=counts, minlength=dim).astype(np.int64)
+        indices = np.arange(dim)
+    else:
+        keep = select_basis_states(counts)
+        indices, counts = indices[keep], counts[keep]
+    basis_states = [bin(i)[2:].zfill(len(qubits)) for i in indices]
     
     fig, ax = plt.subplots(figsize=(10, 5))
     colors = plt.cm.plasma(counts / counts.max() if counts.max() > 0 else counts)
     bars = ax.bar(basis_states, counts, color=colors, edgecolor='black', linewidth=1.5)
     
-    ax.set_xlabel(get_text(lang, "measurement_result_label"), fontsize=12, fontweight='bold')
+    register = " ".join(f"Q{q}" for q in qubits)
+    ax.set_xlabel(f'{get_text(lang, "measurement_result_label")} ({register})', fontsize=12, fontweight='bold')
     ax.set_ylabel(get_text(lang, "frequency_label", shots=shots), fontsize=12, fontweight='bold')
     ax.set_title(get_text(lang, "histogram_title", shots=shots), fontsize=14, fontweight='bold')
     ax.grid(axis='y', alpha=0.3, linestyle='--')
+    if len(qubits) > 4:
+        ax.tick_params(axis='x', rotation=90)
     
 
     for bar, count in zip(bars, counts):
@@ -224,6 +254,54 @@ def plot_measurement_histogram(simulator, shots, lang):
     plt.tight_layout()
     return fig
 
+def plot_bloch_spheres(vectors, qubits, lang):
+    """Bloch spheres of the selected qubits (vectors: array (n, 3) from bloch_vectors)"""
+    cols = min(len(qubits), 4)
+    rows = -(-len(qubits) // cols)
+    fig = plt.figure(figsize=(3.5 * cols, 3.5 * rows))
+    u, v = np.mgrid[0:2 * np.pi:30j, 0:np.pi:15j]
+    
+    for i, q in enumerate(qubits):
+        ax = fig.add_subplot(rows, cols, i + 1, projection='3d')
+        ax.plot_wireframe(np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v), color='gray', alpha=0.15, linewidth=0.5)
+        for axis in np.eye(3):
+            ax.plot(*np.stack([-axis, axis], axis=1), color='black', linewidth=0.6, alpha=0.5)
+        x, y, z = vectors[q]
+        ax.quiver(0, 0, 0, x, y, z, color='#e74c3c', linewidth=2.5, arrow_length_ratio=0.15)
+        ax.text(0, 0, 1.25, '|0⟩', ha='center', fontsize=10)
+        ax.text(0, 0, -1.4, '|1⟩', ha='center', fontsize=10)
+        ax.set_xlim([-1, 1])
+        ax.set_ylim([-1, 1])
+        ax.set_zlim([-1, 1])
+        ax.set_box_aspect((1, 1, 1))
+        ax.set_axis_off()
+        ax.set_title(get_text(lang, "bloch_title", qubit=q, length=np.linalg.norm(vectors[q])),
+                     fontsize=11, fontweight='bold')
+    
+    plt.tight_layout()
+    return fig
+
+def make_timeline(simulator):
+    """Undo/redo timeline; state-vector sessions compile unitary runs and resume them from the shared prefix cache"""
+    # The stabilizer backend keeps the raw gates: fused matrices are no longer recognized as Clifford
+    statevector = isinstance(simulator, QuantumSimulator)
+    return Timeline(simulator, cache=shared_cache() if statevector else None, optimize=statevector)
+
+
+def build_algorithm(key, num_qubits, value):
+    """Gate-level circuit of a prebuilt algorithm (value: marked state, secret, or balanced flag)"""
+    if key == "algorithm_qft":
+        return qft_circuit(num_qubits)
+    if key == "algorithm_iqft":
+        return qft_circuit(num_qubits, inverse=True)
+    if key == "algorithm_grover":
+        return grover_circuit(num_qubits, [value])
+    if key == "algorithm_dj":
+        balanced = lambda x: x & 1
+        return deutsch_jozsa_circuit(num_qubits, balanced if value else np.zeros(2 ** num_qubits, dtype=int))
+    return bernstein_vazirani_circuit(num_qubits, value)
+
+
 def display_matrix(matrix, title, lang):
     """Tampilkan representasi matrix gate"""
     st.markdown(f"### 🔢 {get_text(lang, 'matrix_title')} {title}")
@@ -292,20 +370,64 @@ def main():
     st.sidebar.header(get_text(lang, "sidebar_settings"))
     
     
-    num_qubits = st.sidebar.selectbox(
-        get_text(lang, "num_qubits_label"),
-        options=[1, 2, 3],
-        index=0,
-        help=get_text(lang, "num_qubits_help")
+    large_register = st.sidebar.checkbox(
+        get_text(lang, "large_register_label"),
+        help=get_text(lang, "large_register_help", max_qubits=MAX_QUBITS)
     )
     
-   
-    if 'simulator' not in st.session_state or st.session_state.get('num_qubits') != num_qubits:
-        st.session_state.simulator = QuantumSimulator(num_qubits)
-        st.session_state.num_qubits = num_qubits
-        st.session_state.circuit = []
+    if large_register:
+        num_qubits = int(st.sidebar.number_input(
+            get_text(lang, "num_qubits_label"),
+            min_value=1,
+            max_value=MAX_QUBITS,
+            value=4,
+            step=1
+        ))
+        memory_budget_mb = st.sidebar.number_input(
+            get_text(lang, "memory_budget_label"),
+            min_value=16,
+            value=int(DEFAULT_MEMORY_BUDGET // 2 ** 20),
+            step=256
+        )
+        memory_budget = int(memory_budget_mb) * 2 ** 20
+        precision = st.sidebar.selectbox(
+            get_text(lang, "precision_label"),
+            options=list(PRECISIONS),
+            index=0,
+            help=get_text(lang, "precision_help")
+        )
+    else:
+        num_qubits = st.sidebar.selectbox(
+            get_text(lang, "num_qubits_label"),
+            options=[1, 2, 3],
+            index=0,
+            help=get_text(lang, "num_qubits_help")
+        )
+        memory_budget = None
+        precision = "complex128"
     
-    simulator = st.session_state.simulator
+   
+    sim_config = (num_qubits, memory_budget, precision)
+    if 'timeline' not in st.session_state or st.session_state.get('sim_config') != sim_config:
+        try:
+            if large_register:
+                new_simulator = QuantumSimulator(num_qubits, memory_budget=memory_budget, precision=precision)
+            else:
+                new_simulator = AutoSimulator(num_qubits)
+        except MemoryBudgetError as e:
+            st.sidebar.error(get_text(lang, "memory_error", num_qubits=num_qubits,
+                                      needed=format_bytes(estimate_memory(num_qubits, precision)["total"]),
+                                      budget=format_bytes(memory_budget)))
+            if "dtype" in (e.suggestion or {}):
+                st.sidebar.info(get_text(lang, "memory_suggest_precision", dtype=e.suggestion["dtype"]))
+            elif e.suggestion:
+                st.sidebar.info(get_text(lang, "memory_suggest_qubits", num_qubits=e.suggestion["num_qubits"]))
+            st.stop()
+        st.session_state.sim_config = sim_config
+        st.session_state.timeline = make_timeline(new_simulator)
+    
+    timeline = st.session_state.timeline
+    simulator = timeline.simulator
     
     st.sidebar.markdown("---")
     st.sidebar.subheader(get_text(lang, "add_gate_header"))
@@ -329,47 +451,145 @@ def main():
     gate_data = GATE_INFO[gate_name]
     st.sidebar.info(f"{gate_data['emoji']} **{gate_name}**\n\n{gate_data['desc']}")
     
+    # Rotation gates: matrix dibuat dari sudut yang dipilih
+    gate_params = ()
+    gate_matrix = gate_data['matrix']
+    gate_label = gate_name
+    if gate_data['kind'] in PARAMETRIC_GATES:
+        angle = st.sidebar.slider(
+            get_text(lang, "rotation_angle_label"),
+            min_value=-float(np.pi),
+            max_value=float(np.pi),
+            value=float(np.pi / 2),
+            step=0.01
+        )
+        gate_params = (angle,)
+        gate_matrix = PARAMETRIC_GATES[gate_data['kind']][0](angle)
+        gate_label = f"{gate_name}({angle:.2f})"
    
     if st.sidebar.button(get_text(lang, "apply_gate_btn"), use_container_width=True):
-        simulator.apply_gate(gate_data['matrix'], target_qubit)
-        st.session_state.circuit.append(f"{gate_name} → Q{target_qubit}")
-        st.sidebar.success(get_text(lang, "gate_applied_success", gate_name=gate_name, target=target_qubit))
+        timeline.append(gate_data['kind'], [target_qubit], params=gate_params, label=gate_label)
+        st.sidebar.success(get_text(lang, "gate_applied_success", gate_name=gate_label, target=target_qubit))
+    
+    # Mid-circuit measurement / reset of the target qubit (collapses the state)
+    col_measure, col_reset = st.sidebar.columns(2)
+    if col_measure.button(get_text(lang, "measure_qubit_btn"), use_container_width=True):
+        clbit = timeline.circuit.num_clbits
+        timeline.append("MEASURE", [target_qubit], params=[clbit])
+        st.sidebar.success(get_text(lang, "qubit_measured_success", target=target_qubit,
+                                    outcome=timeline.clbits[clbit], clbit=clbit))
+    if col_reset.button(get_text(lang, "reset_qubit_btn"), use_container_width=True):
+        timeline.append("RESET", [target_qubit])
+        st.sidebar.success(get_text(lang, "qubit_reset_success", target=target_qubit))
     
     st.sidebar.markdown("---")
     
     
     if num_qubits > 1:
-        st.sidebar.subheader(get_text(lang, "cnot_header"))
+        st.sidebar.subheader(get_text(lang, "multi_qubit_header"))
         
-        col1, col2 = st.sidebar.columns(2)
-        control_qubit = col1.selectbox(
-            get_text(lang, "control_label"),
-            options=list(range(num_qubits)),
-            format_func=lambda x: f"Q{x}"
+        MULTI_QUBIT_INFO = {
+            name: data for name, data in get_multi_qubit_gate_info(lang).items()
+            if data["num_controls"] + data["num_targets"] <= num_qubits
+        }
+        multi_qubit_name = st.sidebar.selectbox(
+            get_text(lang, "multi_qubit_gate_label"),
+            options=list(MULTI_QUBIT_INFO.keys())
         )
+        multi_qubit_data = MULTI_QUBIT_INFO[multi_qubit_name]
+        num_controls = multi_qubit_data["num_controls"]
         
-        target_qubit_cnot = col2.selectbox(
-            get_text(lang, "target_label"),
-            options=[q for q in range(num_qubits) if q != control_qubit],
-            format_func=lambda x: f"Q{x}"
-        )
+        cols = st.sidebar.columns(num_controls + multi_qubit_data["num_targets"])
+        selected_qubits = []
+        for i, col in enumerate(cols):
+            selected_qubits.append(col.selectbox(
+                get_text(lang, "control_label" if i < num_controls else "target_label"),
+                options=[q for q in range(num_qubits) if q not in selected_qubits],
+                format_func=lambda x: f"Q{x}",
+                key=f"multi_qubit_{i}"
+            ))
+        control_qubits = selected_qubits[:num_controls]
+        target_qubits = selected_qubits[num_controls:]
         
-        st.sidebar.info(get_text(lang, "cnot_info"))
+        st.sidebar.info(multi_qubit_data["info"])
         
-        if st.sidebar.button(get_text(lang, "apply_cnot_btn"), use_container_width=True):
-            simulator.apply_gate(IDENTITY, target_qubit_cnot, control_qubit)
-            st.session_state.circuit.append(f"CNOT: Q{control_qubit} → Q{target_qubit_cnot}")
-            st.sidebar.success(get_text(lang, "cnot_applied_success", control=control_qubit, target=target_qubit_cnot))
+        if st.sidebar.button(get_text(lang, "apply_multi_qubit_btn", gate_name=multi_qubit_name), use_container_width=True):
+            op = timeline.append(multi_qubit_data["kind"], target_qubits, control_qubits, label=multi_qubit_name)
+            st.sidebar.success(get_text(lang, "multi_qubit_applied_success", operation=op.describe()))
     
     st.sidebar.markdown("---")
     
+    # Prebuilt algorithms, appended to the circuit as gate-level operations
+    if 1 < num_qubits <= MAX_ALGORITHM_QUBITS:
+        st.sidebar.subheader(get_text(lang, "algorithms_header"))
+        algorithm_key = st.sidebar.selectbox(
+            get_text(lang, "algorithm_label"),
+            options=ALGORITHMS,
+            format_func=lambda key: get_text(lang, key)
+        )
+        algorithm_value = 0
+        if algorithm_key in ("algorithm_grover", "algorithm_bv"):
+            algorithm_value = int(st.sidebar.number_input(
+                get_text(lang, "grover_marked_label" if algorithm_key == "algorithm_grover" else "bv_secret_label"),
+                min_value=0,
+                max_value=2 ** num_qubits - 1,
+                value=2 ** num_qubits - 1,
+                step=1
+            ))
+            st.sidebar.caption(f"|{algorithm_value:0{num_qubits}b}⟩")
+        elif algorithm_key == "algorithm_dj":
+            algorithm_value = st.sidebar.radio(
+                get_text(lang, "dj_function_label"),
+                options=[0, 1],
+                format_func=lambda v: get_text(lang, "dj_balanced" if v else "dj_constant"),
+                horizontal=True
+            )
+        
+        if st.sidebar.button(get_text(lang, "load_algorithm_btn"), use_container_width=True):
+            algorithm = build_algorithm(algorithm_key, num_qubits, algorithm_value)
+            timeline.extend(algorithm.operations)
+            st.sidebar.success(get_text(lang, "algorithm_loaded_success", name=get_text(lang, algorithm_key),
+                                        count=len(algorithm)))
+        
+        st.sidebar.markdown("---")
+    
    
     if st.sidebar.button(get_text(lang, "reset_btn"), use_container_width=True, type="secondary"):
         simulator.reset()
-        st.session_state.circuit = []
+        st.session_state.timeline = make_timeline(simulator)
         st.sidebar.warning(get_text(lang, "reset_warning"))
         st.rerun()
     
+    # Undo / redo and timeline scrubber; callbacks run before the next script run,
+    # so the simulator read from the timeline above is already the restored one
+    col_undo, col_redo = st.sidebar.columns(2)
+    col_undo.button(get_text(lang, "undo_btn"), on_click=timeline.undo, disabled=not timeline.can_undo,
+                    use_container_width=True)
+    col_redo.button(get_text(lang, "redo_btn"), on_click=timeline.redo, disabled=not timeline.can_redo,
+                    use_container_width=True)
+    if len(timeline):
+        st.session_state.timeline_position = timeline.position
+        st.sidebar.slider(
+            get_text(lang, "timeline_label"),
+            min_value=0,
+            max_value=len(timeline),
+            key="timeline_position",
+            on_change=lambda: st.session_state.timeline.seek(st.session_state.timeline_position),
+            help=get_text(lang, "timeline_help", interval=timeline.checkpoint_interval)
+        )
+        st.sidebar.caption(get_text(lang, "timeline_stats", checkpoints=timeline.memory_footprint()["count"],
+                                    replayed=timeline.gates_replayed, inverted=timeline.gates_inverted))
+    
+    st.sidebar.caption(get_text(lang, "backend_label", backend=get_text(lang, f"backend_{simulator.backend_name}")))
+    st.sidebar.caption(get_text(lang, "memory_footprint_label", used=format_bytes(simulator.memory_footprint()["total"])))
+    if hasattr(simulator, "norm_drift"):
+        st.sidebar.caption(get_text(lang, "norm_drift_label", drift=simulator.norm_drift(),
+                                    count=simulator.renormalizations))
+    if isinstance(simulator, QuantumSimulator):
+        cache_stats = shared_cache().stats()
+        st.sidebar.caption(get_text(lang, "state_cache_label", hit_rate=cache_stats["hit_rate"] * 100,
+                                    used=format_bytes(cache_stats["bytes"]), evictions=cache_stats["evictions"]))
+    
     # Main area
     col_left, col_right = st.columns([2, 1])
     
@@ -396,9 +616,16 @@ def main():
         
         # Histogram pengukuran
         st.subheader(get_text(lang, "measurement_header"))
-        shots = st.slider(get_text(lang, "shots_label"), min_value=100, max_value=10000, value=1000, step=100)
+        shots = st.slider(get_text(lang, "shots_label"), min_value=100, max_value=MAX_SHOTS, value=1000, step=100)
+        measured_qubits = st.multiselect(
+            get_text(lang, "measured_qubits_label"),
+            options=list(range(num_qubits)),
+            default=list(range(min(num_qubits, MAX_MEASURED_QUBITS))),
+            format_func=lambda x: f"Q{x}",
+            help=get_text(lang, "measured_qubits_help")
+        )
         
-        fig_measurement = plot_measurement_histogram(simulator, shots, lang)
+        fig_measurement = plot_measurement_histogram(simulator, shots, lang, measured_qubits or None)
         st.pyplot(fig_measurement)
         
         # Opsi save gambar
@@ -412,6 +639,34 @@ def main():
             file_name="quantum_measurement.png",
             mime="image/png"
         )
+        
+        st.markdown("---")
+        
+        # Bloch sphere dan reduced density matrix per qubit (opsional, satu pass O(n·2^n))
+        if st.checkbox(get_text(lang, "show_bloch")):
+            st.subheader(get_text(lang, "bloch_header"))
+            bloch_qubits = st.multiselect(
+                get_text(lang, "bloch_qubits_label"),
+                options=list(range(num_qubits)),
+                default=list(range(min(num_qubits, MAX_BLOCH_QUBITS))),
+                max_selections=MAX_BLOCH_QUBITS,
+                format_func=lambda x: f"Q{x}"
+            )
+            if bloch_qubits:
+                vectors = bloch_vectors(simulator)
+                st.pyplot(plot_bloch_spheres(vectors, bloch_qubits, lang))
+                st.caption(" · ".join(f"Q{q}: ({vectors[q][0]:+.3f}, {vectors[q][1]:+.3f}, {vectors[q][2]:+.3f})"
+                                      for q in bloch_qubits))
+            
+            rdm_qubits = st.multiselect(
+                get_text(lang, "rdm_qubits_label"),
+                options=list(range(num_qubits)),
+                max_selections=MAX_RDM_QUBITS,
+                format_func=lambda x: f"Q{x}"
+            )
+            if rdm_qubits:
+                display_matrix(reduced_density_matrix(simulator, rdm_qubits),
+                               get_text(lang, "rdm_title", qubits=" ".join(f"Q{q}" for q in rdm_qubits)), lang)
     
     with col_right:
         st.subheader(get_text(lang, "state_info_header"))
@@ -419,12 +674,13 @@ def main():
         # Current state info
         st.markdown(get_text(lang, "current_state"))
         
-        basis_states = [bin(i)[2:].zfill(num_qubits) for i in range(simulator.dim)]
         amplitudes = simulator.get_amplitudes()
         probabilities = simulator.get_probabilities()
+        indices = select_basis_states(probabilities)
+        basis_states = [bin(i)[2:].zfill(num_qubits) for i in indices]
         
         state_str = ""
-        for i, (basis, amp, prob) in enumerate(zip(basis_states, amplitudes, probabilities)):
+        for basis, amp, prob in zip(basis_states, amplitudes[indices], probabilities[indices]):
             if abs(amp) > 1e-10:
                 real = np.real(amp)
                 imag = np.imag(amp)
@@ -445,9 +701,17 @@ def main():
         # Circuit history
         st.markdown(get_text(lang, "circuit_history"))
         
-        if st.session_state.circuit:
-            for i, gate in enumerate(st.session_state.circuit, 1):
-                st.markdown(f"{i}. {gate}")
+        if timeline.position:
+            first = max(0, timeline.position - MAX_HISTORY_ROWS)
+            if first:
+                st.caption(get_text(lang, "history_hidden", count=first))
+            rows = timeline.operations[first:timeline.position]
+            st.markdown("\n".join(f"{i}. {op.describe()}" for i, op in enumerate(rows, first + 1)))
+            
+            # Describes the last forward/backward move: requested gates vs operations that touched the state
+            if timeline.last_run["gates"]:
+                st.caption(get_text(lang, "compile_report", before=timeline.last_run["gates"],
+                                    after=timeline.last_run["passes"], skipped=timeline.last_run["skipped"]))
         else:
             st.info(get_text(lang, "no_gates_applied"))
         
@@ -455,7 +719,7 @@ def main():
         
         # Matrix representation
         if st.checkbox(get_text(lang, "show_matrix")):
-            display_matrix(gate_data['matrix'], gate_name, lang)
+            display_matrix(gate_matrix, gate_label, lang)
     
     # Footer
     st.markdown("---")
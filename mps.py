@@ -0,0 +1,274 @@
+# mps.py
+# Matrix-product-state backend for shallow / low-entanglement circuits.
+# Site i holds qubit i as a tensor (chi_left, 2, chi_right); qubit 0 is the
+# most significant bit as in simulator.py. The MPS is kept in mixed canonical
+# form around `center`, so discarded singular-value weight in a truncated SVD
+# is exactly the squared error of the truncation. Gates on non-adjacent qubits
+# are brought together with adjacent SWAPs and moved back afterwards.
+
+import numpy as np # type: ignore
+
+from simulator import SWAP, _as_controls, _check_controls, check_memory
+from sampler import as_generator
+
+
+# Batas bond dimension dan ambang truncation default (bobot relatif yang boleh dibuang)
+DEFAULT_MAX_BOND = 64
+DEFAULT_CUTOFF = 1e-12
+
+
+def controlled_matrix(gate, num_controls):
+    """Matrix lokal (controls..., target) dengan controls sebagai bit paling signifikan"""
+    local = np.eye(2 ** (num_controls + 1), dtype=complex)
+    local[-2:, -2:] = gate
+    return local
+
+
+class MPSSimulator:
+    """Simulator MPS dengan bond dimension dibatasi; antarmuka gate sama dengan QuantumSimulator"""
+    backend_name = "mps"
+
+    def __init__(self, num_qubits, max_bond=DEFAULT_MAX_BOND, cutoff=DEFAULT_CUTOFF):
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.max_bond = max_bond
+        self.cutoff = cutoff
+        self.version = 0
+        self.reset()
+
+    def reset(self):
+        """Reset ke |0...0⟩ (product state, bond dimension 1)"""
+        self.tensors = []
+        for _ in range(self.num_qubits):
+            site = np.zeros((1, 2, 1), dtype=complex)
+            site[0, 0, 0] = 1.0
+            self.tensors.append(site)
+        self.center = 0
+        self.truncation_error = 0.0
+        self.gate_history = []
+        self.version += 1
+
+    def copy(self):
+        """Salinan independen"""
+        other = object.__new__(MPSSimulator)
+        other.__dict__.update(self.__dict__)
+        other.tensors = [t.copy() for t in self.tensors]
+        other.gate_history = list(self.gate_history)
+        return other
+
+    def bond_dimensions(self):
+        """Bond dimension di antara site berurutan (n - 1 nilai)"""
+        return [t.shape[2] for t in self.tensors[:-1]]
+
+    def memory_footprint(self):
+        """Pemakaian memori tensor (byte)"""
+        nbytes = sum(t.nbytes for t in self.tensors)
+        return {"state": nbytes, "total": nbytes}
+
+    def _move_center(self, site):
+        """Geser pusat kanonik ke site (QR ke kanan, LQ ke kiri)"""
+        while self.center < site:
+            c = self.center
+            left, _, right = self.tensors[c].shape
+            q, r = np.linalg.qr(self.tensors[c].reshape(left * 2, right))
+            self.tensors[c] = q.reshape(left, 2, -1)
+            self.tensors[c + 1] = np.tensordot(r, self.tensors[c + 1], axes=(1, 0))
+            self.center += 1
+        while self.center > site:
+            c = self.center
+            left, _, right = self.tensors[c].shape
+            q, r = np.linalg.qr(self.tensors[c].reshape(left, 2 * right).T)
+            self.tensors[c] = q.T.reshape(-1, 2, right)
+            self.tensors[c - 1] = np.tensordot(self.tensors[c - 1], r.T, axes=(2, 0))
+            self.center -= 1
+
+    def _truncate(self, s):
+        """Jumlah nilai singular yang dipertahankan; tambahkan bobot yang dibuang ke truncation_error"""
+        weights = s ** 2
+        total = weights.sum()
+        # Buang nilai terkecil selama bobot relatif kumulatifnya <= cutoff
+        tail = np.cumsum(weights[::-1])[::-1] / total
+        keep = max(1, int(np.count_nonzero(tail > self.cutoff)))
+        if self.max_bond is not None:
+            keep = min(keep, self.max_bond)
+        self.truncation_error += float(weights[keep:].sum() / total)
+        return keep
+
+    def _apply_local(self, matrix, start, k):
+        """Unitary k-qubit pada site berurutan start..start+k-1 (SVD berurutan dengan truncation)"""
+        self._move_center(start)
+        theta = self.tensors[start]
+        for i in range(1, k):
+            theta = np.tensordot(theta, self.tensors[start + i], axes=(theta.ndim - 1, 0))
+        right = theta.shape[-1]
+        op = np.asarray(matrix, dtype=complex).reshape((2,) * (2 * k))
+        theta = np.tensordot(op, theta, axes=(list(range(k, 2 * k)), list(range(1, k + 1))))
+        theta = np.moveaxis(theta, k, 0)
+        for i in range(k - 1):
+            rows = theta.shape[0] * 2
+            u, s, vh = np.linalg.svd(theta.reshape(rows, -1), full_matrices=False)
+            keep = self._truncate(s)
+            s = s[:keep] / np.linalg.norm(s[:keep])
+            self.tensors[start + i] = u[:, :keep].reshape(-1, 2, keep)
+            theta = (s[:, None] * vh[:keep]).reshape((keep,) + (2,) * (k - 1 - i) + (right,))
+        self.tensors[start + k - 1] = theta.reshape(-1, 2, right)
+        self.center = start + k - 1
+
+    def apply_matrix(self, matrix, qubits):
+        """Unitary k-qubit (qubits[0] = bit paling signifikan); qubit tak berurutan didekatkan dengan SWAP"""
+        self.version += 1
+        qubits = [int(q) for q in qubits]
+        k = len(qubits)
+        if k == 1:
+            self._apply_single(matrix, qubits[0])
+            return
+        order = np.argsort(qubits)
+        positions = [qubits[i] for i in order]
+        # Matrix diurutkan ulang mengikuti urutan site
+        op = np.asarray(matrix, dtype=complex).reshape((2,) * (2 * k))
+        op = op.transpose(list(order) + [k + i for i in order]).reshape(2 ** k, 2 ** k)
+        anchor = positions[0]
+        swaps = []
+        for j in range(1, k):
+            while positions[j] > anchor + j:
+                site = positions[j] - 1
+                self._apply_local(SWAP, site, 2)
+                swaps.append(site)
+                positions[j] -= 1
+        self._apply_local(op, anchor, k)
+        for site in reversed(swaps):
+            self._apply_local(SWAP, site, 2)
+
+    def _apply_single(self, gate, qubit):
+        """Gate 1-qubit langsung pada indeks fisik site (bentuk kanonik tetap)"""
+        self.tensors[qubit] = np.einsum("ab,lbr->lar", np.asarray(gate, dtype=complex), self.tensors[qubit])
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Aplikasikan gate (control_qubit: int atau list untuk multi-control)"""
+        controls = _as_controls(control_qubit)
+        _check_controls(target_qubit, controls)
+        if controls:
+            self.apply_matrix(controlled_matrix(np.asarray(gate_matrix, dtype=complex), len(controls)),
+                              controls + [target_qubit])
+        else:
+            self.version += 1
+            self._apply_single(gate_matrix, target_qubit)
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP dua qubit"""
+        if qubit_a != qubit_b:
+            self.apply_matrix(SWAP, [qubit_a, qubit_b])
+
+    def _bits(self, index):
+        """Bit per qubit dari indeks basis atau string bit (qubit 0 = kiri)"""
+        if isinstance(index, str):
+            return [int(b) for b in index]
+        return [(int(index) >> (self.num_qubits - 1 - q)) & 1 for q in range(self.num_qubits)]
+
+    def amplitude(self, index):
+        """Amplitudo ⟨index|ψ⟩ (indeks integer atau string bit), O(n·chi^2)"""
+        vector = np.ones(1, dtype=complex)
+        for site, bit in zip(self.tensors, self._bits(index)):
+            vector = vector @ site[:, bit, :]
+        return complex(vector[0])
+
+    def get_amplitudes(self):
+        """State vector penuh (hanya untuk register kecil; dicek terhadap anggaran memori)"""
+        check_memory(self.num_qubits)
+        psi = np.ones((1, 1), dtype=complex)
+        for site in self.tensors:
+            psi = np.tensordot(psi, site, axes=(1, 0)).reshape(-1, site.shape[2])
+        return psi.reshape(-1)
+
+    @property
+    def state(self):
+        return self.get_amplitudes()
+
+    def get_probabilities(self):
+        return np.abs(self.get_amplitudes()) ** 2
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal 2^k register (qubits[0] = bit paling signifikan) lewat environment kiri"""
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        register = set(qubits)
+        # env[o] = environment kiri (chi, chi) untuk hasil register o sejauh ini
+        env = np.ones((1, 1, 1), dtype=complex)
+        for q, site in enumerate(self.tensors):
+            branches = [np.einsum("oab,acr,bcs->ors", env, site[:, [b], :], site[:, [b], :].conj())
+                        for b in (0, 1)]
+            if q in register:
+                env = np.stack(branches, axis=1).reshape(-1, site.shape[2], site.shape[2])
+            else:
+                env = branches[0] + branches[1]
+        marginal = np.clip(env[:, 0, 0].real, 0.0, None).reshape((2,) * len(qubits))
+        # Sumbu mengikuti urutan site; urutkan ulang ke urutan register
+        marginal = marginal.transpose([sorted(qubits).index(q) for q in qubits])
+        marginal = marginal.reshape(-1)
+        return marginal / marginal.sum()
+
+    def sample_counts(self, shots, rng=None):
+        """Sampling sempurna: (matrix bit unik (m, n), counts); shot dengan prefix sama dibagi binomial"""
+        rng = as_generator(rng)
+        self._move_center(0)
+        envs = np.ones((1, 1), dtype=complex)
+        counts = np.array([shots])
+        bits = np.zeros((1, 0), dtype=np.uint8)
+        for site in self.tensors:
+            branch = np.einsum("ul,lbr->ubr", envs, site)
+            weights = np.einsum("ubr,ubr->ub", branch, branch.conj()).real
+            p1 = weights[:, 1] / weights.sum(axis=1)
+            ones = rng.binomial(counts, np.clip(p1, 0.0, 1.0))
+            split = [(0, counts - ones), (1, ones)]
+            envs = np.concatenate([branch[c > 0, b] / np.sqrt(weights[c > 0, b])[:, None] for b, c in split])
+            bits = np.concatenate([np.column_stack([bits[c > 0], np.full(np.count_nonzero(c > 0), b, np.uint8)])
+                                   for b, c in split])
+            counts = np.concatenate([c[c > 0] for _, c in split])
+        return bits, counts
+
+    def _register_counts(self, shots, rng, qubits):
+        """Counts sampling untuk register (qubits[0] = bit paling signifikan): (indeks, counts)"""
+        qubits = list(range(self.num_qubits)) if qubits is None else [int(q) for q in qubits]
+        bits, counts = self.sample_counts(shots, rng)
+        # Indeks Python int jika register > 62 qubit
+        dtype = np.int64 if len(qubits) <= 62 else object
+        weights = np.array([1 << (len(qubits) - 1 - i) for i in range(len(qubits))], dtype=dtype)
+        indices = bits[:, qubits].astype(dtype) @ weights
+        unique, inverse = np.unique(indices, return_inverse=True)
+        return unique, np.bincount(inverse.reshape(-1), weights=counts).astype(np.int64)
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """Hasil pengukuran sebagai (indeks basis, counts)"""
+        return self._register_counts(shots, rng, qubits)
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Hasil per shot (indeks basis), urutan acak"""
+        rng = as_generator(rng)
+        indices, counts = self._register_counts(shots, rng, qubits)
+        outcomes = np.repeat(indices, counts)
+        rng.shuffle(outcomes)
+        return outcomes
+
+    def measure_qubit(self, qubit, outcome=None, rng=None):
+        """Ukur satu qubit di tengah circuit: proyeksi di pusat kanonik"""
+        self._move_center(qubit)
+        site = self.tensors[qubit]
+        weights = np.einsum("lbr,lbr->b", site, site.conj()).real
+        if outcome is None:
+            outcome = int(as_generator(rng).random() * weights.sum() < weights[1])
+        if weights[outcome] <= 0:
+            raise ValueError(f"Outcome {outcome} on qubit {qubit} has zero probability")
+        site = site.copy()
+        site[:, 1 - outcome, :] = 0
+        site[:, outcome, :] /= np.sqrt(weights[outcome] / weights.sum())
+        self.tensors[qubit] = site
+        self.version += 1
+        return int(outcome)
+
+    def reset_qubit(self, qubit, outcome=None, rng=None):
+        """Reset satu qubit ke |0⟩ (ukur lalu X jika hasilnya 1)"""
+        outcome = self.measure_qubit(qubit, outcome, rng)
+        if outcome:
+            self.apply_gate(np.array([[0, 1], [1, 0]], dtype=complex), qubit)
+        return outcome
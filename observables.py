@@ -0,0 +1,230 @@
+# observables.py
+# Pauli-string observables and Hamiltonians. A Pauli string acts on a basis
+# state as P|x⟩ = i^nY (-1)^|x & z| |x ^ m⟩ (m = X/Y qubits, z = Z/Y qubits), so
+# ⟨ψ|P|ψ⟩ is one blocked pass over ψ and a bit-flipped view of ψ (negative
+# strides, no full copy). Terms with the same flip pattern share that pass: it produces a
+# small correlation tensor over their Z qubits from which each term is read
+# off. Works on a single state (2^n) or batched states (batch, 2^n).
+
+import numpy as np # type: ignore
+
+from sampler import as_generator
+from simulator import HADAMARD
+
+
+PAULI_LABELS = "IXYZ"
+
+# Batas qubit Z gabungan per pass (tensor korelasi 2^k per anggota batch)
+MAX_CORRELATION_QUBITS = 12
+
+# Qubit per blok kerja (2^16 amplitudo termasuk batch, ramah cache)
+BLOCK_QUBITS = 16
+
+# Rotasi basis ukur: X -> H, Y -> H·S†
+_BASIS_CHANGE = {"X": HADAMARD, "Y": HADAMARD @ np.diag([1, -1j])}
+
+
+class PauliString:
+    """Produk Pauli dengan koefisien real, mis. PauliString("XIZ", 0.5) atau PauliString({0: "X", 2: "Z"})"""
+    def __init__(self, paulis, coefficient=1.0):
+        if isinstance(paulis, str):
+            paulis = {q: p for q, p in enumerate(paulis.upper())}
+        self.paulis = {int(q): p.upper() for q, p in sorted(paulis.items()) if p.upper() != "I"}
+        invalid = [p for p in self.paulis.values() if p not in PAULI_LABELS]
+        if invalid:
+            raise ValueError(f"Unknown Pauli label(s) {invalid}, expected one of {PAULI_LABELS}")
+        self.coefficient = float(coefficient)
+
+    @property
+    def qubits(self):
+        """Qubit dengan Pauli non-identitas"""
+        return list(self.paulis)
+
+    @property
+    def flip_qubits(self):
+        """Qubit yang dibalik bitnya (X dan Y)"""
+        return tuple(q for q, p in self.paulis.items() if p in "XY")
+
+    @property
+    def phase_qubits(self):
+        """Qubit yang memberi tanda (-1)^bit (Z dan Y)"""
+        return tuple(q for q, p in self.paulis.items() if p in "YZ")
+
+    def commutes_qubitwise(self, other):
+        """True jika di setiap qubit Pauli-nya sama atau salah satunya identitas"""
+        return all(other.paulis.get(q, p) == p for q, p in self.paulis.items())
+
+    def matrix(self, num_qubits):
+        """Matrix 2^n (hanya untuk verifikasi register kecil)"""
+        singles = {"X": np.array([[0, 1], [1, 0]]), "Y": np.array([[0, -1j], [1j, 0]]), "Z": np.diag([1, -1])}
+        out = np.ones((1, 1), dtype=complex)
+        for q in range(num_qubits):
+            out = np.kron(out, singles.get(self.paulis.get(q), np.eye(2)))
+        return self.coefficient * out
+
+    def __str__(self):
+        label = " ".join(f"{p}{q}" for q, p in self.paulis.items()) or "I"
+        return f"{self.coefficient:g}·{label}"
+
+    def __repr__(self):
+        return f"PauliString({self.paulis!r}, {self.coefficient!r})"
+
+
+class Hamiltonian:
+    """Jumlah berbobot PauliString"""
+    def __init__(self, terms):
+        self.terms = [t if isinstance(t, PauliString) else PauliString(*t) for t in terms]
+
+    @classmethod
+    def from_dict(cls, terms):
+        """Dari dict label -> koefisien, mis. {"ZZI": -1.0, "XII": 0.5}"""
+        return cls([PauliString(label, coefficient) for label, coefficient in terms.items()])
+
+    def qubitwise_commuting_groups(self):
+        """Partisi greedy menjadi grup yang saling komut per qubit (satu basis ukur per grup)"""
+        groups = []
+        for term in sorted(self.terms, key=lambda t: -len(t.paulis)):
+            for group in groups:
+                if all(term.commutes_qubitwise(other) for other in group):
+                    group.append(term)
+                    break
+            else:
+                groups.append([term])
+        return groups
+
+    def matrix(self, num_qubits):
+        """Matrix 2^n (hanya untuk verifikasi register kecil)"""
+        return sum(t.matrix(num_qubits) for t in self.terms)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def __iter__(self):
+        return iter(self.terms)
+
+    def __str__(self):
+        return " + ".join(str(t) for t in self.terms)
+
+
+def _as_terms(observable):
+    """Daftar PauliString dari PauliString, Hamiltonian, atau dict label -> koefisien"""
+    if isinstance(observable, PauliString):
+        return [observable]
+    if isinstance(observable, dict):
+        return Hamiltonian.from_dict(observable).terms
+    return list(observable)
+
+
+def _flip_passes(terms):
+    """Indeks term per pola flip; grup dipecah jika qubit Z gabungan > MAX_CORRELATION_QUBITS"""
+    passes = {}
+    for i, term in enumerate(terms):
+        groups = passes.setdefault(term.flip_qubits, [])
+        for group in groups:
+            if len(group["zs"] | set(term.phase_qubits)) <= MAX_CORRELATION_QUBITS:
+                group["zs"] |= set(term.phase_qubits)
+                group["terms"].append(i)
+                break
+        else:
+            groups.append({"zs": set(term.phase_qubits), "terms": [i]})
+    return [(flips, sorted(g["zs"]), g["terms"]) for flips, groups in passes.items() for g in groups]
+
+
+def pauli_expectations(states, terms):
+    """Nilai ⟨P⟩ (tanpa koefisien) per term untuk states (batch, 2^n): array (len(terms), batch)"""
+    batch, dim = states.shape
+    n = dim.bit_length() - 1
+    # Qubit belakang per blok (sementara conj(ψ[x ^ m])·ψ[x] hanya seukuran blok)
+    tail = max(0, min(n, BLOCK_QUBITS - int(np.ceil(np.log2(batch)))))
+    lead = n - tail
+    psi = states.reshape((batch, 2 ** lead) + (2,) * tail)
+    values = np.zeros((len(terms), batch))
+    for flips, zs, group in _flip_passes(terms):
+        lead_flip = sum(1 << (lead - 1 - q) for q in flips if q < lead)
+        tail_flip = (slice(None),) + tuple(slice(None, None, -1) if lead + a in flips else slice(None)
+                                           for a in range(tail))
+        summed = tuple(1 + a for a in range(tail) if lead + a not in zs)
+        # Korelasi (batch, 2^|zs|) dari conj(ψ[x ^ m])·ψ[x], dijumlah di luar qubit Z
+        corr = np.zeros((batch,) + (2,) * len(zs), dtype=complex)
+        for block in range(2 ** lead):
+            partner = psi[:, block ^ lead_flip][tail_flip]
+            part = (np.conj(partner) * psi[:, block]).sum(axis=summed, dtype=complex)
+            index = tuple((block >> (lead - 1 - q)) & 1 if q < lead else slice(None) for q in zs)
+            corr[(slice(None),) + index] += part
+        for i in group:
+            term = terms[i]
+            signs = np.ones((2,) * len(zs))
+            for j, q in enumerate(zs):
+                if q in term.phase_qubits:
+                    shape = [1] * len(zs)
+                    shape[j] = 2
+                    signs = signs * np.array([1.0, -1.0]).reshape(shape)
+            total = np.tensordot(corr, signs, axes=(list(range(1, len(zs) + 1)), list(range(len(zs)))))
+            # P|x⟩ = i^nY (-1)^|x & z| |x ^ m⟩
+            num_y = len(set(term.flip_qubits) & set(term.phase_qubits))
+            values[i] = (1j ** num_y * total).real
+    return values
+
+
+def apply_observable(states, observable):
+    """H|ψ⟩ untuk states (batch, 2^n) atau (2^n,): Σ c · i^nY · flip((-1)^|x & z| ψ), satu pass per term"""
+    states = np.asarray(states)
+    shape = states.shape
+    batch = 1 if states.ndim == 1 else shape[0]
+    n = shape[-1].bit_length() - 1
+    psi = states.reshape((batch,) + (2,) * n)
+    out = np.zeros_like(psi)
+    for term in _as_terms(observable):
+        signed = psi.copy() if term.phase_qubits else psi
+        for q in term.phase_qubits:
+            signed[(slice(None),) * (q + 1) + (1,)] *= -1
+        flip = (slice(None),) + tuple(slice(None, None, -1) if q in term.flip_qubits else slice(None) for q in range(n))
+        num_y = len(set(term.flip_qubits) & set(term.phase_qubits))
+        out += term.coefficient * 1j ** num_y * signed[flip]
+    return out.reshape(shape)
+
+
+def expectation(target, observable):
+    """⟨ψ|H|ψ⟩ eksak untuk PauliString / Hamiltonian / dict label -> koefisien
+
+    target: QuantumSimulator, BatchedSimulator, AutoSimulator (lewat get_amplitudes), atau array
+    state (2^n) / (batch, 2^n). Hasil float untuk satu state, array (batch,) untuk state batch.
+    """
+    if hasattr(target, "state"):
+        states = np.asarray(target.state)
+    elif hasattr(target, "get_amplitudes"):
+        states = np.asarray(target.get_amplitudes())
+    else:
+        states = np.asarray(target)
+    single = states.ndim == 1
+    states = states.reshape(1, -1) if single else states
+    terms = _as_terms(observable)
+    coefficients = np.array([t.coefficient for t in terms])
+    total = coefficients @ pauli_expectations(states, terms) if terms else np.zeros(len(states))
+    return float(total[0]) if single else total
+
+
+def estimate_expectation(simulator, observable, shots=1000, rng=None):
+    """Estimasi ⟨H⟩ dari shot: satu basis ukur (dan satu set shot) per grup qubitwise-commuting"""
+    rng = as_generator(rng)
+    terms = _as_terms(observable)
+    total = 0.0
+    for group in Hamiltonian(terms).qubitwise_commuting_groups():
+        bases = {}
+        for term in group:
+            bases.update(term.paulis)
+        support = sorted(bases)
+        if not support:
+            total += sum(t.coefficient for t in group)
+            continue
+        rotated = simulator.copy()
+        for q, p in bases.items():
+            if p in _BASIS_CHANGE:
+                rotated.apply_gate(_BASIS_CHANGE[p], q)
+        indices, counts = rotated.measure_counts(shots, rng, qubits=support)
+        bits = (indices[:, None] >> (len(support) - 1 - np.arange(len(support)))) & 1
+        for term in group:
+            mask = np.isin(support, term.qubits)
+            signs = 1 - 2 * (bits[:, mask].sum(axis=1) & 1)
+            total += term.coefficient * float(signs @ counts) / shots
+    return total
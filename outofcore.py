@@ -0,0 +1,287 @@
+# outofcore.py
+# Out-of-core state vector: amplitudes live in an np.memmap file and gates are
+# queued, then applied in passes. The last c qubits index contiguous chunks of
+# 2^c amplitudes; a pass loads, for each assignment of the remaining high bits,
+# a slab of 2^h chunks (h "high" qubits chosen for that pass), runs every queued
+# gate that fits on that slab with the in-RAM QuantumSimulator kernels and
+# writes it back. Gates are reordered (commuting only) so that each pass over
+# the file does as much work as possible. Disk traffic is reported per run.
+
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+import numpy as np # type: ignore
+
+from simulator import QuantumSimulator, MemoryBudgetError, _as_controls, _check_controls
+from circuit import Operation, apply_operation
+from sampler import Sampler, as_generator
+
+
+# Ukuran slab dalam RAM per pass (byte) dan jumlah qubit tinggi per pass
+BLOCK_BYTES = 64 * 2 ** 20
+HIGH_QUBITS = 3
+
+
+def schedule_passes(ops, chunk_start, max_high=HIGH_QUBITS):
+    """Kelompokkan operasi ke pass: [(qubit tinggi, operasi)], urutan hanya ditukar untuk operasi yang komut
+
+    Operasi masuk ke pass saat ini jika qubit tinggi gabungannya <= max_high dan tidak
+    menyentuh qubit operasi yang sudah ditunda (yang harus dijalankan lebih dulu).
+    """
+    passes = []
+    pending = list(ops)
+    while pending:
+        high, taken, deferred, blocked = set(), [], [], set()
+        for op in pending:
+            qubits = set(op.qubits)
+            op_high = {q for q in qubits if q < chunk_start}
+            if len(op_high) > max_high:
+                raise ValueError(f"Operation {op.describe()} touches {len(op_high)} high qubits, "
+                                 f"at most {max_high} per pass")
+            if not qubits & blocked and len(high | op_high) <= max_high:
+                high |= op_high
+                taken.append(op)
+            else:
+                deferred.append(op)
+                blocked |= qubits
+        passes.append((sorted(high), taken))
+        pending = deferred
+    return passes
+
+
+class MemmapSimulator:
+    """Simulator state vector di file np.memmap (register lebih besar dari RAM)"""
+    backend_name = "memmap"
+
+    def __init__(self, num_qubits, path=None, block_bytes=BLOCK_BYTES, high_qubits=HIGH_QUBITS, dtype=complex):
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.dtype = np.dtype(dtype)
+        nbytes = self.dim * self.dtype.itemsize
+        directory = os.path.dirname(os.path.abspath(path)) if path else tempfile.gettempdir()
+        free = shutil.disk_usage(directory).free
+        if nbytes > free:
+            raise MemoryBudgetError(f"The {num_qubits}-qubit state file needs {nbytes / 2 ** 30:.2f} GiB of disk, "
+                                    f"only {free / 2 ** 30:.2f} GiB free in {directory}")
+        # Qubit per slab (B), qubit tinggi per pass (h), qubit chunk berurutan (c = B - h)
+        self.block_qubits = min(num_qubits, max(1, int(np.log2(block_bytes // self.dtype.itemsize))))
+        self.high_qubits = min(high_qubits, self.block_qubits)
+        self.chunk_qubits = self.block_qubits - self.high_qubits
+        self._finalizer = None
+        if path is None:
+            handle, path = tempfile.mkstemp(suffix=".state")
+            os.close(handle)
+            # File sementara dihapus juga jika simulator dibuang tanpa close()
+            self._finalizer = weakref.finalize(self, os.unlink, path)
+        self.path = path
+        self._memmap = np.memmap(path, dtype=self.dtype, mode="w+", shape=(self.dim,))
+        self._local_sims = {}
+        self.version = 0
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Tutup file state (dihapus jika file sementara)"""
+        if self._memmap is None:
+            return
+        self._memmap.flush()
+        self._memmap = None
+        if self._finalizer is not None:
+            self._finalizer()
+
+    def reset(self):
+        """Reset state ke |0...0⟩ dan statistik I/O"""
+        self.pending = []
+        self._memmap[:] = 0
+        self._memmap[0] = 1.0
+        self._memmap.flush()
+        self.gate_history = []
+        self.io = {"passes": 0, "bytes_read": 0, "bytes_written": 0, "read_seconds": 0.0, "write_seconds": 0.0}
+        self.version += 1
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Antrekan gate (control_qubit: int atau list); dijalankan saat flush()"""
+        controls = _as_controls(control_qubit)
+        _check_controls(target_qubit, controls)
+        self.pending.append(Operation("U", [target_qubit], controls, matrix=gate_matrix))
+        self.version += 1
+
+    def apply_matrix(self, matrix, qubits):
+        """Antrekan unitary k-qubit (qubits[0] = bit paling signifikan)"""
+        self.pending.append(Operation("U", list(qubits), matrix=matrix))
+        self.version += 1
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """Antrekan SWAP"""
+        self.pending.append(Operation("SWAP", [qubit_a, qubit_b]))
+        self.version += 1
+
+    def _local_sim(self, num_qubits):
+        """QuantumSimulator in-RAM untuk slab (dipakai ulang; tanpa renormalisasi per slab)"""
+        if num_qubits not in self._local_sims:
+            sim = QuantumSimulator(num_qubits, precision=self.dtype)
+            sim.norm_tolerance = np.inf
+            self._local_sims[num_qubits] = sim
+        return self._local_sims[num_qubits]
+
+    def _read(self, view):
+        """Salin view memmap ke RAM (dicatat sebagai byte baca)"""
+        start = time.perf_counter()
+        data = np.array(view)
+        self.io["read_seconds"] += time.perf_counter() - start
+        self.io["bytes_read"] += data.nbytes
+        return data
+
+    def _write(self, view, data):
+        """Tulis kembali ke memmap (dicatat sebagai byte tulis)"""
+        start = time.perf_counter()
+        view[...] = data
+        self.io["write_seconds"] += time.perf_counter() - start
+        self.io["bytes_written"] += data.nbytes
+
+    def _sync(self):
+        """Flush halaman kotor ke disk (waktu dihitung sebagai waktu tulis)"""
+        start = time.perf_counter()
+        self._memmap.flush()
+        self.io["write_seconds"] += time.perf_counter() - start
+
+    def _run_pass(self, high, ops):
+        """Satu pass: setiap slab (2^|high| chunk) dibaca, semua ops dijalankan, ditulis kembali"""
+        n = self.num_qubits
+        top = n - self.chunk_qubits
+        rest = [q for q in range(top) if q not in high]
+        mapping = {q: i for i, q in enumerate(high)}
+        mapping.update({q: len(high) + q - top for q in range(top, n)})
+        local_ops = [op.remap(mapping) for op in ops]
+        sim = self._local_sim(len(high) + self.chunk_qubits)
+        tensor = self._memmap.reshape((2,) * top + (2 ** self.chunk_qubits,))
+        for bits in range(2 ** len(rest)):
+            index = [slice(None)] * top
+            for j, q in enumerate(rest):
+                index[q] = (bits >> (len(rest) - 1 - j)) & 1
+            view = tensor[tuple(index)]
+            sim.state = self._read(view).reshape(-1)
+            for op in local_ops:
+                apply_operation(sim, op)
+            self._write(view, sim.state.reshape(view.shape))
+        self.io["passes"] += 1
+
+    def flush(self):
+        """Jalankan semua gate yang diantrekan dalam pass sesedikit mungkin"""
+        if not self.pending:
+            return
+        ops, self.pending = self.pending, []
+        for high, pass_ops in schedule_passes(ops, self.num_qubits - self.chunk_qubits, self.high_qubits):
+            self._run_pass(high, pass_ops)
+        self._sync()
+
+    def _blocks(self):
+        """Iterasi blok berurutan 2^B amplitudo: (indeks blok, view memmap)"""
+        size = 2 ** self.block_qubits
+        for block in range(self.dim // size):
+            yield block, self._memmap[block * size:(block + 1) * size]
+
+    @property
+    def state(self):
+        """State vector sebagai memmap (gate tertunda di-flush dulu; membaca berarti I/O disk)"""
+        self.flush()
+        return self._memmap
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal register (qubits[0] = bit paling signifikan), satu pass baca"""
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        self.flush()
+        top = self.num_qubits - self.block_qubits
+        local = [q - top for q in qubits if q >= top]
+        marginal = np.zeros((2,) * len(qubits))
+        axes = list(range(self.block_qubits + 1))
+        for block, view in self._blocks():
+            data = self._read(view)
+            parts = data.view(np.finfo(self.dtype).dtype).reshape((2,) * self.block_qubits + (2,))
+            weights = np.einsum(parts, axes, parts, axes, local, dtype=float)
+            index = tuple((block >> (top - 1 - q)) & 1 if q < top else slice(None) for q in qubits)
+            marginal[index] += weights
+        marginal = marginal.reshape(-1)
+        return marginal / marginal.sum()
+
+    def get_probabilities(self):
+        """Probabilitas seluruh basis state (array 2^n float di RAM)"""
+        return self.marginal_probabilities(range(self.num_qubits))
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """(indeks, counts); tanpa qubits: multinomial per blok lalu di dalam blok (tanpa vektor 2^n)"""
+        rng = as_generator(rng)
+        if qubits is not None:
+            return Sampler(self.marginal_probabilities(qubits)).counts(shots, rng)
+        self.flush()
+        weights = np.array([float(np.vdot(data, data).real) for data in (self._read(v) for _, v in self._blocks())])
+        per_block = rng.multinomial(shots, weights / weights.sum())
+        size = 2 ** self.block_qubits
+        indices, counts = [], []
+        for (block, view), block_shots in zip(self._blocks(), per_block):
+            if block_shots:
+                local, hits = Sampler(np.abs(self._read(view)) ** 2).counts(int(block_shots), rng)
+                indices.append(local + block * size)
+                counts.append(hits)
+        return np.concatenate(indices), np.concatenate(counts)
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Hasil per shot (indeks basis), urutan acak"""
+        rng = as_generator(rng)
+        indices, counts = self.measure_counts(shots, rng, qubits)
+        outcomes = np.repeat(indices, counts)
+        rng.shuffle(outcomes)
+        return outcomes
+
+    def measure_qubit(self, qubit, outcome=None, rng=None):
+        """Ukur satu qubit di tengah circuit: satu pass proyeksi per blok"""
+        p1 = self.marginal_probabilities([qubit])[1]
+        if outcome is None:
+            outcome = int(as_generator(rng).random() < p1)
+        weight = p1 if outcome else 1 - p1
+        if weight <= 0:
+            raise ValueError(f"Outcome {outcome} on qubit {qubit} has zero probability")
+        top = self.num_qubits - self.block_qubits
+        for block, view in self._blocks():
+            if qubit < top:
+                keep = ((block >> (top - 1 - qubit)) & 1) == outcome
+                self._write(view, self._read(view) / np.sqrt(weight) if keep else np.zeros_like(view))
+                continue
+            data = self._read(view)
+            halves = data.reshape(2 ** (qubit - top), 2, -1)
+            halves[:, 1 - outcome, :] = 0
+            halves[:, outcome, :] /= np.sqrt(weight)
+            self._write(view, data)
+        self._sync()
+        self.version += 1
+        return int(outcome)
+
+    def reset_qubit(self, qubit, outcome=None, rng=None):
+        """Reset satu qubit ke |0⟩ (ukur lalu X jika hasilnya 1)"""
+        outcome = self.measure_qubit(qubit, outcome, rng)
+        if outcome:
+            self.apply_gate(np.array([[0, 1], [1, 0]], dtype=complex), qubit)
+        return outcome
+
+    def io_report(self):
+        """Statistik I/O disk: pass, byte, detik dan bandwidth (MB/s)"""
+        report = dict(self.io)
+        report["file_bytes"] = self.dim * self.dtype.itemsize
+        report["read_mb_s"] = report["bytes_read"] / 1e6 / max(report["read_seconds"], 1e-9)
+        report["write_mb_s"] = report["bytes_written"] / 1e6 / max(report["write_seconds"], 1e-9)
+        return report
+
+    def memory_footprint(self):
+        """Pemakaian memori RAM (slab) dan disk (file state), byte"""
+        slab = 2 ** self.block_qubits * self.dtype.itemsize
+        return {"slab": 2 * slab, "disk": self.dim * self.dtype.itemsize, "total": 2 * slab}
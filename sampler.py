@@ -0,0 +1,54 @@
+# sampler.py
+# Sampling subsystem for measurement: cumulative distribution built once per
+# state, binary-search sampling per shot, or counts via one multinomial draw.
+
+import numpy as np # type: ignore
+
+
+def as_generator(rng=None):
+    """numpy.random.Generator dari None, seed integer, atau Generator yang sudah ada"""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    return np.random.default_rng(rng)
+
+
+class Sampler:
+    """Sampler untuk satu distribusi probabilitas; CDF dibuat sekali lalu dipakai ulang"""
+    def __init__(self, probabilities):
+        # Hanya CDF yang disimpan (satu array float64 seukuran 2^n)
+        self.cdf = np.cumsum(np.asarray(probabilities, dtype=float))
+        self.cdf /= self.cdf[-1]
+        self.dim = len(self.cdf)
+
+    @property
+    def nbytes(self):
+        """Memori yang dipakai CDF (byte)"""
+        return self.cdf.nbytes
+
+    def probabilities(self):
+        """Probabilitas ternormalisasi (diturunkan dari CDF)"""
+        return np.diff(self.cdf, prepend=0.0)
+
+    def sample(self, shots, rng=None):
+        """Hasil per shot (indeks basis), urutan acak seperti draw independen"""
+        rng = as_generator(rng)
+        if shots >= self.dim:
+            # Counts multinomial lalu diulang per indeks: O(2^n + shots)
+            indices, counts = self.counts(shots, rng)
+            outcomes = np.repeat(indices, counts)
+        else:
+            # Binary search dengan draw terurut (akses CDF berurutan, ramah cache)
+            draws = np.sort(rng.random(shots))
+            outcomes = np.minimum(np.searchsorted(self.cdf, draws, side="right"), self.dim - 1)
+        rng.shuffle(outcomes)
+        return outcomes
+
+    def counts(self, shots, rng=None):
+        """Jumlah kemunculan (indeks, counts) tanpa membuat array per shot"""
+        rng = as_generator(rng)
+        if shots >= self.dim:
+            # Satu draw multinomial: O(2^n), tidak bergantung pada jumlah shot
+            counts = rng.multinomial(shots, np.clip(self.probabilities(), 0.0, None))
+            indices = np.flatnonzero(counts)
+            return indices, counts[indices]
+        return np.unique(self.sample(shots, rng), return_counts=True)
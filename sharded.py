@@ -0,0 +1,392 @@
+# sharded.py
+# Sharded state-vector execution: the 2^n amplitudes are split into 2^k shards
+# of 2^(n-k) amplitudes. The first k physical axes ("global" qubits) select the
+# shard and the rest ("local" qubits) index inside it. Gates on local qubits run
+# independently per shard; a gate on a global qubit first swaps it with a local
+# qubit (exchange step between shard pairs) and relabels the layout.
+#
+# Data movement goes through a transport: SharedMemoryTransport keeps all shards
+# in one multiprocessing.shared_memory block owned by worker processes, and
+# LocalTransport is the in-process stand-in with explicit message copies (the
+# shape a multi-node transport would take).
+
+import os
+import weakref
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np # type: ignore
+
+from simulator import _as_controls, _check_controls, _is_diagonal, check_memory
+from sampler import Sampler, as_generator
+
+
+# Minimal qubit lokal: satu gate 2-qubit + satu slot tukar
+MIN_LOCAL_QUBITS = 2
+
+
+def _shard_view(chunk, num_local, axes):
+    """View (2,)*num_local dari satu shard dengan sumbu axes dipindah ke depan"""
+    return np.moveaxis(chunk.reshape((2,) * num_local), list(axes), list(range(len(axes))))
+
+
+def _gate_kernel(chunks, shard, gate, axis, local_controls, shard_mask, num_local):
+    """Gate 1-qubit pada sumbu lokal shard (kontrol global menyaring shard, kontrol lokal diiris)"""
+    if shard & shard_mask != shard_mask:
+        return None
+    view = _shard_view(chunks[shard], num_local, [axis] + list(local_controls))
+    view = view[(slice(None),) + (1,) * len(local_controls)]
+    # view[0, ...] tetap view 0-d yang bisa ditulis walau semua sumbu lokal sudah terpakai
+    a0, a1 = view[0, ...], view[1, ...]
+    tmp = a0.copy()
+    a0 *= gate[0, 0]
+    a0 += gate[0, 1] * a1
+    a1 *= gate[1, 1]
+    a1 += gate[1, 0] * tmp
+    return None
+
+
+def _scale_kernel(chunks, shard, factors, shard_bit, shard_mask):
+    """Gate diagonal pada qubit global: seluruh shard dikali satu faktor"""
+    if shard & shard_mask == shard_mask:
+        chunks[shard] *= factors[1 if shard & shard_bit else 0]
+    return None
+
+
+def _matrix_kernel(chunks, shard, matrix, axes, num_local):
+    """Unitary k-qubit pada sumbu-sumbu lokal shard (tensordot lokal)"""
+    k = len(axes)
+    view = _shard_view(chunks[shard], num_local, axes)
+    op = matrix.reshape((2,) * (2 * k))
+    view[...] = np.tensordot(op, view, axes=(list(range(k, 2 * k)), list(range(k))))
+    return None
+
+
+def _weights_kernel(chunks, shard, axes, num_local):
+    """Σ|a|^2 shard per nilai sumbu lokal register (urutan axes)"""
+    chunk = chunks[shard]
+    parts = chunk.view(np.finfo(chunk.dtype).dtype).reshape((2,) * num_local + (2,))
+    index = list(range(num_local + 1))
+    return np.einsum(parts, index, parts, index, list(axes), dtype=float)
+
+
+def _project_kernel(chunks, shard, axis, outcome, shard_bit, scale, num_local):
+    """Proyeksi hasil ukur: nolkan amplitudo yang tidak cocok (sumbu lokal atau shard global)"""
+    chunk = chunks[shard]
+    if axis is None:
+        if bool(shard & shard_bit) != bool(outcome):
+            chunk[...] = 0
+        else:
+            chunk *= scale
+        return None
+    view = _shard_view(chunk, num_local, [axis])
+    view[1 - outcome] = 0
+    view[outcome] *= scale
+    return None
+
+
+def _exchange_kernel(chunks, shard, shard_bit, axis, num_local):
+    """Tukar setengah lokal antar pasangan shard: (bit global 0, lokal 1) <-> (bit global 1, lokal 0)"""
+    if shard & shard_bit:
+        return None
+    lower = _shard_view(chunks[shard], num_local, [axis])[1]
+    upper = _shard_view(chunks[shard | shard_bit], num_local, [axis])[0]
+    tmp = lower.copy()
+    lower[...] = upper
+    upper[...] = tmp
+    return None
+
+
+class LocalTransport:
+    """Transport in-process: shard sebagai array terpisah, exchange lewat salinan pesan"""
+    def __init__(self, num_shards, shard_size, dtype=complex):
+        self.num_shards = num_shards
+        self.chunks = [np.zeros(shard_size, dtype=dtype) for _ in range(num_shards)]
+
+    def run(self, func, *args):
+        """Jalankan kernel pada setiap shard; hasil per shard"""
+        return [func(self.chunks, shard, *args) for shard in range(self.num_shards)]
+
+    def exchange(self, shard_bit, axis, num_local):
+        """Kirim setengah shard ke pasangannya sebagai buffer (send/recv), lalu tulis"""
+        for shard in range(self.num_shards):
+            if shard & shard_bit:
+                continue
+            partner = shard | shard_bit
+            send = _shard_view(self.chunks[shard], num_local, [axis])[1].copy()
+            recv = _shard_view(self.chunks[partner], num_local, [axis])[0].copy()
+            _shard_view(self.chunks[shard], num_local, [axis])[1] = recv
+            _shard_view(self.chunks[partner], num_local, [axis])[0] = send
+
+    def gather(self):
+        """Salinan seluruh state (urutan shard)"""
+        return np.concatenate(self.chunks)
+
+    def scatter(self, state):
+        """Tulis state penuh ke shard"""
+        for shard, chunk in enumerate(np.split(np.asarray(state), self.num_shards)):
+            self.chunks[shard][...] = chunk
+
+    def close(self):
+        self.chunks = []
+
+
+def _worker_loop(name, shape, dtype, shards, conn):
+    """Proses worker: attach ke shared memory, jalankan kernel untuk shard miliknya"""
+    shm = shared_memory.SharedMemory(name=name)
+    chunks = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    try:
+        while True:
+            message = conn.recv()
+            if message is None:
+                break
+            func, args = message
+            conn.send([func(chunks, shard, *args) for shard in shards])
+    finally:
+        del chunks
+        shm.close()
+
+
+def _shutdown(processes, conns, shm):
+    """Hentikan worker dan bebaskan shared memory"""
+    for conn in conns:
+        try:
+            conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+    shm.close()
+    shm.unlink()
+
+
+class SharedMemoryTransport:
+    """Transport shared memory: shard dalam satu blok bersama, dibagi rata ke proses worker"""
+    def __init__(self, num_shards, shard_size, dtype=complex, workers=None):
+        self.num_shards = num_shards
+        dtype = np.dtype(dtype)
+        self.shm = shared_memory.SharedMemory(create=True, size=num_shards * shard_size * dtype.itemsize)
+        self.chunks = np.ndarray((num_shards, shard_size), dtype=dtype, buffer=self.shm.buf)
+        self.chunks[...] = 0
+        workers = max(1, min(workers or os.cpu_count() or 1, num_shards))
+        owned = np.array_split(np.arange(num_shards), workers)
+        self.owners = [list(map(int, shards)) for shards in owned]
+        self.conns = []
+        self.processes = []
+        for shards in self.owners:
+            parent, child = mp.Pipe()
+            process = mp.Process(target=_worker_loop, args=(self.shm.name, self.chunks.shape, dtype, shards, child),
+                                 daemon=True)
+            process.start()
+            self.conns.append(parent)
+            self.processes.append(process)
+        self._finalizer = weakref.finalize(self, _shutdown, self.processes, self.conns, self.shm)
+
+    def run(self, func, *args):
+        """Broadcast kernel ke semua worker dan tunggu; hasil per shard"""
+        for conn in self.conns:
+            conn.send((func, args))
+        results = [None] * self.num_shards
+        for conn, shards in zip(self.conns, self.owners):
+            for shard, result in zip(shards, conn.recv()):
+                results[shard] = result
+        return results
+
+    def exchange(self, shard_bit, axis, num_local):
+        """Exchange langsung di shared memory (pasangan shard disjoint, tanpa salinan pesan)"""
+        self.run(_exchange_kernel, shard_bit, axis, num_local)
+
+    def gather(self):
+        return self.chunks.reshape(-1).copy()
+
+    def scatter(self, state):
+        self.chunks.reshape(-1)[...] = state
+
+    def close(self):
+        del self.chunks
+        self._finalizer()
+
+
+TRANSPORTS = {"shared": SharedMemoryTransport, "local": LocalTransport}
+
+
+class ShardedSimulator:
+    """State vector ter-shard di banyak proses; antarmuka gate sama dengan QuantumSimulator"""
+    backend_name = "sharded"
+
+    def __init__(self, num_qubits, num_shards=None, transport="shared", workers=None, memory_budget=None):
+        check_memory(num_qubits, complex, memory_budget)
+        if num_shards is None:
+            num_shards = 1 << max(0, (os.cpu_count() or 1).bit_length() - 1)
+        global_qubits = int(num_shards).bit_length() - 1
+        if num_shards != 1 << global_qubits or num_qubits - global_qubits < MIN_LOCAL_QUBITS:
+            raise ValueError(f"num_shards must be a power of two leaving at least {MIN_LOCAL_QUBITS} local qubits, "
+                             f"got {num_shards} for {num_qubits} qubits")
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.num_shards = num_shards
+        self.global_qubits = global_qubits
+        self.num_local = num_qubits - global_qubits
+        if transport == "shared":
+            self.transport = SharedMemoryTransport(num_shards, 2 ** self.num_local, complex, workers)
+        else:
+            self.transport = TRANSPORTS[transport](num_shards, 2 ** self.num_local, complex)
+        self.exchanges = 0
+        self.version = 0
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Hentikan worker dan bebaskan shared memory"""
+        self.transport.close()
+
+    def reset(self):
+        """Reset state ke |0...0⟩ dan layout identitas"""
+        state = np.zeros(self.dim, dtype=complex)
+        state[0] = 1.0
+        self.layout = list(range(self.num_qubits))
+        self.transport.scatter(state)
+        self.gate_history = []
+        self.version += 1
+
+    def _shard_bit(self, axis):
+        """Bit indeks shard untuk sumbu fisik global"""
+        return 1 << (self.global_qubits - 1 - axis)
+
+    def _localize(self, qubits, keep=()):
+        """Pastikan qubit logis ini berada di sumbu lokal (exchange dengan sumbu lokal yang bebas)"""
+        busy = {self.layout[q] for q in list(qubits) + list(keep)}
+        needed = sum(self.layout[q] < self.global_qubits for q in qubits)
+        if needed > self.num_qubits - len(busy | set(range(self.global_qubits))):
+            raise ValueError(f"Gate on qubits {sorted(set(qubits) | set(keep))} needs {needed} free local qubit(s), "
+                             f"but only {self.num_local} local qubits exist; use fewer shards")
+        for q in qubits:
+            axis = self.layout[q]
+            if axis >= self.global_qubits:
+                continue
+            free = next(a for a in range(self.global_qubits, self.num_qubits) if a not in busy)
+            self.transport.exchange(self._shard_bit(axis), free - self.global_qubits, self.num_local)
+            self.exchanges += 1
+            other = self.layout.index(free)
+            self.layout[q], self.layout[other] = free, axis
+            busy.add(free)
+
+    def _split_controls(self, controls):
+        """Kontrol global -> mask indeks shard, kontrol lokal -> sumbu lokal"""
+        mask = 0
+        local = []
+        for c in controls:
+            axis = self.layout[c]
+            if axis < self.global_qubits:
+                mask |= self._shard_bit(axis)
+            else:
+                local.append(axis - self.global_qubits)
+        return mask, local
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Aplikasikan gate (control_qubit: int atau list); exchange hanya jika target global"""
+        self.version += 1
+        controls = _as_controls(control_qubit)
+        _check_controls(target_qubit, controls)
+        gate = np.asarray(gate_matrix, dtype=complex)
+        axis = self.layout[target_qubit]
+        if axis < self.global_qubits and _is_diagonal(gate):
+            # Diagonal pada qubit global: skala per shard, tanpa exchange
+            mask, local = self._split_controls(controls)
+            if not local:
+                self.transport.run(_scale_kernel, np.diag(gate), self._shard_bit(axis), mask)
+                return
+        if axis < self.global_qubits:
+            self._localize([target_qubit], keep=controls)
+            axis = self.layout[target_qubit]
+        mask, local = self._split_controls(controls)
+        self.transport.run(_gate_kernel, gate, axis - self.global_qubits, local, mask, self.num_local)
+
+    def apply_matrix(self, matrix, qubits):
+        """Unitary k-qubit (qubits[0] = bit paling signifikan); semua qubit dibuat lokal dulu"""
+        self.version += 1
+        qubits = list(qubits)
+        self._localize(qubits)
+        axes = [self.layout[q] - self.global_qubits for q in qubits]
+        self.transport.run(_matrix_kernel, np.asarray(matrix, dtype=complex), axes, self.num_local)
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP hanya relabel layout (tanpa pergerakan data)"""
+        self.version += 1
+        self.layout[qubit_a], self.layout[qubit_b] = self.layout[qubit_b], self.layout[qubit_a]
+
+    @property
+    def state(self):
+        """State vector penuh dalam urutan qubit logis (gather dari semua shard)"""
+        tensor = self.transport.gather().reshape((2,) * self.num_qubits)
+        return tensor.transpose(self.layout).reshape(-1)
+
+    @state.setter
+    def state(self, value):
+        self.layout = list(range(self.num_qubits))
+        self.transport.scatter(np.asarray(value, dtype=complex))
+        self.version += 1
+
+    def get_amplitudes(self):
+        return self.state
+
+    def get_probabilities(self):
+        return np.abs(self.state) ** 2
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal register (qubits[0] = bit paling signifikan), direduksi per shard"""
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        local = [self.layout[q] - self.global_qubits for q in qubits if self.layout[q] >= self.global_qubits]
+        weights = self.transport.run(_weights_kernel, local, self.num_local)
+        marginal = np.zeros((2,) * len(qubits))
+        for shard, part in enumerate(weights):
+            index = tuple(int(bool(shard & self._shard_bit(self.layout[q]))) if self.layout[q] < self.global_qubits
+                          else slice(None) for q in qubits)
+            marginal[index] += part
+        marginal = marginal.reshape(-1)
+        return marginal / marginal.sum()
+
+    def measure_qubit(self, qubit, outcome=None, rng=None):
+        """Ukur satu qubit di tengah circuit (proyeksi per shard)"""
+        p1 = self.marginal_probabilities([qubit])[1]
+        if outcome is None:
+            outcome = int(as_generator(rng).random() < p1)
+        weight = p1 if outcome else 1 - p1
+        if weight <= 0:
+            raise ValueError(f"Outcome {outcome} on qubit {qubit} has zero probability")
+        axis = self.layout[qubit]
+        if axis < self.global_qubits:
+            self.transport.run(_project_kernel, None, outcome, self._shard_bit(axis), 1 / np.sqrt(weight),
+                               self.num_local)
+        else:
+            self.transport.run(_project_kernel, axis - self.global_qubits, outcome, 0, 1 / np.sqrt(weight),
+                               self.num_local)
+        self.version += 1
+        return int(outcome)
+
+    def reset_qubit(self, qubit, outcome=None, rng=None):
+        """Reset satu qubit ke |0⟩ (ukur lalu X jika hasilnya 1)"""
+        outcome = self.measure_qubit(qubit, outcome, rng)
+        if outcome:
+            self.apply_gate(np.array([[0, 1], [1, 0]], dtype=complex), qubit)
+        return outcome
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        qubits = range(self.num_qubits) if qubits is None else qubits
+        return Sampler(self.marginal_probabilities(qubits)).sample(shots, rng)
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        qubits = range(self.num_qubits) if qubits is None else qubits
+        return Sampler(self.marginal_probabilities(qubits)).counts(shots, rng)
+
+    def memory_footprint(self):
+        """Pemakaian memori state (byte, di semua shard)"""
+        nbytes = self.dim * np.dtype(complex).itemsize
+        return {"state": nbytes, "total": nbytes}
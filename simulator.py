@@ -0,0 +1,654 @@
+# simulator.py
+# State-vector engine for the Quantum Computing Simulation
+# Qubit q corresponds to axis q of the (2, 2, ..., 2) view of the state,
+# i.e. qubit 0 is the most significant bit of the basis index.
+
+import os
+
+import numpy as np # type: ignore
+
+from sampler import Sampler, as_generator
+
+
+PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
+PAULI_Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
+PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
+
+
+HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+
+
+S_GATE = np.array([[1, 0], [0, 1j]], dtype=complex)
+T_GATE = np.array([[1, 0], [0, np.exp(1j * np.pi / 4)]], dtype=complex)
+
+
+IDENTITY = np.eye(2, dtype=complex)
+
+
+CNOT = np.array([[1, 0, 0, 0],
+                 [0, 1, 0, 0],
+                 [0, 0, 0, 1],
+                 [0, 0, 1, 0]], dtype=complex)
+SWAP = np.array([[1, 0, 0, 0],
+                 [0, 0, 1, 0],
+                 [0, 1, 0, 0],
+                 [0, 0, 0, 1]], dtype=complex)
+
+
+def _rotation(*angles):
+    """Sudut sebagai array yang sudah di-broadcast, plus array kosong (..., 2, 2)"""
+    angles = np.broadcast_arrays(*[np.asarray(a, dtype=float) for a in angles])
+    return angles, np.empty(angles[0].shape + (2, 2), dtype=complex)
+
+
+def rx_gate(theta):
+    """Rotasi Rx(θ) = exp(-iθX/2); θ array -> array matrix (..., 2, 2)"""
+    (theta,), out = _rotation(theta)
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    out[..., 0, 0] = c
+    out[..., 0, 1] = -1j * s
+    out[..., 1, 0] = -1j * s
+    out[..., 1, 1] = c
+    return out
+
+
+def ry_gate(theta):
+    """Rotasi Ry(θ) = exp(-iθY/2); θ array -> array matrix (..., 2, 2)"""
+    (theta,), out = _rotation(theta)
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    out[..., 0, 0] = c
+    out[..., 0, 1] = -s
+    out[..., 1, 0] = s
+    out[..., 1, 1] = c
+    return out
+
+
+def rz_gate(theta):
+    """Rotasi Rz(θ) = exp(-iθZ/2) (diagonal); θ array -> array matrix (..., 2, 2)"""
+    (theta,), out = _rotation(theta)
+    out[..., 0, 0] = np.exp(-0.5j * theta)
+    out[..., 0, 1] = 0
+    out[..., 1, 0] = 0
+    out[..., 1, 1] = np.exp(0.5j * theta)
+    return out
+
+
+def phase_gate(theta):
+    """Gate fase diag(1, e^{iθ}); dengan control menjadi controlled-phase"""
+    (theta,), out = _rotation(theta)
+    out[..., 0, 0] = 1
+    out[..., 0, 1] = 0
+    out[..., 1, 0] = 0
+    out[..., 1, 1] = np.exp(1j * theta)
+    return out
+
+
+def u3_gate(theta, phi, lam):
+    """Gate single-qubit umum U3(θ, φ, λ); parameter array di-broadcast -> (..., 2, 2)"""
+    (theta, phi, lam), out = _rotation(theta, phi, lam)
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    out[..., 0, 0] = c
+    out[..., 0, 1] = -np.exp(1j * lam) * s
+    out[..., 1, 0] = np.exp(1j * phi) * s
+    out[..., 1, 1] = np.exp(1j * (phi + lam)) * c
+    return out
+
+
+def _as_controls(control_qubit):
+    """Normalisasi control_qubit (None, int, atau list) menjadi list"""
+    if control_qubit is None:
+        return []
+    if np.ndim(control_qubit) == 0:
+        return [int(control_qubit)]
+    return [int(c) for c in control_qubit]
+
+
+def _check_controls(target, controls):
+    """ValueError jika target ada di controls atau ada control ganda"""
+    if target in controls or len(set(controls)) != len(controls):
+        raise ValueError(f"Invalid control qubits {list(controls)} for target {target}")
+
+
+def _is_diagonal(gate):
+    """True jika gate 2x2 diagonal (fast path fase)"""
+    gate = np.asarray(gate)
+    return gate.shape == (2, 2) and abs(gate[0, 1]) < 1e-12 and abs(gate[1, 0]) < 1e-12
+
+
+def _is_antidiagonal(gate):
+    """True jika gate 2x2 = diag(a, b)·X (permutasi X plus fase, mis. Pauli-Y)"""
+    gate = np.asarray(gate)
+    return gate.shape == (2, 2) and abs(gate[0, 0]) < 1e-12 and abs(gate[1, 1]) < 1e-12
+
+
+# Jumlah vektor fase gabungan / indeks permutasi gabungan yang disimpan
+# (mis. oracle Grover atau blok aritmetika reversible yang diulang)
+PHASE_CACHE_SIZE = 8
+PERMUTATION_CACHE_SIZE = 8
+INDEX_CACHE_SIZE = 16
+# Jumlah sampler (distribusi penuh / marginal per register) per versi state
+SAMPLER_CACHE_SIZE = 8
+
+
+# Batas register untuk mode large-register dan anggaran memori default
+# (separuh RAM fisik, atau 2 GiB jika tidak bisa dideteksi)
+MAX_QUBITS = 28
+
+
+def _physical_memory():
+    """RAM fisik dalam byte, atau None jika tidak tersedia"""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+DEFAULT_MEMORY_BUDGET = (_physical_memory() or 4 * 1024 ** 3) // 2
+
+
+class MemoryBudgetError(MemoryError):
+    """State vector plus buffer kerja tidak muat dalam anggaran memori"""
+    def __init__(self, message, suggestion=None):
+        super().__init__(message)
+        # {"dtype": "complex64"} atau {"num_qubits": n} yang masih muat
+        self.suggestion = suggestion
+
+
+def estimate_memory(num_qubits, dtype=complex):
+    """Perkiraan memori (byte): state vector dan buffer kerja (gather, indeks int64, CDF sampler float64)"""
+    dim = 2 ** num_qubits
+    itemsize = np.dtype(dtype).itemsize
+    state = dim * itemsize
+    scratch = dim * itemsize + dim * 8 + dim * 8
+    return {"state": state, "scratch": scratch, "total": state + scratch}
+
+
+def check_memory(num_qubits, dtype=complex, memory_budget=None):
+    """Cek register muat dalam anggaran sebelum alokasi; MemoryBudgetError berisi saran jika tidak"""
+    budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+    if num_qubits > MAX_QUBITS:
+        raise MemoryBudgetError(f"{num_qubits} qubits exceeds the maximum of {MAX_QUBITS}",
+                                {"num_qubits": MAX_QUBITS})
+    estimate = estimate_memory(num_qubits, dtype)
+    if estimate["total"] <= budget:
+        return estimate
+    
+    message = (f"{num_qubits} qubits need about {estimate['total'] / 2 ** 30:.2f} GiB "
+               f"(state + scratch), budget is {budget / 2 ** 30:.2f} GiB")
+    if np.dtype(dtype) != np.complex64 and estimate_memory(num_qubits, np.complex64)["total"] <= budget:
+        raise MemoryBudgetError(message + "; complex64 precision would fit", {"dtype": "complex64"})
+    fit = num_qubits
+    while fit > 0 and estimate_memory(fit, dtype)["total"] > budget:
+        fit -= 1
+    raise MemoryBudgetError(message + f"; at most {fit} qubits fit", {"num_qubits": fit})
+
+
+def _cache_put(cache, key, value, max_entries):
+    """Simpan ke cache dict dengan batas jumlah entri (entri tertua dibuang)"""
+    if max_entries <= 0:
+        return
+    while len(cache) >= max_entries:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+# Engine untuk apply_gate: "strided" (default, O(2^n) per gate) atau
+# "dense" (matrix 2^n x 2^n penuh, hanya sebagai referensi untuk cross-check)
+ENGINES = ("strided", "dense")
+
+
+# Presisi state vector: complex64 memakai separuh memori dan bandwidth.
+# Norm tidak dinormalisasi ulang setiap gate; batas drift yang terakumulasi
+# dibandingkan dengan toleransi per presisi sebelum renormalisasi.
+PRECISIONS = ("complex128", "complex64")
+NORM_TOLERANCE = {"complex128": 1e-10, "complex64": 1e-5}
+
+
+class QuantumSimulator:
+    """Simulator quantum computing sederhana"""
+    backend_name = "statevector"
+
+    def __init__(self, num_qubits, engine="strided", memory_budget=None,
+                 precision="complex128", norm_tolerance=None):
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine '{engine}', expected one of {ENGINES}")
+        if str(np.dtype(precision)) not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {PRECISIONS}")
+        self.dtype = np.dtype(precision)
+        self.precision = str(self.dtype)
+        estimate = check_memory(num_qubits, self.dtype, memory_budget)
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.engine = engine
+        self.norm_tolerance = NORM_TOLERANCE[self.precision] if norm_tolerance is None else norm_tolerance
+        self.renormalizations = 0
+        self.max_norm_drift = 0.0
+        self.memory_budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+        
+        # Sisa anggaran setelah state + scratch dipakai untuk cache vektor fase / indeks
+        cache_bytes = max(0, self.memory_budget - estimate["total"])
+        self._phase_cache_size = int(min(PHASE_CACHE_SIZE, cache_bytes // 2 // estimate["state"]))
+        self._perm_cache_size = int(min(PERMUTATION_CACHE_SIZE, cache_bytes // 4 // (self.dim * 8)))
+        self._index_cache_size = int(min(INDEX_CACHE_SIZE, cache_bytes // 4 // (self.dim * 8)))
+        self._pending_phases = {}
+        self._phase_cache = {}
+        self._pending_perm = None
+        self._perm_cache = {}
+        self._buffer = None
+        self._samplers = {}
+        self._sampler_version = None
+        self.version = 0
+        self.state = np.zeros(self.dim, dtype=self.dtype)
+        self.state[0] = 1.0
+        self.gate_history = []
+        self._index_cache = {}
+
+    @property
+    def state(self):
+        """State vector (fase diagonal / permutasi yang tertunda di-flush dulu)"""
+        if self._pending_phases:
+            self._flush_phases()
+        if self._pending_perm is not None:
+            self._flush_permutation()
+        return self._state
+
+    @state.setter
+    def state(self, value):
+        self._pending_phases = {}
+        self._pending_perm = None
+        self._state = np.asarray(value, dtype=self.dtype)
+        self.version += 1
+        # State baru dianggap ternormalisasi sampai dicek sebelum pengukuran
+        self._drift_bound = np.finfo(self.dtype).eps
+
+    def reset(self):
+        """Reset state ke |0...0⟩"""
+        self.state = np.zeros(self.dim, dtype=self.dtype)
+        self.state[0] = 1.0
+        self._drift_bound = 0.0
+        self.gate_history = []
+    
+    def _track_drift(self, matrix):
+        """Tambah batas drift norm: ||U†U - I|| gate plus pembulatan satu pass (untuk matrix eksplisit kecil)"""
+        matrix = np.asarray(matrix)
+        error = np.linalg.norm(matrix.conj().T @ matrix - np.eye(len(matrix)))
+        self._add_drift(error + np.finfo(self.dtype).eps * len(matrix))
+    
+    def _add_drift(self, error):
+        """Akumulasi batas drift; renormalisasi jika melewati norm_tolerance"""
+        self._drift_bound += error
+        if self._drift_bound > self.norm_tolerance:
+            self.renormalize()
+    
+    def norm_drift(self):
+        """Drift norm saat ini |‖ψ‖ - 1| (satu pass baca)"""
+        return abs(float(np.linalg.norm(self.state)) - 1.0)
+    
+    def renormalize(self):
+        """Normalisasi ulang state; kembalikan drift yang terukur sebelumnya"""
+        norm = float(np.linalg.norm(self.state))
+        drift = abs(norm - 1.0)
+        self.max_norm_drift = max(self.max_norm_drift, drift)
+        if norm > 0:
+            self._state /= norm
+        self.renormalizations += 1
+        self._drift_bound = 0.0
+        return drift
+    
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Aplikasikan gate ke qubit tertentu (control_qubit: int atau list untuk multi-control)"""
+        self.version += 1
+        controls = _as_controls(control_qubit)
+        if self.engine == "dense":
+            if controls:
+                full_gate = self._create_controlled_matrix(gate_matrix, target_qubit, controls)
+            else:
+                full_gate = self._expand_gate(gate_matrix, target_qubit)
+            self.state = full_gate @ self.state
+        elif _is_diagonal(gate_matrix):
+            # Gate diagonal (Z, S, T, CZ, controlled-phase) hanya dicatat sebagai fase
+            # tertunda; tidak ada pass pada state vector sampai dibutuhkan
+            self._queue_diagonal(gate_matrix, target_qubit, controls)
+            return
+        elif _is_antidiagonal(gate_matrix):
+            # X, CNOT, Toffoli (dan Y = fase·X) hanya memindahkan amplitudo
+            self._queue_permutation("MCX", [target_qubit], controls)
+            phases = np.diag([gate_matrix[0, 1], gate_matrix[1, 0]])
+            if not np.allclose(phases, IDENTITY):
+                self._queue_diagonal(phases, target_qubit, controls)
+            return
+        elif controls:
+            self._apply_controlled(gate_matrix, target_qubit, controls)
+        else:
+            self._apply_single(gate_matrix, target_qubit)
+        
+        self._track_drift(gate_matrix)
+    
+    def apply_diagonal(self, diagonal, qubits):
+        """Kalikan elementwise dengan diagonal 2^k pada qubit-qubit ini (satu pass)"""
+        self.version += 1
+        qubits = list(qubits)
+        k = len(qubits)
+        shape = [1] * self.num_qubits
+        for q in qubits:
+            shape[q] = 2
+        phases = np.asarray(diagonal, dtype=self.dtype).reshape((2,) * k)
+        phases = np.moveaxis(phases, list(range(k)), list(np.argsort(np.argsort(qubits))))
+        psi = self.state.reshape((2,) * self.num_qubits)
+        psi *= phases.reshape(shape)
+        # Drift elementwise max ||d_i| - 1| (tanpa matrix diag 4^k)
+        self._add_drift(float(np.abs(np.abs(phases) - 1).max()) + np.finfo(self.dtype).eps)
+    
+    def _queue_diagonal(self, gate, target, controls):
+        """Akumulasi gate diagonal sebagai faktor fase per mask bit (O(1) per gate)"""
+        _check_controls(target, controls)
+        if self._pending_perm is not None:
+            self._flush_permutation()
+        cmask = sum(self._bit(c) for c in controls)
+        d0, d1 = complex(gate[0, 0]), complex(gate[1, 1])
+        terms = self._pending_phases
+        if abs(d0 - 1) > 1e-12:
+            terms[cmask] = terms.get(cmask, 1.0) * d0
+            d1 /= d0
+        tmask = cmask | self._bit(target)
+        terms[tmask] = terms.get(tmask, 1.0) * d1
+        self._drift_bound += abs(abs(d0) - 1) + abs(abs(gate[1, 1]) - 1)
+    
+    def _mask_view(self, array, mask):
+        """View strided dari amplitudo dengan semua bit mask = 1 (tanpa array indeks)"""
+        index = tuple(slice(1, 2) if mask & self._bit(q) else slice(None) for q in range(self.num_qubits))
+        return array.reshape((2,) * self.num_qubits)[index]
+    
+    def _flush_phases(self):
+        """Terapkan fase tertunda: satu term langsung, banyak term lewat satu vektor fase"""
+        terms = {mask: f for mask, f in self._pending_phases.items() if abs(f - 1) > 1e-12}
+        self._pending_phases = {}
+        if len(terms) == 1:
+            (mask, factor), = terms.items()
+            view = self._mask_view(self._state, mask)
+            view *= factor
+        elif terms:
+            key = tuple(sorted(terms.items(), key=lambda item: item[0]))
+            phase = self._phase_cache.get(key)
+            if phase is None:
+                phase = np.ones(self.dim, dtype=self.dtype)
+                for mask, factor in terms.items():
+                    view = self._mask_view(phase, mask)
+                    view *= factor
+                _cache_put(self._phase_cache, key, phase, self._phase_cache_size)
+            self._state *= phase
+    
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP dua qubit (permutasi lazy, tanpa pass pada state vector)"""
+        self.version += 1
+        if qubit_a != qubit_b:
+            self._queue_permutation("SWAP", [qubit_a, qubit_b])
+    
+    def _queue_permutation(self, kind, targets, controls=()):
+        """Komposisi lazy gate permutasi: affine GF(2) untuk X/CNOT/SWAP, indeks eksplisit untuk Toffoli"""
+        if kind == "MCX":
+            _check_controls(targets[0], controls)
+        if self._pending_phases:
+            self._flush_phases()
+        n = self.num_qubits
+        if self._pending_perm is None:
+            self._pending_perm = ("affine", np.eye(n, dtype=bool), np.zeros(n, dtype=bool))
+        
+        # src' = src ∘ g (semua gate permutasi di sini self-inverse)
+        if self._pending_perm[0] == "affine" and len(controls) <= 1:
+            _, A, b = self._pending_perm
+            if kind == "SWAP":
+                qa, qb = targets
+                A[:, [qa, qb]] = A[:, [qb, qa]]
+            elif controls:
+                A[:, controls[0]] ^= A[:, targets[0]]
+            else:
+                b ^= A[:, targets[0]]
+            return
+        
+        if self._pending_perm[0] == "affine":
+            self._pending_perm = ("explicit", self._permutation_indices().copy())
+        src = self._pending_perm[1]
+        if kind == "SWAP":
+            qa, qb = targets
+            self._swap_halves(src, {qa: 0, qb: 1}, {qa: 1, qb: 0})
+        else:
+            fixed = {c: 1 for c in controls}
+            self._swap_halves(src, {**fixed, targets[0]: 0}, {**fixed, targets[0]: 1})
+    
+    def _swap_halves(self, array, bits0, bits1):
+        """Tukar in-place dua view strided (qubit -> nilai bit tetap) dari array berukuran 2^n"""
+        view = array.reshape((2,) * self.num_qubits)
+        index0 = tuple(slice(bits0[q], bits0[q] + 1) if q in bits0 else slice(None) for q in range(self.num_qubits))
+        index1 = tuple(slice(bits1[q], bits1[q] + 1) if q in bits1 else slice(None) for q in range(self.num_qubits))
+        tmp = view[index0].copy()
+        view[index0] = view[index1]
+        view[index1] = tmp
+    
+    def _permutation_indices(self):
+        """Indeks sumber permutasi tertunda: state_baru = state[src] (None jika identitas)"""
+        perm = self._pending_perm
+        if perm[0] == "explicit":
+            return perm[1]
+        _, A, b = perm
+        n = self.num_qubits
+        key = (A.tobytes(), b.tobytes())
+        if key in self._perm_cache:
+            return self._perm_cache[key]
+        
+        weights = 1 << np.arange(n - 1, -1, -1)
+        idx = np.arange(self.dim)
+        src = idx ^ int(weights[b].sum())
+        for j in range(n):
+            column = int(weights[A[:, j]].sum())
+            if column != self._bit(j):
+                src ^= ((idx >> (n - 1 - j)) & 1) * (column ^ self._bit(j))
+        _cache_put(self._perm_cache, key, src, self._perm_cache_size)
+        return src
+    
+    def _flush_permutation(self):
+        """Terapkan permutasi tertunda dengan satu gather ke buffer yang dipakai ulang"""
+        perm = self._pending_perm
+        if perm[0] == "affine" and not perm[2].any() and np.array_equal(perm[1], np.eye(self.num_qubits, dtype=bool)):
+            self._pending_perm = None
+            return
+        src = self._permutation_indices()
+        self._pending_perm = None
+        if self._buffer is None or self._buffer.shape != self._state.shape or self._buffer.dtype != self._state.dtype:
+            self._buffer = np.empty_like(self._state)
+        np.take(self._state, src, out=self._buffer)
+        self._state, self._buffer = self._buffer, self._state
+    
+    def apply_controlled(self, gate, target, controls):
+        """Controlled-U: update hanya amplitudo dengan semua bit control = 1"""
+        self.version += 1
+        self._apply_controlled(gate, target, controls)
+        self._track_drift(gate)
+    
+    def _apply_controlled(self, gate, target, controls):
+        """Gather/scatter pasangan indeks controlled-U (tanpa pelacakan drift)"""
+        gate = np.asarray(gate, dtype=self.dtype)
+        idx0, idx1 = self._controlled_indices(target, controls)
+        a0 = self.state[idx0]
+        a1 = self.state[idx1]
+        self.state[idx0] = gate[0, 0] * a0 + gate[0, 1] * a1
+        self.state[idx1] = gate[1, 0] * a0 + gate[1, 1] * a1
+    
+    def apply_matrix(self, matrix, qubits):
+        """Kontraksi gate k-qubit (2^k x 2^k) hanya pada sumbu qubit target"""
+        self.version += 1
+        qubits = list(qubits)
+        k = len(qubits)
+        if k == 1:
+            self._apply_single(matrix, qubits[0])
+            self._track_drift(matrix)
+            return
+        if k == 2 and np.allclose(matrix, SWAP):
+            self.apply_swap(*qubits)
+            return
+        
+        psi = self.state.reshape((2,) * self.num_qubits)
+        gate = np.asarray(matrix, dtype=self.dtype).reshape((2,) * (2 * k))
+        out = np.tensordot(gate, psi, axes=(list(range(k, 2 * k)), qubits))
+        self.state[:] = np.moveaxis(out, list(range(k)), qubits).reshape(self.dim)
+        self._track_drift(matrix)
+    
+    def _apply_single(self, gate, target):
+        """Update in-place dua irisan strided (bit target = 0 / 1)"""
+        gate = np.asarray(gate, dtype=self.dtype)
+        view = self.state.reshape(2 ** target, 2, -1)
+        a0 = view[:, 0, :]
+        a1 = view[:, 1, :]
+        tmp = a0.copy()
+        
+        a0 *= gate[0, 0]
+        a0 += gate[0, 1] * a1
+        a1 *= gate[1, 1]
+        a1 += gate[1, 0] * tmp
+    
+    def _expand_gate(self, gate, target):
+        """Ekspansi gate single-qubit ke sistem multi-qubit"""
+        I = np.eye(2)
+        matrices = []
+        
+        for i in range(self.num_qubits):
+            if i == target:
+                matrices.append(gate)
+            else:
+                matrices.append(I)
+        
+
+        result = matrices[0]
+        for m in matrices[1:]:
+            result = np.kron(result, m)
+        
+        return result
+    
+    def _bit(self, qubit):
+        """Bit mask qubit pada indeks basis (qubit 0 = bit paling signifikan)"""
+        return 1 << (self.num_qubits - 1 - qubit)
+    
+    def _controlled_indices(self, target, controls):
+        """Indeks pasangan (bit target 0, bit target 1) dengan semua control = 1"""
+        key = (target, tuple(controls))
+        if key not in self._index_cache:
+            _check_controls(target, controls)
+            cmask = sum(self._bit(c) for c in controls)
+            tmask = self._bit(target)
+            idx = np.arange(self.dim)
+            idx0 = idx[((idx & cmask) == cmask) & ((idx & tmask) == 0)]
+            pair = (idx0, idx0 | tmask)
+            _cache_put(self._index_cache, key, pair, self._index_cache_size)
+            return pair
+        return self._index_cache[key]
+    
+    def _create_controlled_matrix(self, gate, target, controls):
+        """Buat matrix controlled-U penuh (mode dense / referensi)"""
+        full = np.eye(self.dim, dtype=self.dtype)
+        idx0, idx1 = self._controlled_indices(target, controls)
+        full[idx0, idx0] = gate[0, 0]
+        full[idx0, idx1] = gate[0, 1]
+        full[idx1, idx0] = gate[1, 0]
+        full[idx1, idx1] = gate[1, 1]
+        return full
+    
+    def memory_footprint(self):
+        """Pemakaian memori saat ini (byte) per komponen, plus total"""
+        pending = self._pending_perm[1].nbytes if self._pending_perm and self._pending_perm[0] == "explicit" else 0
+        footprint = {
+            "state": self._state.nbytes,
+            "buffer": self._buffer.nbytes if self._buffer is not None else 0,
+            "phase_cache": sum(phase.nbytes for phase in self._phase_cache.values()),
+            "permutation": pending + sum(src.nbytes for src in self._perm_cache.values()),
+            "index_cache": sum(idx0.nbytes + idx1.nbytes for idx0, idx1 in self._index_cache.values()),
+            "sampler": sum(sampler.nbytes for sampler in self._samplers.values()),
+        }
+        footprint["total"] = sum(footprint.values())
+        return footprint
+    
+    def get_probabilities(self):
+        """Hitung probabilitas pengukuran setiap basis state (renormalisasi dulu jika ada drift)"""
+        if self._drift_bound > 0:
+            self.renormalize()
+        return np.abs(self.state) ** 2
+    
+    def get_amplitudes(self):
+        """Dapatkan amplitudo kompleks"""
+        return self.state
+    
+    def _check_register(self, qubits):
+        """Daftar qubit register yang diukur; ValueError jika di luar jangkauan atau ganda"""
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        return qubits
+    
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal 2^k qubit terpilih (qubits[0] = bit paling signifikan), tanpa vektor 2^n"""
+        marginal = self._marginal_weights(self._check_register(qubits))
+        return marginal / marginal.sum()
+    
+    def _marginal_weights(self, qubits):
+        """Σ|a|^2 per nilai register (belum dinormalisasi)"""
+        # |a|^2 = re^2 + im^2: einsum pada view float menjumlahkan sumbu lain tanpa array sementara
+        n = self.num_qubits
+        axes = list(range(n + 1))
+        parts = self.state.view(np.finfo(self.dtype).dtype).reshape((2,) * n + (2,))
+        return np.einsum(parts, axes, parts, axes, list(qubits), dtype=float).reshape(-1)
+    
+    def measure_qubit(self, qubit, outcome=None, rng=None):
+        """Ukur satu qubit di tengah circuit: nolkan setengah sumbu yang tidak cocok, skala sisanya"""
+        weights = self._marginal_weights(self._check_register([qubit]))
+        if outcome is None:
+            outcome = int(as_generator(rng).random() * weights.sum() < weights[1])
+        if weights[outcome] <= 0:
+            raise ValueError(f"Outcome {outcome} on qubit {qubit} has zero probability")
+        view = self.state.reshape(2 ** qubit, 2, -1)
+        view[:, 1 - outcome, :] = 0
+        view[:, outcome, :] *= 1 / np.sqrt(weights[outcome])
+        self._drift_bound = 0.0
+        self.version += 1
+        return int(outcome)
+    
+    def reset_qubit(self, qubit, outcome=None, rng=None):
+        """Reset satu qubit ke |0⟩ (ukur, lalu pindahkan setengah |1⟩ ke |0⟩); kembalikan hasil ukur"""
+        outcome = self.measure_qubit(qubit, outcome, rng)
+        if outcome:
+            view = self.state.reshape(2 ** qubit, 2, -1)
+            view[:, 0, :] = view[:, 1, :]
+            view[:, 1, :] = 0
+        return outcome
+    
+    def copy(self):
+        """Salinan independen (state disalin; cache fase/permutasi/indeks dipakai bersama)"""
+        other = object.__new__(QuantumSimulator)
+        other.__dict__.update(self.__dict__)
+        other._state = self.state.copy()
+        other._pending_phases = {}
+        other._pending_perm = None
+        other._buffer = None
+        other._samplers = {}
+        other._sampler_version = None
+        other.gate_history = list(self.gate_history)
+        return other
+    
+    def sampler(self, qubits=None):
+        """Sampler untuk state saat ini (semua qubit atau register terpilih), di-cache sampai state berubah"""
+        if self._sampler_version != self.version:
+            self._samplers = {}
+            self._sampler_version = self.version
+        key = None if qubits is None else tuple(self._check_register(qubits))
+        if key == tuple(range(self.num_qubits)):
+            key = None
+        if key not in self._samplers:
+            probs = self.get_probabilities() if key is None else self.marginal_probabilities(key)
+            _cache_put(self._samplers, key, Sampler(probs), SAMPLER_CACHE_SIZE)
+        return self._samplers[key]
+    
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Simulasi pengukuran: indeks basis per shot (rng: Generator atau seed; qubits: register terpilih)"""
+        return self.sampler(qubits).sample(shots, rng)
+    
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """Hasil pengukuran sebagai (indeks basis, counts) tanpa array per shot"""
+        return self.sampler(qubits).counts(shots, rng)
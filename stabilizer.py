@@ -0,0 +1,492 @@
+# stabilizer.py
+# Stabilizer (Clifford tableau) backend and automatic backend selection
+# Tableau format follows Aaronson & Gottesman (CHP): rows 0..n-1 are
+# destabilizers, rows n..2n-1 stabilizers, row 2n is scratch space.
+
+import numpy as np # type: ignore
+
+from simulator import (
+    QuantumSimulator, PAULI_X, PAULI_Y, PAULI_Z, HADAMARD, S_GATE, IDENTITY, SWAP, _as_controls
+)
+from sampler import as_generator
+
+
+S_DAGGER = S_GATE.conj().T
+
+# Gate single-qubit Clifford yang dikenali (sama sampai fase global)
+CLIFFORD_SINGLE = {
+    "I": IDENTITY,
+    "X": PAULI_X,
+    "Y": PAULI_Y,
+    "Z": PAULI_Z,
+    "H": HADAMARD,
+    "S": S_GATE,
+    "SDG": S_DAGGER,
+}
+
+# Gate controlled Clifford (satu control, matrix target harus persis sama)
+CLIFFORD_CONTROLLED = {
+    "CNOT": PAULI_X,
+    "CZ": PAULI_Z,
+    "CY": PAULI_Y,
+}
+
+# Batas jumlah qubit untuk konversi tableau -> state vector
+MAX_STATEVECTOR_QUBITS = 24
+
+
+def _strip_global_phase(gate):
+    """Normalisasi fase global: elemen non-nol pertama dibuat real positif"""
+    flat = gate.ravel()
+    lead = flat[np.argmax(np.abs(flat) > 1e-12)]
+    return gate * (abs(lead) / lead)
+
+
+def _rowsum(x, z, r, rows, i):
+    """rowsum CHP tervektorisasi pada array tableau: h <- i * h untuk semua h di rows"""
+    x1, z1 = x[i], z[i]
+    x2 = x[rows].astype(np.int8)
+    z2 = z[rows].astype(np.int8)
+    g = np.where(x1 & z1, z2 - x2, 0)
+    g += np.where(x1 & ~z1, z2 * (2 * x2 - 1), 0)
+    g += np.where(~x1 & z1, x2 * (1 - 2 * z2), 0)
+    total = (2 * r[rows].astype(np.int64) + 2 * int(r[i]) + g.sum(axis=1)) % 4
+    r[rows] = total == 2
+    x[rows] ^= x1
+    z[rows] ^= z1
+
+
+def _solve_gf2(matrix, rhs):
+    """Satu solusi matrix·a = rhs (mod 2), variabel bebas = 0"""
+    matrix = matrix.copy()
+    rhs = rhs.copy()
+    solution = np.zeros(matrix.shape[1], dtype=np.uint8)
+    pivot_cols = []
+    rank = 0
+    for col in range(matrix.shape[1]):
+        pivots = np.flatnonzero(matrix[rank:, col])
+        if not pivots.size:
+            continue
+        pivot = pivots[0] + rank
+        matrix[[rank, pivot]] = matrix[[pivot, rank]]
+        rhs[[rank, pivot]] = rhs[[pivot, rank]]
+        rows = np.flatnonzero(matrix[:, col])
+        rows = rows[rows != rank]
+        matrix[rows] ^= matrix[rank]
+        rhs[rows] ^= rhs[rank]
+        pivot_cols.append(col)
+        rank += 1
+        if rank == matrix.shape[0]:
+            break
+    solution[pivot_cols] = rhs[:rank]
+    return solution
+
+
+def _row_basis(matrix):
+    """Baris independen (mod 2) yang merentang ruang baris matrix yang sama"""
+    matrix = matrix.copy()
+    rank = 0
+    for col in range(matrix.shape[1]):
+        pivots = np.flatnonzero(matrix[rank:, col])
+        if not pivots.size:
+            continue
+        pivot = pivots[0] + rank
+        matrix[[rank, pivot]] = matrix[[pivot, rank]]
+        rows = np.flatnonzero(matrix[rank + 1:, col]) + rank + 1
+        matrix[rows] ^= matrix[rank]
+        rank += 1
+        if rank == matrix.shape[0]:
+            break
+    return matrix[:rank]
+
+
+def clifford_name(gate_matrix, control_qubit=None):
+    """Nama gate Clifford untuk matrix (dan control) ini, atau None jika bukan Clifford"""
+    controls = _as_controls(control_qubit)
+    gate = np.asarray(gate_matrix, dtype=complex)
+    if not controls:
+        normalized = _strip_global_phase(gate)
+        for name, candidate in CLIFFORD_SINGLE.items():
+            if np.allclose(normalized, _strip_global_phase(candidate)):
+                return name
+    elif len(controls) == 1:
+        if np.allclose(gate, IDENTITY):
+            return "I"
+        for name, candidate in CLIFFORD_CONTROLLED.items():
+            if np.allclose(gate, candidate):
+                return name
+    return None
+
+
+class StabilizerSimulator:
+    """Simulator stabilizer (tableau CHP) untuk circuit Clifford, polinomial dalam n"""
+    backend_name = "stabilizer"
+
+    def __init__(self, num_qubits):
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.reset()
+
+    def reset(self):
+        """Reset tableau ke |0...0⟩"""
+        n = self.num_qubits
+        self.x = np.zeros((2 * n + 1, n), dtype=bool)
+        self.z = np.zeros((2 * n + 1, n), dtype=bool)
+        self.r = np.zeros(2 * n + 1, dtype=bool)
+        self.x[np.arange(n), np.arange(n)] = True
+        self.z[np.arange(n) + n, np.arange(n)] = True
+
+    def copy(self):
+        """Salinan tableau"""
+        other = StabilizerSimulator.__new__(StabilizerSimulator)
+        other.num_qubits = self.num_qubits
+        other.dim = self.dim
+        other.x = self.x.copy()
+        other.z = self.z.copy()
+        other.r = self.r.copy()
+        return other
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Aplikasikan gate Clifford (ValueError jika gate bukan Clifford)"""
+        name = clifford_name(gate_matrix, control_qubit)
+        if name is None:
+            raise ValueError("Gate is not a Clifford gate supported by the stabilizer backend")
+        self.apply_named(name, target_qubit, control_qubit)
+
+    def apply_named(self, name, target_qubit, control_qubit=None):
+        """Aplikasikan gate Clifford berdasarkan nama (lihat CLIFFORD_SINGLE / CLIFFORD_CONTROLLED)"""
+        a = target_qubit
+        if name in CLIFFORD_CONTROLLED:
+            c = _as_controls(control_qubit)[0]
+            if c == a:
+                raise ValueError(f"Invalid control qubits [{c}] for target {a}")
+            if name == "CNOT":
+                self._cnot(c, a)
+            elif name == "CZ":
+                self._h(a)
+                self._cnot(c, a)
+                self._h(a)
+            else:
+                self._sdg(a)
+                self._cnot(c, a)
+                self._s(a)
+        elif name == "H":
+            self._h(a)
+        elif name == "S":
+            self._s(a)
+        elif name == "SDG":
+            self._sdg(a)
+        elif name == "X":
+            self.r ^= self.z[:, a]
+        elif name == "Y":
+            self.r ^= self.x[:, a] ^ self.z[:, a]
+        elif name == "Z":
+            self.r ^= self.x[:, a]
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP = pertukaran kolom tableau (tanpa perubahan fase)"""
+        for arr in (self.x, self.z):
+            arr[:, [qubit_a, qubit_b]] = arr[:, [qubit_b, qubit_a]]
+
+    def _h(self, a):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def _s(self, a):
+        self.r ^= self.x[:, a] & self.z[:, a]
+        self.z[:, a] ^= self.x[:, a]
+
+    def _sdg(self, a):
+        self._s(a)
+        self._s(a)
+        self._s(a)
+
+    def _cnot(self, c, t):
+        x, z = self.x, self.z
+        self.r ^= x[:, c] & z[:, t] & ~(x[:, t] ^ z[:, c])
+        x[:, t] ^= x[:, c]
+        z[:, c] ^= z[:, t]
+
+    def _rowsum(self, rows, i):
+        """rowsum CHP: generator h <- i * h untuk semua h di rows"""
+        _rowsum(self.x, self.z, self.r, rows, i)
+
+    def measure_qubit(self, a, outcome=None, rng=None):
+        """Ukur qubit a pada basis Z dan collapse tableau; outcome memaksa hasil acak"""
+        n = self.num_qubits
+        stab = np.flatnonzero(self.x[n:2 * n, a])
+        if stab.size:
+            p = stab[0] + n
+            rows = np.flatnonzero(self.x[:2 * n, a])
+            rows = rows[rows != p]
+            if rows.size:
+                self._rowsum(rows, p)
+            self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+            self.x[p] = False
+            self.z[p] = False
+            self.z[p, a] = True
+            if outcome is None:
+                outcome = as_generator(rng).integers(2)
+            self.r[p] = bool(outcome)
+            return int(outcome)
+
+        result = self._deterministic_outcome(a)
+        if outcome is not None and outcome != result:
+            raise ValueError(f"Outcome {outcome} on qubit {a} has zero probability")
+        return result
+
+    def _deterministic_outcome(self, a):
+        """Hasil pengukuran qubit a yang deterministik (tanpa mengubah tableau kecuali baris scratch)"""
+        n = self.num_qubits
+        scratch = 2 * n
+        self.x[scratch] = False
+        self.z[scratch] = False
+        self.r[scratch] = False
+        for i in np.flatnonzero(self.x[:n, a]):
+            self._rowsum(np.array([scratch]), i + n)
+        return int(self.r[scratch])
+
+    def reset_qubit(self, a, outcome=None, rng=None):
+        """Reset qubit a ke |0⟩ (ukur lalu X jika hasil 1); kembalikan hasil ukur"""
+        outcome = self.measure_qubit(a, outcome, rng)
+        if outcome:
+            self.apply_named("X", a)
+        return outcome
+
+    def _support(self):
+        """Coset support |ψ⟩: offset a dan basis baris V sehingga support = a ⊕ span(V)"""
+        n = self.num_qubits
+        x = self.x[n:2 * n].copy()
+        z = self.z[n:2 * n].copy()
+        r = self.r[n:2 * n].copy()
+
+        # Eliminasi maju pada bagian X; baris sisa (X = 0) adalah stabilizer tipe Z
+        rank = 0
+        for col in range(n):
+            pivots = np.flatnonzero(x[rank:, col])
+            if not pivots.size:
+                continue
+            pivot = pivots[0] + rank
+            for arr in (x, z, r):
+                arr[[rank, pivot]] = arr[[pivot, rank]]
+            rows = np.flatnonzero(x[rank + 1:, col]) + rank + 1
+            if rows.size:
+                _rowsum(x, z, r, rows, rank)
+            rank += 1
+            if rank == n:
+                break
+
+        # Support = solusi z·a = r (mod 2) untuk semua stabilizer tipe Z
+        offset = _solve_gf2(z[rank:], r[rank:])
+        return offset, x[:rank].astype(np.uint8)
+
+    def sample_bits(self, shots=1000, rng=None):
+        """Sampling hasil pengukuran semua qubit, array (shots, n) berisi bit"""
+        offset, basis = self._support()
+        if not len(basis):
+            return np.tile(offset, (shots, 1))
+        coeffs = as_generator(rng).integers(2, size=(shots, len(basis)), dtype=np.uint8)
+        return (coeffs.astype(np.int64) @ basis + offset) % 2
+
+    def _register(self, qubits):
+        """Daftar qubit yang diukur (None = semua); ValueError jika tidak valid"""
+        if qubits is None:
+            return list(range(self.num_qubits))
+        qubits = [int(q) for q in qubits]
+        if not qubits or len(set(qubits)) != len(qubits) or not all(0 <= q < self.num_qubits for q in qubits):
+            raise ValueError(f"Invalid measured qubits {qubits} for {self.num_qubits} qubits")
+        return qubits
+
+    def _marginal_support(self, qubits):
+        """Support marginal register: offset dan basis independen (uniform pada 2^rank titik)"""
+        offset, basis = self._support()
+        return offset[qubits], _row_basis(basis[:, qubits])
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal 2^k register (qubits[0] = bit paling signifikan) langsung dari tableau"""
+        qubits = self._register(qubits)
+        if len(qubits) == 1:
+            # Satu qubit: acak (1/2, 1/2) jika ada stabilizer dengan X di qubit itu, selain itu deterministik
+            n = self.num_qubits
+            if self.x[n:2 * n, qubits[0]].any():
+                return np.array([0.5, 0.5])
+            return np.eye(2)[self._deterministic_outcome(qubits[0])]
+        k = len(qubits)
+        offset, basis = self._marginal_support(qubits)
+        r = len(basis)
+        coeffs = (np.arange(2 ** r)[:, None] >> np.arange(r - 1, -1, -1)) & 1
+        weights = 1 << np.arange(k - 1, -1, -1, dtype=np.int64)
+        probs = np.zeros(2 ** k)
+        probs[((coeffs @ basis.astype(np.int64) + offset) % 2) @ weights] = 2.0 ** -r
+        return probs
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Simulasi pengukuran (indeks basis, seperti QuantumSimulator.measure)"""
+        qubits = self._register(qubits)
+        if len(qubits) > 62:
+            raise ValueError("Too many qubits to pack outcomes into integers, use sample_bits")
+        bits = self.sample_bits(shots, rng)[:, qubits].astype(np.int64)
+        weights = 1 << np.arange(len(qubits) - 1, -1, -1, dtype=np.int64)
+        return bits @ weights
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """Hasil pengukuran sebagai (indeks basis, counts)"""
+        qubits = self._register(qubits)
+        offset, basis = self._marginal_support(qubits)
+        r = len(basis)
+        if r <= 20 and shots >= 2 ** r and len(qubits) <= 62:
+            # Support uniform 2^r elemen: satu draw multinomial pada koefisien
+            counts = as_generator(rng).multinomial(shots, np.full(2 ** r, 2.0 ** -r))
+            coeffs = (np.arange(2 ** r)[:, None] >> np.arange(r - 1, -1, -1)) & 1
+            weights = 1 << np.arange(len(qubits) - 1, -1, -1, dtype=np.int64)
+            indices = ((coeffs @ basis.astype(np.int64) + offset) % 2) @ weights
+            keep = counts > 0
+            order = np.argsort(indices[keep])
+            return indices[keep][order], counts[keep][order]
+        return np.unique(self.measure(shots, rng, qubits), return_counts=True)
+
+    def _apply_pauli(self, vec, row):
+        """Aplikasikan generator tableau (Pauli bertanda) ke state vector"""
+        n = self.num_qubits
+        weights = 1 << np.arange(n - 1, -1, -1)
+        xmask = int(weights[self.x[row]].sum())
+        zmask = int(weights[self.z[row]].sum())
+        phase = (-1) ** int(self.r[row]) * 1j ** int(np.count_nonzero(self.x[row] & self.z[row]))
+
+        idx = np.arange(self.dim)
+        src = idx ^ xmask
+        parity = np.zeros(self.dim, dtype=np.int64)
+        masked = src & zmask
+        for j in range(n):
+            parity ^= (masked >> j) & 1
+        return phase * (1 - 2 * parity) * vec[src]
+
+    def to_statevector(self):
+        """Konversi ke state vector (fase global bebas), hanya untuk n kecil"""
+        n = self.num_qubits
+        if n > MAX_STATEVECTOR_QUBITS:
+            raise ValueError(f"State vector conversion limited to {MAX_STATEVECTOR_QUBITS} qubits")
+        offset, _ = self._support()
+        index = int(offset @ (1 << np.arange(n - 1, -1, -1)))
+        vec = np.zeros(self.dim, dtype=complex)
+        vec[index] = 1.0
+        for row in range(n, 2 * n):
+            vec = (vec + self._apply_pauli(vec, row)) / 2
+        return vec / np.linalg.norm(vec)
+
+    def memory_footprint(self):
+        """Pemakaian memori tableau (byte)"""
+        tableau = self.x.nbytes + self.z.nbytes + self.r.nbytes
+        return {"tableau": tableau, "total": tableau}
+
+    def get_amplitudes(self):
+        """Dapatkan amplitudo kompleks"""
+        return self.to_statevector()
+
+    def get_probabilities(self):
+        """Hitung probabilitas pengukuran setiap basis state"""
+        return np.abs(self.to_statevector()) ** 2
+
+
+class AutoSimulator:
+    """Pilih backend otomatis: stabilizer selama circuit Clifford, lalu state vector"""
+    def __init__(self, num_qubits, memory_budget=None):
+        self.num_qubits = num_qubits
+        self.dim = 2 ** num_qubits
+        self.memory_budget = memory_budget
+        self.reset()
+
+    @property
+    def backend_name(self):
+        """Nama backend aktif ("stabilizer" atau "statevector")"""
+        return self.backend.backend_name
+
+    def reset(self):
+        """Reset state ke |0...0⟩ dan kembali ke backend stabilizer"""
+        self.backend = StabilizerSimulator(self.num_qubits)
+        self._amplitudes = None
+
+    def apply_gate(self, gate_matrix, target_qubit, control_qubit=None):
+        """Aplikasikan gate; konversi ke state vector saat gate non-Clifford pertama"""
+        self._amplitudes = None
+        if isinstance(self.backend, StabilizerSimulator):
+            name = clifford_name(gate_matrix, control_qubit)
+            if name is not None:
+                self.backend.apply_named(name, target_qubit, control_qubit)
+                return
+            self._switch_to_statevector()
+        self.backend.apply_gate(gate_matrix, target_qubit, control_qubit)
+
+    def apply_matrix(self, matrix, qubits):
+        """Aplikasikan matrix k-qubit umum (selalu memakai backend state vector)"""
+        self._amplitudes = None
+        if isinstance(self.backend, StabilizerSimulator):
+            if len(qubits) == 2 and np.allclose(matrix, SWAP):
+                self.backend.apply_swap(*qubits)
+                return
+            self._switch_to_statevector()
+        self.backend.apply_matrix(matrix, qubits)
+
+    def apply_swap(self, qubit_a, qubit_b):
+        """SWAP dua qubit (tetap di backend aktif)"""
+        self._amplitudes = None
+        self.backend.apply_swap(qubit_a, qubit_b)
+
+    def apply_diagonal(self, diagonal, qubits):
+        """Kalikan elementwise dengan diagonal 2^k (selalu memakai backend state vector)"""
+        self._amplitudes = None
+        if isinstance(self.backend, StabilizerSimulator):
+            self._switch_to_statevector()
+        self.backend.apply_diagonal(diagonal, qubits)
+
+    def _switch_to_statevector(self):
+        """Konversi tableau ke QuantumSimulator"""
+        simulator = QuantumSimulator(self.num_qubits, memory_budget=self.memory_budget)
+        simulator.state = self.backend.to_statevector()
+        self.backend = simulator
+
+    def get_amplitudes(self):
+        """Dapatkan amplitudo kompleks"""
+        if self._amplitudes is None:
+            self._amplitudes = self.backend.get_amplitudes()
+        return self._amplitudes
+
+    def get_probabilities(self):
+        """Hitung probabilitas pengukuran setiap basis state"""
+        return np.abs(self.get_amplitudes()) ** 2
+
+    def memory_footprint(self):
+        """Pemakaian memori backend aktif (byte)"""
+        return self.backend.memory_footprint()
+
+    def marginal_probabilities(self, qubits):
+        """Distribusi marginal register terpilih"""
+        return self.backend.marginal_probabilities(qubits)
+
+    def measure_qubit(self, qubit, outcome=None, rng=None):
+        """Pengukuran di tengah circuit (collapse pada backend aktif)"""
+        self._amplitudes = None
+        return self.backend.measure_qubit(qubit, outcome, rng)
+
+    def reset_qubit(self, qubit, outcome=None, rng=None):
+        """Reset satu qubit ke |0⟩"""
+        self._amplitudes = None
+        return self.backend.reset_qubit(qubit, outcome, rng)
+
+    def copy(self):
+        """Salinan independen (backend aktif disalin)"""
+        other = AutoSimulator.__new__(AutoSimulator)
+        other.num_qubits = self.num_qubits
+        other.dim = self.dim
+        other.memory_budget = self.memory_budget
+        other.backend = self.backend.copy()
+        other._amplitudes = None
+        return other
+
+    def measure(self, shots=1000, rng=None, qubits=None):
+        """Simulasi pengukuran"""
+        return self.backend.measure(shots, rng, qubits)
+
+    def measure_counts(self, shots=1000, rng=None, qubits=None):
+        """Hasil pengukuran sebagai (indeks basis, counts)"""
+        return self.backend.measure_counts(shots, rng, qubits)
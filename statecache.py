@@ -0,0 +1,201 @@
+# statecache.py
+# Process-wide cache of state vectors keyed by circuit prefix. Prefixes live in
+# a trie (one root per register size and dtype, one edge per structured
+# operation key), and selected nodes hold a checkpointed state. A run looks up
+# the deepest cached prefix of its circuit, resumes from that state instead of
+# |0...0⟩ and checkpoints new prefixes on the way. Checkpoints are bounded by a
+# byte budget with LRU eviction; hits, bytes held and evictions are reported.
+# Only the deterministic part of a circuit is cached: the walk stops at the
+# first MEASURE / RESET or classically conditioned operation.
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np # type: ignore
+
+from circuit import Circuit, GATE_MATRICES, PARAMETRIC_GATES, NON_UNITARY, apply_operation, compile_circuit
+
+
+# Anggaran default cache bersama (byte)
+DEFAULT_CACHE_BYTES = 256 * 1024 ** 2
+
+# Checkpoint disimpan setiap sekian gate, dan selalu di akhir prefiks yang bisa di-cache
+CHECKPOINT_INTERVAL = 8
+
+
+def operation_key(op):
+    """Kunci terstruktur satu operasi, atau None jika tidak bisa di-cache (non-unitary, kondisi, sweep batch)"""
+    if op.kind in NON_UNITARY or op.condition is not None or op.is_parameterized or op.matrix.ndim == 3:
+        return None
+    params = tuple(float(p) for p in op.params)
+    if op.kind in GATE_MATRICES or op.kind in PARAMETRIC_GATES:
+        return (op.kind, op.targets, op.controls, params)
+    # Matrix kustom: dibedakan lewat digest isinya
+    digest = hashlib.sha1(np.ascontiguousarray(op.matrix, dtype=complex).tobytes()).hexdigest()
+    return (op.kind, op.targets, op.controls, params, digest)
+
+
+class _Node:
+    """Simpul trie: anak per kunci operasi, state checkpoint opsional"""
+    def __init__(self, parent=None, key=None):
+        self.parent = parent
+        self.key = key
+        self.children = {}
+        self.state = None
+
+
+class PrefixStateCache:
+    """Cache state per prefiks circuit (trie) dengan anggaran byte dan eviction LRU, aman antar-thread"""
+    def __init__(self, max_bytes=DEFAULT_CACHE_BYTES, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.max_bytes = int(max_bytes)
+        self.checkpoint_interval = int(checkpoint_interval)
+        self._roots = {}
+        # Simpul yang memegang state, urutan dari yang paling lama tidak dipakai
+        self._lru = OrderedDict()
+        self._lock = threading.RLock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.gates_skipped = 0
+
+    def _root(self, num_qubits, dtype):
+        """Akar trie untuk ukuran register dan dtype tertentu"""
+        return self._roots.setdefault((int(num_qubits), str(np.dtype(dtype))), _Node())
+
+    @staticmethod
+    def _keys(ops):
+        """Kunci operasi sampai operasi pertama yang tidak bisa di-cache"""
+        keys = []
+        for op in ops:
+            key = operation_key(op)
+            if key is None:
+                break
+            keys.append(key)
+        return keys
+
+    def lookup(self, num_qubits, ops, dtype=complex, min_depth=0):
+        """(kedalaman, salinan state) prefiks terdalam yang ter-cache dan lebih dalam dari min_depth, atau (0, None)"""
+        with self._lock:
+            node = self._root(num_qubits, dtype)
+            best = (0, None)
+            for depth, key in enumerate(self._keys(ops), 1):
+                node = node.children.get(key)
+                if node is None:
+                    break
+                if node.state is not None and depth > min_depth:
+                    best = (depth, node)
+            depth, node = best
+            if node is None:
+                self.misses += 1
+                return 0, None
+            self.hits += 1
+            self.gates_skipped += depth - min_depth
+            self._lru.move_to_end(node)
+            return depth, node.state.copy()
+
+    def store(self, num_qubits, ops, state, dtype=None):
+        """Simpan salinan state sebagai checkpoint untuk prefiks ops (diabaikan jika tidak bisa di-cache)"""
+        state = np.asarray(state)
+        keys = self._keys(ops)
+        # State sebesar seluruh anggaran akan mengusir semua checkpoint lain, jadi tidak disimpan
+        if len(keys) != len(ops) or not keys or state.nbytes >= self.max_bytes:
+            return False
+        with self._lock:
+            node = self._root(num_qubits, state.dtype if dtype is None else dtype)
+            for key in keys:
+                node = node.children.setdefault(key, _Node(node, key))
+            if node.state is None:
+                self.bytes += state.nbytes
+            else:
+                self.bytes += state.nbytes - node.state.nbytes
+            node.state = state.copy()
+            self._lru[node] = None
+            self._lru.move_to_end(node)
+            self._evict()
+        return True
+
+    def _evict(self):
+        """Buang checkpoint LRU sampai pemakaian di bawah anggaran; cabang kosong dipangkas"""
+        while self.bytes > self.max_bytes and self._lru:
+            node, _ = self._lru.popitem(last=False)
+            self.bytes -= node.state.nbytes
+            node.state = None
+            self.evictions += 1
+            while node.parent is not None and node.state is None and not node.children:
+                del node.parent.children[node.key]
+                node = node.parent
+
+    def run(self, simulator, circuit, start=0, optimize=False):
+        """Bawa simulator (yang memegang state setelah circuit[:start]) ke akhir circuit
+
+        Lanjut dari prefiks ter-cache terdalam jika lebih jauh dari start, lalu simpan
+        checkpoint setiap checkpoint_interval gate dan di akhir prefiks yang bisa di-cache,
+        selama salinan state masih muat di memory_budget simulator di samping footprint-nya.
+        optimize: setiap segmen antar-checkpoint dijalankan lewat compile_circuit.
+        Kembalikan laporan {"gates": gate yang diminta, "skipped": dilewati berkat cache,
+        "passes": operasi yang benar-benar dijalankan pada state}.
+        """
+        ops = circuit.operations
+        n = circuit.num_qubits
+        cacheable = len(self._keys(ops))
+        footprint = simulator.memory_footprint()
+        budget = getattr(simulator, "memory_budget", None)
+        storable = budget is None or footprint["total"] + footprint.get("state", 0) <= budget
+        report = {"gates": len(ops) - start, "skipped": 0, "passes": 0}
+        if cacheable > start:
+            depth, state = self.lookup(n, ops[:cacheable], simulator.dtype, min_depth=start)
+            if state is not None:
+                simulator.state = state
+                report["skipped"] = depth - start
+                start = depth
+        while start < len(ops):
+            # Segmen sampai checkpoint berikutnya (atau sampai akhir setelah prefiks yang bisa di-cache)
+            stop = min(cacheable, (start // self.checkpoint_interval + 1) * self.checkpoint_interval) \
+                if start < cacheable else len(ops)
+            segment = ops[start:stop]
+            if optimize:
+                segment = compile_circuit(Circuit(n, segment))[0].operations
+            for op in segment:
+                apply_operation(simulator, op)
+            report["passes"] += len(segment)
+            if storable and stop <= cacheable:
+                self.store(n, ops[:stop], simulator.state, simulator.dtype)
+            start = stop
+        return report
+
+    def stats(self):
+        """Statistik cache: hit, miss, hit rate, byte, checkpoint, eviction, gate yang dilewati"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "entries": len(self._lru),
+                "evictions": self.evictions,
+                "gates_skipped": self.gates_skipped,
+            }
+
+    def clear(self):
+        """Kosongkan semua checkpoint (statistik dipertahankan)"""
+        with self._lock:
+            self._roots = {}
+            self._lru.clear()
+            self.bytes = 0
+
+
+_SHARED_CACHE = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_cache():
+    """Cache bersama satu proses (dipakai semua sesi Streamlit)"""
+    global _SHARED_CACHE
+    with _SHARED_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = PrefixStateCache()
+        return _SHARED_CACHE
@@ -0,0 +1,86 @@
+# test_algorithms.py
+# Prebuilt algorithms: every fast kernel against its gate-level circuit run
+# through QuantumSimulator, and the compact oracle forms against the explicit
+# X / multi-controlled Z / X decomposition.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import DIAGONAL, execute
+from algorithms import (
+    apply_qft, qft_circuit, grover_circuit, grover_search, deutsch_jozsa_circuit, deutsch_jozsa,
+    bernstein_vazirani_circuit, bernstein_vazirani, phase_oracle_circuit, gate_level_circuit, verify
+)
+
+
+def _random_simulator(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    simulator = QuantumSimulator(num_qubits)
+    simulator.state = state / np.linalg.norm(state)
+    return simulator
+
+
+@pytest.mark.parametrize("inverse", [False, True])
+@pytest.mark.parametrize("qubits", [None, [1, 3], [4, 0, 2]])
+def test_qft_matches_gate_level(inverse, qubits):
+    fast = _random_simulator(5, 0)
+    reference = fast.copy()
+    apply_qft(fast, qubits, inverse)
+    execute(qft_circuit(5, qubits, inverse), reference)
+    np.testing.assert_allclose(fast.state, reference.state, atol=1e-10)
+
+
+@pytest.mark.parametrize("num_qubits", [2, 3, 5])
+def test_grover_matches_gate_level(num_qubits):
+    marked = [2 ** num_qubits - 1] if num_qubits < 4 else [2 ** num_qubits - 1, 1]
+    fast = grover_search(num_qubits, marked)
+    assert verify(grover_circuit(num_qubits, marked), fast) == pytest.approx(1.0)
+    assert verify(grover_circuit(num_qubits, marked, gate_level=True), fast) == pytest.approx(1.0)
+    assert fast.get_probabilities()[marked].sum() > 0.8
+
+
+def test_verify_detects_wrong_fast_result():
+    assert verify(grover_circuit(4, [3]), grover_search(4, [5])) < 0.1
+
+
+def test_gate_level_has_no_diagonal_operations():
+    compact = grover_circuit(4, [6])
+    assert any(op.kind == DIAGONAL for op in compact)
+    for circuit in (gate_level_circuit(compact), grover_circuit(4, [6], gate_level=True)):
+        assert {op.kind for op in circuit} <= {"H", "X", "Z"}
+        reference = execute(compact, QuantumSimulator(4))
+        np.testing.assert_allclose(execute(circuit, QuantumSimulator(4)).state, reference.state, atol=1e-12)
+
+
+def test_parity_oracle_is_single_z():
+    circuit = phase_oracle_circuit(6, lambda x: x & 1)
+    assert [(op.kind, op.targets) for op in circuit] == [("Z", (5,))]
+
+
+@pytest.mark.parametrize("f, expected", [
+    (lambda x: x & 1, "balanced"),
+    (lambda x: (x >> 2) & 1, "balanced"),
+    (np.zeros(16, dtype=int), "constant"),
+])
+def test_deutsch_jozsa(f, expected):
+    simulator = QuantumSimulator(4)
+    kind, _ = deutsch_jozsa(4, f, simulator)
+    assert kind == expected
+    assert verify(deutsch_jozsa_circuit(4, f), simulator) == pytest.approx(1.0)
+    assert verify(deutsch_jozsa_circuit(4, f, gate_level=True), simulator) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("secret", [0, 5, 31])
+def test_bernstein_vazirani(secret):
+    assert bernstein_vazirani(5, secret) == secret
+    reference = execute(bernstein_vazirani_circuit(5, secret), QuantumSimulator(5))
+    assert int(np.argmax(reference.get_probabilities())) == secret
+
+
+def test_gate_level_circuit_rejects_general_phases():
+    circuit = phase_oracle_circuit(2, [1])
+    circuit.operations[0].matrix = np.exp(1j * np.arange(4.0))
+    with pytest.raises(ValueError):
+        gate_level_circuit(circuit)
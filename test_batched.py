@@ -0,0 +1,123 @@
+# test_batched.py
+# BatchedSimulator against one QuantumSimulator per batch member: shared and
+# per-member gates, blocked circuit runs, marginals, sampling shapes and the
+# batch-size suggestion of the memory check; parameter sweeps against the
+# same circuit bound one value at a time.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import (
+    QuantumSimulator, MemoryBudgetError, HADAMARD, PAULI_X, T_GATE, estimate_memory,
+    rx_gate, ry_gate, rz_gate, phase_gate, u3_gate
+)
+from circuit import Circuit, Parameter, execute
+from batched import BatchedSimulator, check_batch_memory, sweep
+
+
+def _random_states(batch, num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    states = rng.normal(size=(batch, 2 ** num_qubits)) + 1j * rng.normal(size=(batch, 2 ** num_qubits))
+    return states / np.linalg.norm(states, axis=1, keepdims=True)
+
+
+def _circuit():
+    circuit = Circuit(4)
+    circuit.append("H", [0])
+    circuit.append("CNOT", [2], [0])
+    circuit.append("RY", [1], params=(0.3,))
+    circuit.append("CCX", [3], [1, 2])
+    circuit.append("T", [3])
+    circuit.append("SWAP", [0, 3])
+    circuit.append("CZ", [1], [3])
+    return circuit
+
+
+def test_run_matches_single_simulators():
+    states = _random_states(5, 4, 0)
+    batched = BatchedSimulator.from_states(states).run(_circuit(), block_size=2)
+    for state, row in zip(states, batched.state):
+        reference = QuantumSimulator(4)
+        reference.state = state.copy()
+        np.testing.assert_allclose(row, execute(_circuit(), reference).state, atol=1e-12)
+
+
+def test_per_member_gates():
+    angles = np.linspace(0, np.pi, 6)
+    batched = BatchedSimulator(2, len(angles))
+    batched.apply_gate(HADAMARD, 0)
+    batched.apply_gate(ry_gate(angles), 1, 0)
+    for angle, row in zip(angles, batched.state):
+        reference = QuantumSimulator(2)
+        reference.apply_gate(HADAMARD, 0)
+        reference.apply_gate(ry_gate(angle), 1, 0)
+        np.testing.assert_allclose(row, reference.state, atol=1e-12)
+    with pytest.raises(ValueError):
+        batched.apply_gate(ry_gate(angles[:3]), 1)
+
+
+def test_basis_state_sweep():
+    batched = BatchedSimulator.from_basis_states(3, [0, 3, 5, 7])
+    batched.apply_gate(PAULI_X, 2, [0, 1])
+    assert list(np.argmax(batched.get_probabilities(), axis=1)) == [0, 3, 5, 6]
+    np.testing.assert_allclose(batched.marginal_probabilities([2]), [[1, 0], [0, 1], [0, 1], [1, 0]])
+
+
+def test_sampling_shapes():
+    batched = BatchedSimulator.from_states(_random_states(3, 3, 1))
+    batched.apply_gate(T_GATE, 1)
+    assert batched.measure(50, rng=0).shape == (3, 50)
+    counts = batched.measure_counts(100, rng=0, qubits=[2, 0])
+    assert counts.shape == (3, 4)
+    assert (counts.sum(axis=1) == 100).all()
+
+
+def test_memory_check_suggests_batch_size():
+    budget = 10 * estimate_memory(10)["total"]
+    with pytest.raises(MemoryBudgetError) as error:
+        check_batch_memory(10, 64, memory_budget=budget)
+    assert error.value.suggestion == {"batch_size": 10}
+    BatchedSimulator(10, 10, memory_budget=budget)
+
+
+def _ansatz():
+    theta, phi = Parameter("theta"), Parameter("phi")
+    circuit = Circuit(3)
+    circuit.append("RY", [0], params=(theta,))
+    circuit.append("RX", [1], [0], params=(phi,))
+    circuit.append("U3", [2], params=(theta, 0.2, phi))
+    circuit.append("P", [2], [1], params=(theta,))
+    circuit.append("RZ", [0], params=(0.5,))
+    return circuit
+
+
+def test_rotation_gates_broadcast():
+    angles = np.linspace(0, 2 * np.pi, 5)
+    for gate in (rx_gate, ry_gate, rz_gate, phase_gate):
+        matrices = gate(angles)
+        assert matrices.shape == (5, 2, 2)
+        for angle, matrix in zip(angles, matrices):
+            np.testing.assert_allclose(matrix, gate(angle), atol=1e-15)
+            np.testing.assert_allclose(matrix.conj().T @ matrix, np.eye(2), atol=1e-12)
+    assert u3_gate(angles, 0.1, angles[:, None]).shape == (5, 5, 2, 2)
+
+
+def test_sweep_matches_bound_circuits():
+    circuit = _ansatz()
+    assert circuit.parameters == ["theta", "phi"]
+    thetas, phis = np.linspace(0, np.pi, 7), np.linspace(-1, 1, 7)
+    batched = sweep(circuit, {"theta": thetas, "phi": phis}, block_size=3)
+    for theta, phi, row in zip(thetas, phis, batched.state):
+        reference = execute(circuit.bind({"theta": theta, "phi": phi}), QuantumSimulator(3))
+        np.testing.assert_allclose(row, reference.state, atol=1e-12)
+    scalar = sweep(circuit, {"theta": thetas, "phi": 0.4})
+    assert scalar.batch_size == len(thetas)
+
+
+def test_sweep_rejects_bad_values():
+    with pytest.raises(ValueError):
+        sweep(_ansatz(), {"theta": np.zeros(3), "phi": np.zeros(4)})
+    with pytest.raises(ValueError):
+        _ansatz().bind({"theta": 1.0})
+    with pytest.raises(ValueError):
+        Circuit(1).append("RX", [0], params=(1.0, 2.0))
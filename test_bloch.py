@@ -0,0 +1,74 @@
+# test_bloch.py
+# Single-qubit RDMs and Bloch vectors against an explicit partial trace of
+# |ψ⟩⟨ψ|, for state vectors, simulators and density matrices.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, S_GATE
+from stabilizer import AutoSimulator
+from density import DensityMatrixSimulator, NoiseModel, depolarizing
+from bloch import single_qubit_rdms, bloch_vectors, reduced_density_matrix, MAX_SUBSET_QUBITS
+
+
+def _random_state(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    return state / np.linalg.norm(state)
+
+
+def _partial_trace(state, qubits):
+    n = len(state).bit_length() - 1
+    rho = np.outer(state, state.conj()).reshape((2,) * (2 * n))
+    rest = [q for q in range(n) if q not in qubits]
+    rows = list(range(n))
+    cols = [q if q in rest else n + q for q in range(n)]
+    return np.einsum(rho, rows + cols, list(qubits) + [n + q for q in qubits]).reshape(2 ** len(qubits), -1)
+
+
+def test_single_qubit_rdms_match_partial_trace():
+    state = _random_state(5, 0)
+    rdms = single_qubit_rdms(state)
+    for q in range(5):
+        np.testing.assert_allclose(rdms[q], _partial_trace(state, [q]), atol=1e-12)
+
+
+@pytest.mark.parametrize("qubits", [[3], [4, 1], [2, 0, 3]])
+def test_subset_rdm_matches_partial_trace(qubits):
+    state = _random_state(5, 1)
+    np.testing.assert_allclose(reduced_density_matrix(state, qubits), _partial_trace(state, qubits), atol=1e-12)
+    rho = np.outer(state, state.conj())
+    np.testing.assert_allclose(reduced_density_matrix(rho, qubits), _partial_trace(state, qubits), atol=1e-12)
+
+
+def test_bloch_vectors_of_known_states():
+    sim = QuantumSimulator(4)
+    sim.apply_gate(HADAMARD, 0)
+    sim.apply_gate(HADAMARD, 1)
+    sim.apply_gate(S_GATE, 1)
+    sim.apply_gate(PAULI_X, 2)
+    expected = [[1, 0, 0], [0, 1, 0], [0, 0, -1], [0, 0, 1]]
+    np.testing.assert_allclose(bloch_vectors(sim), expected, atol=1e-12)
+    auto = AutoSimulator(2)
+    auto.apply_gate(HADAMARD, 0)
+    auto.apply_gate(PAULI_X, 1, 0)
+    np.testing.assert_allclose(bloch_vectors(auto), np.zeros((2, 3)), atol=1e-12)
+
+
+def test_density_matrix_target():
+    noise_model = NoiseModel().add_gate_error(depolarizing(0.3), ["U"])
+    rho = DensityMatrixSimulator(2, noise_model=noise_model)
+    rho.apply_gate(HADAMARD, 0)
+    vectors = bloch_vectors(rho)
+    assert 0 < vectors[0, 0] < 1
+    np.testing.assert_allclose(bloch_vectors(single_qubit_rdms(rho)), vectors)
+
+
+def test_invalid_subsets_rejected():
+    state = _random_state(3, 2)
+    with pytest.raises(ValueError):
+        reduced_density_matrix(state, [0, 0])
+    with pytest.raises(ValueError):
+        reduced_density_matrix(state, [3])
+    with pytest.raises(ValueError):
+        reduced_density_matrix(np.zeros(2 ** (MAX_SUBSET_QUBITS + 1)), range(MAX_SUBSET_QUBITS + 1))
@@ -0,0 +1,89 @@
+# test_circuit.py
+# compile_circuit on random circuits (same final state as the uncompiled
+# circuit, never more operations), barriers around measurement and
+# classical conditions, and the branching shot sampler.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import Circuit, DIAGONAL, compile_circuit, execute, sample_circuit
+
+
+KINDS = ["H", "X", "Y", "Z", "S", "SDG", "T", "TDG", "RX", "RZ", "CNOT", "CZ", "CY", "SWAP", "CCX"]
+
+
+def _random_circuit(num_qubits, num_gates, seed):
+    rng = np.random.default_rng(seed)
+    circuit = Circuit(num_qubits)
+    for _ in range(num_gates):
+        kind = KINDS[rng.integers(len(KINDS))]
+        a, b, c = (int(q) for q in rng.choice(num_qubits, size=3, replace=False))
+        if kind in ("RX", "RZ"):
+            circuit.append(kind, [a], params=(rng.uniform(0, 2 * np.pi),))
+        elif kind == "SWAP":
+            circuit.append(kind, [a, b])
+        elif kind == "CCX":
+            circuit.append(kind, [a], [b, c])
+        elif kind.startswith("C"):
+            circuit.append(kind, [a], [b])
+        else:
+            circuit.append(kind, [a])
+        if rng.random() < 0.2:
+            # Pasangan yang saling membatalkan untuk pass cancel
+            circuit.append("H", [a])
+            circuit.append("H", [a])
+    return circuit
+
+
+@pytest.mark.parametrize("seed", range(6))
+def test_compiled_circuit_is_equivalent(seed):
+    circuit = _random_circuit(5, 60, seed)
+    compiled, report = compile_circuit(circuit)
+    assert report["gates_before"] == len(circuit)
+    assert report["gates_after"] == len(compiled) <= len(circuit)
+    expected = execute(circuit, QuantumSimulator(5)).state
+    np.testing.assert_allclose(execute(compiled, QuantumSimulator(5)).state, expected, atol=1e-10)
+
+
+def test_inverse_pairs_cancel():
+    circuit = Circuit(2)
+    for kind in ("H", "CNOT", "CNOT", "H"):
+        circuit.append(kind, [1], [0] if kind == "CNOT" else [])
+    compiled, _ = compile_circuit(circuit)
+    assert len(compiled) == 0
+
+
+def test_diagonal_operations_stay_unmerged():
+    circuit = Circuit(3)
+    circuit.append(DIAGONAL, [0, 2], matrix=[1, -1, 1, -1])
+    circuit.append("CZ", [2], [0])
+    compiled, _ = compile_circuit(circuit)
+    assert all(op.matrix.ndim == 1 or op.kind != "U" for op in compiled)
+    np.testing.assert_allclose(execute(compiled, QuantumSimulator(3)).state,
+                               execute(circuit, QuantumSimulator(3)).state, atol=1e-12)
+
+
+def test_measurement_and_conditions_are_barriers():
+    circuit = Circuit(2)
+    circuit.append("H", [0])
+    circuit.append("MEASURE", [0], params=(0,))
+    circuit.append("H", [0])
+    circuit.append("X", [1], condition=(0, 1))
+    circuit.append("X", [1], condition=(0, 1))
+    compiled, _ = compile_circuit(circuit)
+    assert [op.kind for op in compiled if 0 in op.qubits] == ["H", "MEASURE", "H"]
+    assert [op.condition for op in compiled if op.kind == "X"] == [(0, 1), (0, 1)]
+
+
+def test_sample_circuit_teleports_conditioned_bit():
+    circuit = Circuit(2)
+    circuit.append("H", [0])
+    circuit.append("MEASURE", [0], params=(0,))
+    circuit.append("X", [1], condition=(0, 1))
+    circuit.append("MEASURE", [1], params=(1,))
+    circuit.append("RESET", [0])
+    counts = sample_circuit(circuit, 2000, rng=0)
+    assert set(counts) == {"00", "11"}
+    assert sum(counts.values()) == 2000
+    assert counts["11"] == pytest.approx(1000, abs=150)
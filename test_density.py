@@ -0,0 +1,74 @@
+# test_density.py
+# DensityMatrixSimulator against QuantumSimulator for noiseless circuits and
+# against run_trajectories under Kraus noise, plus readout error on
+# mid-circuit measurements sampled through sample_circuit.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import Circuit, execute, sample_circuit
+from density import DensityMatrixSimulator, NoiseModel, depolarizing, amplitude_damping, phase_damping
+from trajectories import run_trajectories
+
+
+def _circuit():
+    circuit = Circuit(3)
+    circuit.append("H", [0])
+    circuit.append("CNOT", [1], [0])
+    circuit.append("RY", [2], params=(0.9,))
+    circuit.append("CZ", [2], [1])
+    circuit.append("T", [0])
+    circuit.append("H", [2])
+    return circuit
+
+
+def test_noiseless_matches_statevector():
+    reference = execute(_circuit(), QuantumSimulator(3))
+    rho = execute(_circuit(), DensityMatrixSimulator(3))
+    np.testing.assert_allclose(rho.get_probabilities(), reference.get_probabilities(), atol=1e-12)
+    assert rho.purity() == pytest.approx(1.0)
+    assert rho.fidelity(reference.state) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("kraus", [depolarizing(0.2), amplitude_damping(0.3), phase_damping(0.4)])
+def test_kraus_channels_are_trace_preserving(kraus):
+    total = sum(k.conj().T @ k for k in kraus)
+    np.testing.assert_allclose(total, np.eye(2), atol=1e-12)
+    noise_model = NoiseModel().add_gate_error(kraus, ["H", "CNOT", "CZ", "T", "RY"])
+    rho = execute(_circuit(), DensityMatrixSimulator(3, noise_model=noise_model))
+    assert np.trace(rho.rho).real == pytest.approx(1.0)
+    assert rho.purity() < 1.0
+
+
+def test_matches_trajectories():
+    noise_model = NoiseModel().add_gate_error(depolarizing(0.1), ["H", "CNOT", "CZ", "RY"])
+    noise_model.add_qubit_error(amplitude_damping(0.1), [0])
+    exact = execute(_circuit(), DensityMatrixSimulator(3, noise_model=noise_model)).get_probabilities()
+    result = run_trajectories(_circuit(), noise_model, trajectories=4000, workers=1, seed=0)
+    for key, probability in result["probabilities"].items():
+        error = result["probability_errors"][key]
+        assert probability == pytest.approx(exact[int(key, 2)], abs=5 * error + 1e-3)
+
+
+def test_forced_measurement_reports_readout_error():
+    noise_model = NoiseModel().add_readout_error(0.0, 1.0, qubits=[0])
+    rho = DensityMatrixSimulator(1, noise_model=noise_model)
+    rho.apply_gate(np.array([[0, 1], [1, 0]]), 0)
+    assert rho.measure_qubit(0, outcome=1, rng=0) == 0
+    assert rho.marginal_probabilities([0])[1] == pytest.approx(1.0)
+
+
+def test_sample_circuit_applies_readout_error():
+    circuit = Circuit(2)
+    circuit.append("X", [0])
+    circuit.append("MEASURE", [0], params=(0,))
+    circuit.append("MEASURE", [1], params=(1,))
+    noise_model = NoiseModel().add_readout_error(0.1, 0.2)
+    shots = 20000
+    counts = sample_circuit(circuit, shots, DensityMatrixSimulator(2, noise_model=noise_model), rng=0)
+    assert sum(counts.values()) == shots
+    expected = {"10": 0.8 * 0.9, "11": 0.8 * 0.1, "00": 0.2 * 0.9, "01": 0.2 * 0.1}
+    for key, probability in expected.items():
+        assert counts.get(key, 0) / shots == pytest.approx(probability, abs=0.015)
+    assert sample_circuit(circuit, 100, rng=0) == {"10": 100}
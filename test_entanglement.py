@@ -0,0 +1,81 @@
+# test_entanglement.py
+# Schmidt spectra and entropies against the eigenvalues of the reduced density
+# matrix, known states (product, Bell, GHZ), Rényi limits, the randomized
+# top-k path, the per-version cache and the contiguous-cut profile.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, ry_gate
+from density import DensityMatrixSimulator
+from bloch import reduced_density_matrix
+from entanglement import (
+    schmidt_coefficients, entanglement_entropy, spectrum_entropy, schmidt_rank, entanglement_profile
+)
+
+
+def _random_state(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    return state / np.linalg.norm(state)
+
+
+def _ghz(num_qubits):
+    sim = QuantumSimulator(num_qubits)
+    sim.apply_gate(HADAMARD, 0)
+    for q in range(num_qubits - 1):
+        sim.apply_gate(PAULI_X, q + 1, q)
+    return sim
+
+
+@pytest.mark.parametrize("qubits", [[0], [1, 3], [4, 2, 0], [2, 3, 4]])
+def test_spectrum_matches_reduced_density_matrix(qubits):
+    state = _random_state(5, 0)
+    eigenvalues = np.sort(np.linalg.eigvalsh(reduced_density_matrix(state, qubits)))[::-1]
+    coefficients = schmidt_coefficients(state, qubits)
+    np.testing.assert_allclose(coefficients[:len(eigenvalues)] ** 2, eigenvalues[:len(coefficients)], atol=1e-12)
+    entropy = -sum(p * np.log2(p) for p in eigenvalues if p > 1e-15)
+    assert entanglement_entropy(state, qubits) == pytest.approx(entropy)
+
+
+def test_known_states():
+    assert entanglement_entropy(QuantumSimulator(3), [0]) == pytest.approx(0.0)
+    ghz = _ghz(4)
+    assert entanglement_entropy(ghz, [0, 1]) == pytest.approx(1.0)
+    assert schmidt_rank(schmidt_coefficients(ghz, [2])) == 2
+    coefficients = schmidt_coefficients(_random_state(4, 1), [0, 1])
+    assert spectrum_entropy(coefficients, 2) <= spectrum_entropy(coefficients) + 1e-12
+    assert spectrum_entropy(coefficients, np.inf) <= spectrum_entropy(coefficients, 2) + 1e-12
+
+
+def test_top_k_matches_full_spectrum():
+    # Spektrum menurun geometris (state keterikatan rendah) dengan basis Schmidt acak
+    rng = np.random.default_rng(2)
+    bases = [np.linalg.qr(rng.normal(size=(64, 64)) + 1j * rng.normal(size=(64, 64)))[0] for _ in range(2)]
+    spectrum = 0.5 ** np.arange(64)
+    spectrum /= np.linalg.norm(spectrum)
+    state = (bases[0] * spectrum) @ bases[1].T
+    full = schmidt_coefficients(state.reshape(-1), range(6))
+    np.testing.assert_allclose(full, spectrum, atol=1e-12)
+    np.testing.assert_allclose(schmidt_coefficients(state.reshape(-1), range(6), top_k=4), full[:4], rtol=1e-6)
+
+
+def test_cache_follows_state_version():
+    sim = _ghz(3)
+    first = schmidt_coefficients(sim, [0])
+    assert schmidt_coefficients(sim, [1, 2]) is first
+    sim.apply_gate(ry_gate(0.4), 0)
+    assert schmidt_coefficients(sim, [0]) is not first
+
+
+def test_profile_and_rejections():
+    profile = entanglement_profile(_ghz(6))
+    assert profile["cuts"] == [1, 2, 3, 4, 5]
+    np.testing.assert_allclose(profile["entropies"], 1.0)
+    assert profile["max_rank"] == 2
+    assert profile["mps_recommended"]
+    assert entanglement_profile(_random_state(6, 3), max_bond=4)["mps_recommended"] is False
+    with pytest.raises(ValueError):
+        entanglement_entropy(DensityMatrixSimulator(2), [0])
+    with pytest.raises(ValueError):
+        schmidt_coefficients(_random_state(3, 4), [0, 0])
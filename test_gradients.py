@@ -0,0 +1,79 @@
+# test_gradients.py
+# Adjoint gradients against parameter-shift and central finite differences,
+# including controlled rotations, shared parameters, U3 and batched values.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import Circuit, Parameter, execute
+from observables import expectation
+from gradients import adjoint_gradient, parameter_shift_gradient, gradient
+
+
+HAMILTONIAN = {"ZZI": 1.0, "IXX": -0.5, "YIZ": 0.3, "ZII": 0.2}
+
+
+def _ansatz():
+    a, b, c = Parameter("a"), Parameter("b"), Parameter("c")
+    circuit = Circuit(3)
+    circuit.append("H", [0])
+    circuit.append("RY", [1], params=(a,))
+    circuit.append("RX", [2], [1], params=(b,))
+    circuit.append("CNOT", [0], [2])
+    circuit.append("RZ", [0], params=(a,))
+    circuit.append("P", [1], [0], params=(c,))
+    circuit.append("U3", [2], params=(b, c, 0.4))
+    circuit.append("RY", [0], [2], params=(c,))
+    return circuit
+
+
+VALUES = {"a": 0.3, "b": -1.1, "c": 2.0}
+
+
+def _finite_difference(circuit, values, name, step=1e-6):
+    shifted = []
+    for sign in (1, -1):
+        bound = circuit.bind({**values, name: values[name] + sign * step})
+        shifted.append(expectation(execute(bound, QuantumSimulator(circuit.num_qubits)), HAMILTONIAN))
+    return (shifted[0] - shifted[1]) / (2 * step)
+
+
+def test_adjoint_matches_finite_differences():
+    value, gradients = adjoint_gradient(_ansatz(), HAMILTONIAN, VALUES)
+    reference = expectation(execute(_ansatz().bind(VALUES), QuantumSimulator(3)), HAMILTONIAN)
+    assert value == pytest.approx(reference)
+    for name in VALUES:
+        assert gradients[name] == pytest.approx(_finite_difference(_ansatz(), VALUES, name), abs=1e-6)
+
+
+def test_adjoint_matches_parameter_shift():
+    value, gradients = adjoint_gradient(_ansatz(), HAMILTONIAN, VALUES)
+    shift_value, shift_gradients = parameter_shift_gradient(_ansatz(), HAMILTONIAN, VALUES)
+    assert value == pytest.approx(shift_value)
+    for name in VALUES:
+        assert gradients[name] == pytest.approx(shift_gradients[name], abs=1e-10)
+
+
+def test_batched_values():
+    values = {"a": np.linspace(-1, 1, 4), "b": np.linspace(0, 2, 4), "c": 0.7}
+    values_out, gradients = gradient(_ansatz(), HAMILTONIAN, values)
+    shift_values, shift_gradients = gradient(_ansatz(), HAMILTONIAN, values, method="parameter_shift")
+    assert values_out.shape == (4,)
+    np.testing.assert_allclose(values_out, shift_values, atol=1e-12)
+    for name in VALUES:
+        np.testing.assert_allclose(gradients[name], shift_gradients[name], atol=1e-10)
+    for k in range(4):
+        single = {name: float(np.ravel(v)[k]) if np.ndim(v) else v for name, v in values.items()}
+        assert gradients["a"][k] == pytest.approx(adjoint_gradient(_ansatz(), HAMILTONIAN, single)[1]["a"])
+
+
+def test_rejects_measurement_and_unknown_method():
+    circuit = _ansatz()
+    circuit.append("MEASURE", [0], params=(0,))
+    with pytest.raises(ValueError):
+        adjoint_gradient(circuit, HAMILTONIAN, VALUES)
+    with pytest.raises(ValueError):
+        gradient(_ansatz(), HAMILTONIAN, VALUES, method="finite")
+    with pytest.raises(ValueError):
+        gradient(_ansatz(), HAMILTONIAN, {"a": 1.0})
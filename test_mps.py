@@ -0,0 +1,78 @@
+# test_mps.py
+# MPSSimulator against QuantumSimulator on random circuits (adjacent, distant
+# and controlled gates), marginals, perfect sampling, mid-circuit measurement,
+# and truncation bookkeeping when the bond dimension is capped.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, T_GATE, ry_gate
+from mps import MPSSimulator
+
+
+def _random_circuit(simulators, num_qubits, num_gates, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(num_gates):
+        kind = rng.integers(4)
+        a, b, c = (int(q) for q in rng.choice(num_qubits, size=3, replace=False))
+        for sim in simulators:
+            if kind == 0:
+                sim.apply_gate(HADAMARD, a)
+            elif kind == 1:
+                sim.apply_gate(ry_gate(0.7), a, b)
+            elif kind == 2:
+                sim.apply_gate(PAULI_X, a, [b, c])
+            else:
+                sim.apply_swap(a, b)
+                sim.apply_gate(T_GATE, c)
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_circuit_matches_statevector(seed):
+    mps, reference = MPSSimulator(6), QuantumSimulator(6)
+    _random_circuit([mps, reference], 6, 40, seed)
+    np.testing.assert_allclose(mps.get_amplitudes(), reference.state, atol=1e-10)
+    assert mps.truncation_error == pytest.approx(0.0, abs=1e-20)
+    assert mps.amplitude(5) == pytest.approx(reference.state[5])
+
+
+def test_marginals_match_statevector():
+    mps, reference = MPSSimulator(5), QuantumSimulator(5)
+    _random_circuit([mps, reference], 5, 30, 7)
+    for qubits in ([0], [4, 1], [2, 0, 3]):
+        np.testing.assert_allclose(mps.marginal_probabilities(qubits), reference.marginal_probabilities(qubits),
+                                   atol=1e-10)
+
+
+def test_ghz_keeps_bond_dimension_two():
+    mps = MPSSimulator(30)
+    mps.apply_gate(HADAMARD, 0)
+    for q in range(29):
+        mps.apply_gate(PAULI_X, q + 1, q)
+    assert max(mps.bond_dimensions()) == 2
+    assert abs(mps.amplitude(0)) ** 2 == pytest.approx(0.5)
+    assert abs(mps.amplitude("1" * 30)) ** 2 == pytest.approx(0.5)
+    bits, counts = mps.sample_counts(1000, rng=0)
+    assert counts.sum() == 1000
+    assert {"".join(map(str, row)) for row in bits} <= {"0" * 30, "1" * 30}
+
+
+def test_bond_cap_records_truncation():
+    mps = MPSSimulator(8, max_bond=2)
+    reference = QuantumSimulator(8)
+    _random_circuit([mps, reference], 8, 60, 3)
+    assert max(mps.bond_dimensions()) <= 2
+    assert mps.truncation_error > 0
+    assert np.linalg.norm(mps.get_amplitudes()) == pytest.approx(1.0)
+
+
+def test_measure_qubit_collapses():
+    mps = MPSSimulator(3)
+    mps.apply_gate(HADAMARD, 0)
+    mps.apply_gate(PAULI_X, 2, 0)
+    outcome = mps.measure_qubit(0, rng=1)
+    assert mps.marginal_probabilities([2])[outcome] == pytest.approx(1.0)
+    copy = mps.copy()
+    copy.reset_qubit(2, outcome=outcome)
+    assert copy.marginal_probabilities([2])[0] == pytest.approx(1.0)
+    assert mps.marginal_probabilities([2])[outcome] == pytest.approx(1.0)
@@ -0,0 +1,81 @@
+# test_observables.py
+# Pauli-string expectations against the dense ⟨ψ|H|ψ⟩ on every supported
+# target: QuantumSimulator, AutoSimulator (stabilizer and state-vector mode),
+# BatchedSimulator and raw arrays, plus the shot-based estimator.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, T_GATE
+from stabilizer import AutoSimulator
+from batched import BatchedSimulator
+from observables import Hamiltonian, PauliString, apply_observable, expectation, estimate_expectation
+
+
+HAMILTONIAN = {"ZZI": -1.0, "XIX": 0.5, "IYY": 0.25, "ZIZ": 0.75, "III": 0.1}
+
+
+def _dense(state, observable, num_qubits):
+    matrix = Hamiltonian.from_dict(observable).matrix(num_qubits)
+    return float(np.vdot(state, matrix @ state).real)
+
+
+def _random_state(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    return state / np.linalg.norm(state)
+
+
+def test_array_and_simulator_match_dense():
+    state = _random_state(3, 0)
+    simulator = QuantumSimulator(3)
+    simulator.state = state
+    expected = _dense(state, HAMILTONIAN, 3)
+    assert expectation(state, HAMILTONIAN) == pytest.approx(expected)
+    assert expectation(simulator, HAMILTONIAN) == pytest.approx(expected)
+
+
+def test_single_pauli_string():
+    state = _random_state(3, 1)
+    term = PauliString({0: "X", 2: "Y"}, 2.0)
+    assert expectation(state, term) == pytest.approx(_dense(state, {"XIY": 2.0}, 3))
+
+
+def test_auto_simulator_stabilizer_mode():
+    simulator = AutoSimulator(2)
+    assert expectation(simulator, {"ZI": 1.0}) == pytest.approx(1.0)
+    simulator.apply_gate(HADAMARD, 0)
+    simulator.apply_gate(PAULI_X, 1, 0)
+    assert simulator.backend_name == "stabilizer"
+    assert expectation(simulator, {"ZZ": 1.0, "XX": 0.5, "ZI": 1.0}) == pytest.approx(1.5)
+
+
+def test_auto_simulator_statevector_mode():
+    simulator = AutoSimulator(3)
+    reference = QuantumSimulator(3)
+    for sim in (simulator, reference):
+        sim.apply_gate(HADAMARD, 0)
+        sim.apply_gate(T_GATE, 0)
+        sim.apply_gate(PAULI_X, 2, 0)
+    assert simulator.backend_name == "statevector"
+    assert expectation(simulator, HAMILTONIAN) == pytest.approx(expectation(reference, HAMILTONIAN))
+
+
+def test_batched_states():
+    states = np.stack([_random_state(3, seed) for seed in range(4)])
+    batched = BatchedSimulator.from_states(states)
+    values = expectation(batched, HAMILTONIAN)
+    np.testing.assert_allclose(values, [_dense(s, HAMILTONIAN, 3) for s in states], atol=1e-12)
+
+
+def test_apply_observable_matches_matrix():
+    state = _random_state(3, 2)
+    matrix = Hamiltonian.from_dict(HAMILTONIAN).matrix(3)
+    np.testing.assert_allclose(apply_observable(state, HAMILTONIAN), matrix @ state, atol=1e-12)
+
+
+def test_estimate_converges_to_exact():
+    simulator = QuantumSimulator(3)
+    simulator.state = _random_state(3, 3)
+    estimate = estimate_expectation(simulator, HAMILTONIAN, shots=200_000, rng=0)
+    assert estimate == pytest.approx(expectation(simulator, HAMILTONIAN), abs=0.02)
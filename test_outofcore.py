@@ -0,0 +1,90 @@
+# test_outofcore.py
+# MemmapSimulator against the in-RAM QuantumSimulator with slabs small enough
+# to force several passes, mid-circuit measurement, pass scheduling, and
+# clean-up of the temporary state file.
+
+import gc
+import os
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, T_GATE, ry_gate
+from circuit import Operation
+from outofcore import MemmapSimulator, schedule_passes
+
+
+def _random_circuit(simulators, num_qubits, num_gates, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(num_gates):
+        kind = rng.integers(4)
+        a, b, c = (int(q) for q in rng.choice(num_qubits, size=3, replace=False))
+        for sim in simulators:
+            if kind == 0:
+                sim.apply_gate(HADAMARD, a)
+            elif kind == 1:
+                sim.apply_gate(ry_gate(0.4), a, b)
+            elif kind == 2:
+                sim.apply_gate(PAULI_X, a, [b, c])
+            else:
+                sim.apply_swap(a, b)
+                sim.apply_gate(T_GATE, c)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_random_circuit_matches_statevector(seed):
+    reference = QuantumSimulator(8)
+    with MemmapSimulator(8, block_bytes=16 * 2 ** 5) as sim:
+        _random_circuit([sim, reference], 8, 40, seed)
+        np.testing.assert_allclose(np.array(sim.state), reference.state, atol=1e-10)
+        np.testing.assert_allclose(sim.marginal_probabilities([7, 0]), reference.marginal_probabilities([7, 0]),
+                                   atol=1e-12)
+        assert sim.io_report()["passes"] > 1
+
+
+def test_single_precision_matches_statevector():
+    reference = QuantumSimulator(6)
+    with MemmapSimulator(6, block_bytes=8 * 2 ** 4, dtype=np.complex64) as sim:
+        _random_circuit([sim, reference], 6, 30, 5)
+        assert sim.state.dtype == np.complex64
+        np.testing.assert_allclose(np.array(sim.state), reference.state, atol=1e-5)
+
+
+@pytest.mark.parametrize("qubit", [0, 5])
+def test_measure_qubit_collapses(qubit):
+    with MemmapSimulator(6, block_bytes=16 * 2 ** 3) as sim:
+        sim.apply_gate(HADAMARD, qubit)
+        sim.apply_gate(PAULI_X, 3, qubit)
+        outcome = sim.measure_qubit(qubit, rng=0)
+        assert sim.marginal_probabilities([3])[outcome] == pytest.approx(1.0)
+        sim.reset_qubit(3, outcome=outcome)
+        assert sim.marginal_probabilities([3])[0] == pytest.approx(1.0)
+
+
+def test_schedule_keeps_order_of_non_commuting_operations():
+    ops = [Operation("H", [0]), Operation("H", [1]), Operation("CNOT", [2], [0]), Operation("H", [5])]
+    passes = schedule_passes(ops, chunk_start=4, max_high=2)
+    flat = [op for _, pass_ops in passes for op in pass_ops]
+    assert flat.index(ops[0]) < flat.index(ops[2])
+    assert all(len(high) <= 2 for high, _ in passes)
+
+
+def test_temporary_file_removed_on_close_and_collection():
+    sim = MemmapSimulator(4)
+    path = sim.path
+    assert os.path.exists(path)
+    sim.close()
+    assert not os.path.exists(path)
+    sim = MemmapSimulator(4)
+    path = sim.path
+    del sim
+    gc.collect()
+    assert not os.path.exists(path)
+
+
+def test_explicit_path_is_kept(tmp_path):
+    path = str(tmp_path / "state.bin")
+    with MemmapSimulator(4, path=path) as sim:
+        sim.apply_gate(HADAMARD, 0)
+        sim.flush()
+    assert os.path.getsize(path) == 16 * 16
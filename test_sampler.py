@@ -0,0 +1,50 @@
+# test_sampler.py
+# Sampler frequencies on both paths (binary search and multinomial counts),
+# seeded reproducibility, and the per-state sampler cache of QuantumSimulator.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, ry_gate
+from sampler import Sampler, as_generator
+
+
+PROBABILITIES = np.array([0.1, 0.0, 0.4, 0.05, 0.0, 0.25, 0.2, 0.0])
+
+
+@pytest.mark.parametrize("shots", [5, 200_000])
+def test_sample_and_counts_follow_distribution(shots):
+    sampler = Sampler(PROBABILITIES)
+    np.testing.assert_allclose(sampler.probabilities(), PROBABILITIES, atol=1e-15)
+    outcomes = sampler.sample(shots, rng=0)
+    assert len(outcomes) == shots
+    assert not np.isin(outcomes, np.flatnonzero(PROBABILITIES == 0)).any()
+    indices, counts = sampler.counts(shots, rng=1)
+    assert counts.sum() == shots
+    assert PROBABILITIES[indices].min() > 0
+    if shots > 1000:
+        np.testing.assert_allclose(np.bincount(outcomes, minlength=8) / shots, PROBABILITIES, atol=0.005)
+        frequencies = np.zeros(8)
+        frequencies[indices] = counts / shots
+        np.testing.assert_allclose(frequencies, PROBABILITIES, atol=0.005)
+
+
+def test_seeded_runs_repeat():
+    sampler = Sampler(PROBABILITIES)
+    np.testing.assert_array_equal(sampler.sample(100, rng=7), sampler.sample(100, rng=7))
+    generator = np.random.default_rng(3)
+    assert as_generator(generator) is generator
+
+
+def test_simulator_caches_sampler_until_state_changes():
+    sim = QuantumSimulator(3)
+    sim.apply_gate(HADAMARD, 0)
+    sim.apply_gate(PAULI_X, 2, 0)
+    first = sim.sampler()
+    assert sim.sampler() is first
+    assert sim.sampler([0, 2]) is not first
+    indices, counts = sim.measure_counts(1000, rng=0)
+    assert set(indices.tolist()) <= {0, 5}
+    sim.apply_gate(ry_gate(0.3), 1)
+    assert sim.sampler() is not first
+    assert sim.measure(10, rng=0).shape == (10,)
@@ -0,0 +1,101 @@
+# test_sharded.py
+# ShardedSimulator against the single-array QuantumSimulator: random states,
+# every shard count, and gates whose target / controls sit on global or local
+# axes (including the case where target + controls use up every local axis).
+
+import itertools
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from sharded import ShardedSimulator
+
+
+GATES = {
+    "H": np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2),
+    "Z": np.diag([1, -1]).astype(complex),
+    "RY": np.array([[np.cos(0.3), -np.sin(0.3)], [np.sin(0.3), np.cos(0.3)]], dtype=complex),
+}
+
+
+def _random_state(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    return state / np.linalg.norm(state)
+
+
+def _pair(num_qubits, num_shards, seed=0):
+    state = _random_state(num_qubits, seed)
+    reference = QuantumSimulator(num_qubits)
+    reference.state = state.copy()
+    sharded = ShardedSimulator(num_qubits, num_shards=num_shards, transport="local")
+    sharded.state = state.copy()
+    return reference, sharded
+
+
+def _placements(num_qubits, max_controls=2):
+    """(target, controls) untuk semua target dan kombinasi control sampai max_controls"""
+    for target in range(num_qubits):
+        rest = [q for q in range(num_qubits) if q != target]
+        for k in range(max_controls + 1):
+            for controls in itertools.combinations(rest, k):
+                yield target, list(controls)
+
+
+@pytest.mark.parametrize("num_shards", [1, 2, 4, 8])
+@pytest.mark.parametrize("name", sorted(GATES))
+def test_gate_matches_reference(num_shards, name):
+    num_qubits = 5
+    for target, controls in _placements(num_qubits):
+        reference, sharded = _pair(num_qubits, num_shards, seed=target)
+        free = num_qubits - len({target, *controls} | set(range(sharded.global_qubits)))
+        if target < sharded.global_qubits and free < 1:
+            # Tidak ada sumbu lokal bebas untuk menukar target global
+            with pytest.raises(ValueError):
+                sharded.apply_gate(GATES[name], target, controls or None)
+            continue
+        reference.apply_gate(GATES[name], target, controls or None)
+        sharded.apply_gate(GATES[name], target, controls or None)
+        np.testing.assert_allclose(sharded.state, reference.state, atol=1e-12,
+                                   err_msg=f"{name} target={target} controls={controls}")
+
+
+def test_controls_fill_every_local_axis():
+    # Target 2 + control [3, 4] memakai ketiga sumbu lokal (view 0-d)
+    for name in ("H", "Z"):
+        reference, sharded = _pair(5, 4)
+        reference.apply_gate(GATES[name], 2, [3, 4])
+        sharded.apply_gate(GATES[name], 2, [3, 4])
+        np.testing.assert_allclose(sharded.state, reference.state, atol=1e-12)
+
+
+def test_global_target_without_free_local_axis_raises():
+    sharded = ShardedSimulator(4, num_shards=4, transport="local")
+    with pytest.raises(ValueError, match="free local qubit"):
+        sharded.apply_gate(np.array([[0, 1], [1, 0]], dtype=complex), 0, [2, 3])
+
+
+@pytest.mark.parametrize("num_shards", [2, 4, 8])
+def test_gate_sequence_matches_reference(num_shards):
+    num_qubits = 6
+    reference, sharded = _pair(num_qubits, num_shards, seed=1)
+    rng = np.random.default_rng(2)
+    for _ in range(40):
+        target, *controls = rng.choice(num_qubits, size=rng.integers(1, 3), replace=False).tolist()
+        gate = GATES[rng.choice(sorted(GATES))]
+        reference.apply_gate(gate, target, controls or None)
+        sharded.apply_gate(gate, target, controls or None)
+    np.testing.assert_allclose(sharded.state, reference.state, atol=1e-10)
+
+
+def test_shared_memory_transport_matches_reference():
+    state = _random_state(5, 3)
+    reference = QuantumSimulator(5)
+    reference.state = state.copy()
+    with ShardedSimulator(5, num_shards=4, transport="shared", workers=2) as sharded:
+        sharded.state = state.copy()
+        for target, controls in [(0, [3, 4]), (2, [3, 4]), (4, [0]), (1, [])]:
+            reference.apply_gate(GATES["H"], target, controls or None)
+            sharded.apply_gate(GATES["H"], target, controls or None)
+        np.testing.assert_allclose(sharded.state, reference.state, atol=1e-12)
@@ -0,0 +1,277 @@
+# test_simulator.py
+# QuantumSimulator fast paths (strided kernel, controlled gates, lazy
+# diagonal and permutation queues, precision, sampling, marginals and
+# mid-circuit collapse) against the dense 2^n x 2^n reference engine.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import (
+    QuantumSimulator, MemoryBudgetError, HADAMARD, PAULI_X, PAULI_Y, S_GATE, T_GATE, MAX_QUBITS,
+    check_memory, estimate_memory, u3_gate
+)
+from circuit import Circuit, execute, sample_circuit
+from stabilizer import AutoSimulator
+
+
+def _random_unitary(rng):
+    return u3_gate(*rng.uniform(0, 2 * np.pi, size=3))
+
+
+def _random_state(num_qubits, seed):
+    rng = np.random.default_rng(seed)
+    state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+    return state / np.linalg.norm(state)
+
+
+def _pair(num_qubits, seed, **kwargs):
+    """(simulator strided, referensi dense) dengan state awal acak yang sama"""
+    fast = QuantumSimulator(num_qubits, **kwargs)
+    reference = QuantumSimulator(num_qubits, engine="dense")
+    fast.state = _random_state(num_qubits, seed)
+    reference.state = fast.state.copy()
+    return fast, reference
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_strided_single_qubit_gates_match_dense(seed):
+    rng = np.random.default_rng(seed)
+    fast, reference = _pair(5, seed)
+    for _ in range(30):
+        gate, target = _random_unitary(rng), int(rng.integers(5))
+        fast.apply_gate(gate, target)
+        reference.apply_gate(gate, target)
+    np.testing.assert_allclose(fast.state, reference.state, atol=1e-12)
+
+
+def test_apply_matrix_matches_kron():
+    rng = np.random.default_rng(4)
+    fast = QuantumSimulator(3)
+    state = _random_state(3, 4)
+    fast.state = state.copy()
+    matrix = np.kron(_random_unitary(rng), _random_unitary(rng)) @ np.diag(np.exp(1j * rng.uniform(size=4)))
+    fast.apply_matrix(matrix, [2, 0])
+    # Urutan sumbu (2, 0, 1): gate menjadi matrix ⊗ I pada vektor yang dipermutasi
+    permuted = state.reshape(2, 2, 2).transpose(2, 0, 1).reshape(-1)
+    expected = (np.kron(matrix, np.eye(2)) @ permuted).reshape(2, 2, 2).transpose(1, 2, 0).reshape(-1)
+    np.testing.assert_allclose(fast.state, expected, atol=1e-12)
+
+
+def test_unknown_engine_rejected():
+    with pytest.raises(ValueError):
+        QuantumSimulator(2, engine="sparse")
+
+
+@pytest.mark.parametrize("controls", [[0], [3, 1], [4, 0, 2]])
+def test_multi_controlled_gates_match_dense(controls):
+    rng = np.random.default_rng(len(controls))
+    fast, reference = _pair(5, 5)
+    target = next(q for q in range(5) if q not in controls)
+    for gate in (_random_unitary(rng), HADAMARD, PAULI_X, PAULI_Y, T_GATE):
+        fast.apply_gate(gate, target, controls)
+        reference.apply_gate(gate, target, controls)
+    np.testing.assert_allclose(fast.state, reference.state, atol=1e-12)
+
+
+def test_controlled_gate_leaves_unselected_amplitudes():
+    fast = QuantumSimulator(3)
+    state = _random_state(3, 6)
+    fast.state = state.copy()
+    fast.apply_controlled(_random_unitary(np.random.default_rng(6)), 2, [0, 1])
+    np.testing.assert_array_equal(fast.state[:6], state[:6])
+
+
+@pytest.mark.parametrize("target, controls", [(1, [1]), (0, [2, 2])])
+def test_invalid_controls_rejected(target, controls):
+    with pytest.raises(ValueError):
+        QuantumSimulator(3).apply_gate(PAULI_X, target, controls)
+
+
+def test_diagonal_gates_are_queued_and_match_dense():
+    rng = np.random.default_rng(7)
+    fast, reference = _pair(5, 7)
+    for _ in range(25):
+        gate = np.diag(np.exp(1j * rng.uniform(0, 2 * np.pi, size=2)))
+        target, control = (int(q) for q in rng.choice(5, size=2, replace=False))
+        controls = [control] if rng.random() < 0.5 else None
+        for sim in (fast, reference):
+            sim.apply_gate(gate, target, controls)
+            sim.apply_gate(S_GATE, control)
+    assert fast._pending_phases
+    np.testing.assert_allclose(fast.state, reference.state, atol=1e-12)
+    assert not fast._pending_phases
+
+
+def test_apply_diagonal_matches_full_diagonal():
+    fast = QuantumSimulator(4)
+    state = _random_state(4, 8)
+    fast.state = state.copy()
+    phases = np.exp(1j * np.arange(8.0))
+    fast.apply_diagonal(phases, [3, 0, 1])
+    # Indeks basis qubit (3, 0, 1) dari setiap amplitudo
+    bits = (np.arange(16)[:, None] >> (3 - np.array([3, 0, 1]))) & 1
+    expected = state * phases[bits @ [4, 2, 1]]
+    np.testing.assert_allclose(fast.state, expected, atol=1e-12)
+
+
+def _swap_by_cnots(sim, a, b):
+    for target, control in ((a, b), (b, a), (a, b)):
+        sim.apply_gate(PAULI_X, target, control)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_permutation_gates_are_queued_and_match_dense(seed):
+    rng = np.random.default_rng(seed)
+    fast, reference = _pair(5, 10 + seed)
+    for step in range(30):
+        a, b, c = (int(q) for q in rng.choice(5, size=3, replace=False))
+        kind = rng.integers(4)
+        if kind == 0:
+            fast.apply_gate(PAULI_X, a)
+            reference.apply_gate(PAULI_X, a)
+        elif kind == 1:
+            fast.apply_gate(PAULI_X, a, b)
+            reference.apply_gate(PAULI_X, a, b)
+        elif kind == 2:
+            fast.apply_swap(a, b)
+            _swap_by_cnots(reference, a, b)
+        else:
+            # Toffoli (permutasi eksplisit) dan Y = fase·X
+            fast.apply_gate(PAULI_X, a, [b, c])
+            fast.apply_gate(PAULI_Y, c)
+            reference.apply_gate(PAULI_X, a, [b, c])
+            reference.apply_gate(PAULI_Y, c)
+    assert fast._pending_perm is not None or fast._pending_phases
+    np.testing.assert_allclose(fast.state, reference.state, atol=1e-12)
+
+
+def test_self_inverse_permutations_flush_to_identity():
+    fast = QuantumSimulator(3)
+    state = _random_state(3, 11)
+    fast.state = state.copy()
+    fast.apply_gate(PAULI_X, 1, 0)
+    fast.apply_swap(0, 2)
+    fast.apply_swap(0, 2)
+    fast.apply_gate(PAULI_X, 1, 0)
+    np.testing.assert_array_equal(fast.state, state)
+
+
+def test_memory_budget_suggests_what_fits():
+    need = estimate_memory(20)["total"]
+    with pytest.raises(MemoryBudgetError) as error:
+        QuantumSimulator(20, memory_budget=need * 3 // 4)
+    assert error.value.suggestion == {"dtype": "complex64"}
+    with pytest.raises(MemoryBudgetError) as error:
+        check_memory(20, memory_budget=need // 8)
+    fit = error.value.suggestion["num_qubits"]
+    assert estimate_memory(fit)["total"] <= need // 8 < estimate_memory(fit + 1)["total"]
+    with pytest.raises(MemoryBudgetError):
+        check_memory(MAX_QUBITS + 1, memory_budget=np.inf)
+
+
+def test_large_register_stays_within_budget():
+    budget = 4 * estimate_memory(20)["total"]
+    sim = QuantumSimulator(20, memory_budget=budget)
+    sim.apply_gate(HADAMARD, 0)
+    for q in range(19):
+        sim.apply_gate(PAULI_X, q + 1, q)
+    sim.apply_gate(T_GATE, 19)
+    np.testing.assert_allclose(sim.marginal_probabilities([0, 19]), [0.5, 0, 0, 0.5], atol=1e-12)
+    assert sim.memory_footprint()["total"] <= budget
+
+
+def test_complex64_matches_complex128():
+    rng = np.random.default_rng(12)
+    single, reference = _pair(6, 12, precision="complex64")
+    for _ in range(40):
+        gate = _random_unitary(rng)
+        target, control = (int(q) for q in rng.choice(6, size=2, replace=False))
+        controls = control if rng.random() < 0.3 else None
+        for sim in (single, reference):
+            sim.apply_gate(gate, target, controls)
+            sim.apply_gate(T_GATE, control)
+    assert single.state.dtype == np.complex64
+    np.testing.assert_allclose(single.state, reference.state, atol=1e-5)
+    assert abs(single.get_probabilities().sum() - 1) < 1e-5
+    with pytest.raises(ValueError):
+        QuantumSimulator(2, precision="float32")
+
+
+def test_drift_beyond_tolerance_renormalizes():
+    sim = QuantumSimulator(3)
+    sim.apply_gate(HADAMARD * (1 + 1e-6), 0)
+    assert sim.renormalizations == 1
+    assert sim.norm_drift() < 1e-12
+    sim = QuantumSimulator(3, norm_tolerance=1.0)
+    for _ in range(10):
+        sim.apply_gate(HADAMARD * (1 + 1e-6), 1)
+    assert sim.renormalizations == 0
+    assert sum(sim.get_probabilities()) == pytest.approx(1.0, abs=1e-12)
+    assert sim.max_norm_drift > 0
+
+
+@pytest.mark.parametrize("qubits", [[0], [4, 1], [2, 0, 3], [0, 1, 2, 3, 4]])
+def test_marginals_match_summed_probabilities(qubits):
+    fast, _ = _pair(5, 13)
+    fast.apply_gate(T_GATE, 1)
+    probs = fast.get_probabilities().reshape((2,) * 5)
+    summed = probs.sum(axis=tuple(q for q in range(5) if q not in qubits))
+    # Sumbu sisa dalam urutan qubit menaik; susun ulang mengikuti urutan register
+    expected = np.transpose(summed, np.argsort(np.argsort(qubits))).reshape(-1)
+    np.testing.assert_allclose(fast.marginal_probabilities(qubits), expected, atol=1e-12)
+    indices, counts = fast.measure_counts(50_000, rng=0, qubits=qubits)
+    assert indices.max() < 2 ** len(qubits)
+    assert counts.sum() == 50_000
+
+
+@pytest.mark.parametrize("qubits", [[], [5], [1, 1]])
+def test_invalid_register_rejected(qubits):
+    with pytest.raises(ValueError):
+        QuantumSimulator(5).marginal_probabilities(qubits)
+
+
+def test_measure_qubit_projects_and_renormalizes():
+    fast, _ = _pair(4, 14)
+    before = fast.state.copy()
+    outcome = fast.measure_qubit(2, rng=0)
+    mask = ((np.arange(16) >> 1) & 1) == outcome
+    expected = np.where(mask, before, 0) / np.linalg.norm(before[mask])
+    np.testing.assert_allclose(fast.state, expected, atol=1e-12)
+    fast.reset_qubit(2, outcome=outcome)
+    assert fast.marginal_probabilities([2])[0] == pytest.approx(1.0)
+    with pytest.raises(ValueError):
+        fast.measure_qubit(2, outcome=1)
+
+
+def test_conditioned_gates_follow_classical_bits():
+    circuit = Circuit(3)
+    circuit.append("X", [0])
+    circuit.append("MEASURE", [0], params=(0,))
+    circuit.append("X", [1], condition=(0, 1))
+    circuit.append("X", [2], condition=(0, 0))
+    circuit.append("RESET", [0])
+    clbits = {}
+    sim = execute(circuit, QuantumSimulator(3), rng=0, clbits=clbits)
+    assert clbits == {0: 1}
+    assert sim.get_probabilities()[0b010] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("make", [QuantumSimulator, AutoSimulator])
+def test_sample_circuit_branches_match_per_shot_execution(make):
+    circuit = Circuit(3)
+    circuit.append("H", [0])
+    circuit.append("RY", [1], params=(1.1,))
+    circuit.append("MEASURE", [0], params=(0,))
+    circuit.append("CNOT", [2], [1])
+    circuit.append("H", [1], condition=(0, 1))
+    circuit.append("MEASURE", [1], params=(1,))
+    circuit.append("RESET", [2])
+    circuit.append("MEASURE", [2], params=(2,))
+    shots = 20_000
+    counts = sample_circuit(circuit, shots, make(3), rng=0)
+    assert sum(counts.values()) == shots
+    assert all(key[2] == "0" for key in counts)
+    p1 = np.sin(0.55) ** 2
+    expected = {"000": (1 - p1) / 2, "010": p1 / 2, "100": 0.25, "110": 0.25}
+    for key, probability in expected.items():
+        assert counts.get(key, 0) / shots == pytest.approx(probability, abs=0.015)
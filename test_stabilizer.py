@@ -0,0 +1,84 @@
+# test_stabilizer.py
+# StabilizerSimulator against QuantumSimulator on random Clifford circuits
+# (equal up to global phase), large-register sampling, and AutoSimulator
+# switching to the state vector at the first non-Clifford gate.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator, HADAMARD, PAULI_X, PAULI_Y, PAULI_Z, S_GATE, T_GATE
+from stabilizer import StabilizerSimulator, AutoSimulator, clifford_name
+
+
+SINGLE = [HADAMARD, PAULI_X, PAULI_Y, PAULI_Z, S_GATE, S_GATE.conj().T]
+CONTROLLED = [PAULI_X, PAULI_Y, PAULI_Z]
+
+
+def _random_clifford(simulators, num_qubits, num_gates, seed):
+    rng = np.random.default_rng(seed)
+    for _ in range(num_gates):
+        a, b = (int(q) for q in rng.choice(num_qubits, size=2, replace=False))
+        kind, single, controlled = rng.integers(3), rng.integers(len(SINGLE)), rng.integers(len(CONTROLLED))
+        for sim in simulators:
+            if kind == 0:
+                sim.apply_gate(SINGLE[single], a)
+            elif kind == 1:
+                sim.apply_gate(CONTROLLED[controlled], a, b)
+            else:
+                sim.apply_swap(a, b)
+
+
+def _overlap(a, b):
+    return abs(np.vdot(a, b))
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_random_clifford_matches_statevector(seed):
+    tableau, reference = StabilizerSimulator(5), QuantumSimulator(5)
+    _random_clifford([tableau, reference], 5, 40, seed)
+    assert _overlap(tableau.to_statevector(), reference.state) == pytest.approx(1.0)
+    np.testing.assert_allclose(tableau.marginal_probabilities([4, 1]), reference.marginal_probabilities([4, 1]),
+                               atol=1e-12)
+
+
+def test_clifford_name_up_to_global_phase():
+    assert clifford_name(1j * HADAMARD) == "H"
+    assert clifford_name(PAULI_X, 0) == "CNOT"
+    assert clifford_name(T_GATE) is None
+    with pytest.raises(ValueError):
+        StabilizerSimulator(2).apply_gate(T_GATE, 0)
+
+
+def test_large_ghz_sampling():
+    tableau = StabilizerSimulator(200)
+    tableau.apply_gate(HADAMARD, 0)
+    for q in range(199):
+        tableau.apply_gate(PAULI_X, q + 1, q)
+    indices, counts = tableau.measure_counts(500, rng=0, qubits=[0, 100, 199])
+    assert counts.sum() == 500
+    assert set(np.asarray(indices).tolist()) <= {0, 7}
+    outcome = tableau.measure_qubit(50, rng=1)
+    assert tableau.marginal_probabilities([199])[outcome] == pytest.approx(1.0)
+
+
+def test_auto_switches_at_first_non_clifford_gate():
+    auto, reference = AutoSimulator(4), QuantumSimulator(4)
+    _random_clifford([auto, reference], 4, 20, 9)
+    assert auto.backend_name == "stabilizer"
+    for sim in (auto, reference):
+        sim.apply_gate(T_GATE, 2)
+        sim.apply_gate(HADAMARD, 2)
+    assert auto.backend_name == "statevector"
+    assert _overlap(auto.get_amplitudes(), reference.state) == pytest.approx(1.0)
+    copy = auto.copy()
+    auto.reset()
+    assert auto.backend_name == "stabilizer"
+    assert copy.backend_name == "statevector"
+
+
+def test_auto_diagonal_switches_to_statevector():
+    auto = AutoSimulator(2)
+    auto.apply_gate(HADAMARD, 0)
+    auto.apply_diagonal([1, 1, 1, -1], [0, 1])
+    assert auto.backend_name == "statevector"
+    np.testing.assert_allclose(auto.get_probabilities(), [0.5, 0, 0.5, 0], atol=1e-12)
@@ -0,0 +1,77 @@
+# test_statecache.py
+# PrefixStateCache: resumed runs reach the same state as a fresh run, the
+# walk stops at measurement, compiled segments, LRU eviction under the byte
+# budget, and the simulator memory budget gate on storing checkpoints.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import Circuit, execute
+from statecache import PrefixStateCache, operation_key
+
+
+def _circuit(num_gates, seed, num_qubits=4):
+    rng = np.random.default_rng(seed)
+    circuit = Circuit(num_qubits)
+    for _ in range(num_gates):
+        a, b = (int(q) for q in rng.choice(num_qubits, size=2, replace=False))
+        kind = ["H", "T", "CNOT", "RY"][rng.integers(4)]
+        if kind == "CNOT":
+            circuit.append(kind, [a], [b])
+        elif kind == "RY":
+            circuit.append(kind, [a], params=(float(rng.uniform(0, np.pi)),))
+        else:
+            circuit.append(kind, [a])
+    return circuit
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_resumed_run_matches_fresh_run(optimize):
+    cache = PrefixStateCache(checkpoint_interval=4)
+    circuit = _circuit(20, 0)
+    first = cache.run(QuantumSimulator(4), circuit, optimize=optimize)
+    assert first == {"gates": 20, "skipped": 0, "passes": first["passes"]}
+    assert first["passes"] <= 20 if optimize else first["passes"] == 20
+    longer = Circuit(4, circuit.operations + _circuit(6, 1).operations)
+    sim = QuantumSimulator(4)
+    report = cache.run(sim, longer, optimize=optimize)
+    assert report["skipped"] == 20
+    np.testing.assert_allclose(sim.state, execute(longer, QuantumSimulator(4)).state, atol=1e-12)
+    assert cache.stats()["hits"] == 1
+
+
+def test_walk_stops_at_measurement():
+    circuit = _circuit(6, 2)
+    circuit.append("MEASURE", [0], params=(0,))
+    circuit.append("H", [1])
+    assert operation_key(circuit.operations[6]) is None
+    cache = PrefixStateCache(checkpoint_interval=4)
+    cache.run(QuantumSimulator(4), circuit)
+    assert cache.stats()["entries"] == 2
+    assert not cache.store(4, circuit.operations, np.zeros(16, dtype=complex))
+
+
+def test_custom_matrices_are_keyed_by_content():
+    a, b = Circuit(1), Circuit(1)
+    a.append("U", [0], matrix=np.eye(2))
+    b.append("U", [0], matrix=np.diag([1, -1]))
+    assert operation_key(a.operations[0]) != operation_key(b.operations[0])
+
+
+def test_lru_eviction_respects_byte_budget():
+    state_bytes = 16 * 2 ** 4
+    cache = PrefixStateCache(max_bytes=3 * state_bytes, checkpoint_interval=2)
+    cache.run(QuantumSimulator(4), _circuit(12, 3))
+    stats = cache.stats()
+    assert stats["bytes"] <= 3 * state_bytes
+    assert stats["evictions"] > 0
+    assert not cache.store(4, _circuit(2, 4).operations, np.zeros(2 ** 6, dtype=complex))
+
+
+def test_simulator_budget_blocks_checkpoints():
+    sim = QuantumSimulator(4)
+    sim.memory_budget = sim.memory_footprint()["total"]
+    cache = PrefixStateCache(checkpoint_interval=2)
+    cache.run(sim, _circuit(8, 5))
+    assert cache.stats()["entries"] == 0
@@ -0,0 +1,91 @@
+# test_timeline.py
+# Timeline seek / undo / redo against a fresh run of each prefix, with and
+# without the prefix cache and compilation; recorded measurement outcomes,
+# in-place inversion of self-inverse spans, and the checkpoint memory cap.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import Circuit, Operation, execute
+from statecache import PrefixStateCache
+from timeline import Timeline
+
+
+def _operations(num_gates, seed, num_qubits=3):
+    rng = np.random.default_rng(seed)
+    ops = []
+    for _ in range(num_gates):
+        a, b = (int(q) for q in rng.choice(num_qubits, size=2, replace=False))
+        kind = ["H", "T", "CNOT", "RX", "X"][rng.integers(5)]
+        if kind == "CNOT":
+            ops.append(Operation(kind, [a], [b]))
+        elif kind == "RX":
+            ops.append(Operation(kind, [a], params=(float(rng.uniform(0, np.pi)),)))
+        else:
+            ops.append(Operation(kind, [a]))
+    return ops
+
+
+def _reference(ops, num_qubits=3):
+    return execute(Circuit(num_qubits, ops), QuantumSimulator(num_qubits)).state
+
+
+@pytest.mark.parametrize("cache, optimize", [(False, False), (False, True), (True, True)])
+def test_seek_matches_fresh_run(cache, optimize):
+    ops = _operations(30, 0)
+    timeline = Timeline(QuantumSimulator(3), checkpoint_interval=4,
+                        cache=PrefixStateCache(checkpoint_interval=4) if cache else None, optimize=optimize)
+    timeline.extend(ops)
+    assert timeline.last_run["gates"] == 30
+    for index in (29, 3, 17, 0, 30, 12, 13, 11):
+        timeline.seek(index)
+        np.testing.assert_allclose(timeline.simulator.state, _reference(ops[:index]), atol=1e-12)
+    with pytest.raises(ValueError):
+        timeline.seek(31)
+
+
+def test_undo_redo_and_truncated_redo_tail():
+    ops = _operations(10, 1)
+    timeline = Timeline(QuantumSimulator(3), checkpoint_interval=4)
+    timeline.extend(ops)
+    timeline.undo().undo()
+    assert timeline.position == 8 and timeline.can_redo
+    timeline.redo()
+    np.testing.assert_allclose(timeline.simulator.state, _reference(ops[:9]), atol=1e-12)
+    extra = Operation("H", [2])
+    timeline.apply(extra)
+    assert len(timeline) == 10 and not timeline.can_redo
+    np.testing.assert_allclose(timeline.simulator.state, _reference(ops[:9] + [extra]), atol=1e-12)
+
+
+def test_recorded_measurements_replay_deterministically():
+    timeline = Timeline(QuantumSimulator(2), checkpoint_interval=2)
+    timeline.append("H", [0])
+    outcome = timeline.apply(Operation("MEASURE", [0], params=(0,)), rng=7)
+    timeline.append("X", [1], condition=(0, 1))
+    timeline.append("H", [1])
+    after = timeline.simulator.state.copy()
+    timeline.seek(0)
+    timeline.seek(4)
+    np.testing.assert_allclose(timeline.simulator.state, after, atol=1e-12)
+    assert timeline.clbits == {0: outcome}
+
+
+def test_self_inverse_span_is_inverted_in_place():
+    timeline = Timeline(QuantumSimulator(3), checkpoint_interval=100)
+    ops = [Operation("H", [q]) for q in range(3)] + [Operation("CNOT", [1], [0]), Operation("X", [2])]
+    timeline.extend(ops)
+    timeline.seek(3)
+    assert timeline.gates_inverted == 2 and timeline.gates_replayed == 0
+    np.testing.assert_allclose(timeline.simulator.state, _reference(ops[:3]), atol=1e-12)
+
+
+def test_checkpoint_cap_widens_interval():
+    state_bytes = 16 * 2 ** 3
+    timeline = Timeline(QuantumSimulator(3), checkpoint_interval=2, max_checkpoint_bytes=3 * state_bytes)
+    timeline.extend(_operations(24, 2))
+    assert timeline.memory_footprint()["checkpoints"] <= 3 * state_bytes
+    assert timeline.checkpoint_interval > 2
+    timeline.seek(5)
+    np.testing.assert_allclose(timeline.simulator.state, _reference(_operations(24, 2)[:5]), atol=1e-12)
@@ -0,0 +1,59 @@
+# test_trajectories.py
+# run_trajectories: worker-count independence, noiseless runs, expectation
+# values and readout error against the exact density-matrix engine.
+
+import numpy as np # type: ignore
+import pytest # type: ignore
+
+from simulator import PAULI_Z
+from circuit import Circuit, execute
+from density import DensityMatrixSimulator, NoiseModel, amplitude_damping, depolarizing, phase_damping
+from trajectories import run_trajectories
+
+
+def _circuit():
+    circuit = Circuit(2)
+    circuit.append("H", [0])
+    circuit.append("CNOT", [1], [0])
+    circuit.append("RY", [1], params=(0.6,))
+    return circuit
+
+
+def _noise_model():
+    noise_model = NoiseModel().add_gate_error(depolarizing(0.05), ["H", "CNOT"])
+    return noise_model.add_qubit_error(amplitude_damping(0.2), [1]).add_qubit_error(phase_damping(0.1), [0])
+
+
+def test_results_do_not_depend_on_workers():
+    serial = run_trajectories(_circuit(), _noise_model(), trajectories=300, shots=4, workers=1, seed=5, chunk_size=32)
+    parallel = run_trajectories(_circuit(), _noise_model(), trajectories=300, shots=4, workers=2, seed=5,
+                                chunk_size=32)
+    assert serial["counts"] == parallel["counts"]
+    assert serial["shots"] == sum(serial["counts"].values()) == 1200
+
+
+def test_noiseless_trajectories_are_exact():
+    result = run_trajectories(_circuit(), trajectories=8, shots=1, workers=1, seed=0,
+                              observables={"zz": (np.kron(PAULI_Z, PAULI_Z), [0, 1])})
+    assert result["expectation_errors"]["zz"] == pytest.approx(0.0, abs=1e-12)
+    assert result["expectations"]["zz"] == pytest.approx(np.cos(0.6))
+
+
+def test_expectation_matches_density_matrix():
+    observable = np.kron(PAULI_Z, PAULI_Z)
+    rho = execute(_circuit(), DensityMatrixSimulator(2, noise_model=_noise_model())).rho
+    exact = float(np.trace(observable @ rho).real)
+    result = run_trajectories(_circuit(), _noise_model(), trajectories=3000, workers=1, seed=1,
+                              observables={"zz": (observable, [0, 1])})
+    assert result["expectations"]["zz"] == pytest.approx(exact, abs=5 * result["expectation_errors"]["zz"] + 1e-3)
+
+
+def test_readout_error_on_final_and_mid_circuit_measurement():
+    noise_model = NoiseModel().add_readout_error(0.0, 0.3)
+    circuit = Circuit(1)
+    circuit.append("X", [0])
+    result = run_trajectories(circuit, noise_model, trajectories=10, shots=2000, workers=1, seed=2)
+    assert result["probabilities"]["0"] == pytest.approx(0.3, abs=0.02)
+    circuit.append("MEASURE", [0], params=(0,))
+    result = run_trajectories(circuit, noise_model, trajectories=4000, workers=1, seed=3)
+    assert result["probabilities"]["0"] == pytest.approx(0.3, abs=0.03)
@@ -0,0 +1,210 @@
+# timeline.py
+# Undo / redo and step-through for an interactive session. The timeline owns
+# the simulator and the full operation history (including the redo tail),
+# records measurement / reset outcomes so any replay is deterministic, and
+# keeps a checkpoint (simulator copy + classical bits) every k gates under a
+# memory cap; position 0 is rebuilt with reset() instead of being stored.
+# Moving to gate i replays at most k gates from the nearest checkpoint; when
+# every gate in between is self-inverse and that is cheaper, it applies them
+# again in reverse instead, without touching a checkpoint.
+
+from circuit import Circuit, Operation, apply_operation, compile_circuit
+from statecache import operation_key
+
+
+# Gate yang merupakan inversnya sendiri (undo = terapkan sekali lagi)
+SELF_INVERSE_GATES = ("I", "H", "X", "Y", "Z", "CNOT", "CY", "CZ", "CCX", "SWAP")
+
+# Checkpoint default setiap sekian gate, dan batas total memori checkpoint (byte)
+DEFAULT_CHECKPOINT_INTERVAL = 8
+DEFAULT_CHECKPOINT_BYTES = 256 * 1024 ** 2
+
+
+def _footprint(simulator):
+    """Byte state (atau total) sebuah simulator"""
+    footprint = simulator.memory_footprint()
+    return footprint.get("state", footprint["total"])
+
+
+def is_self_inverse(op):
+    """True jika op unitary tanpa kondisi dan sama dengan inversnya (matrix bawaan, bukan kustom)"""
+    return op.kind in SELF_INVERSE_GATES and op.condition is None and not op.params
+
+
+class Timeline:
+    """Riwayat operasi dengan undo/redo/seek berbasis checkpoint
+
+    simulator: simulator awal dalam keadaan reset (dimiliki timeline; setelah seek bisa diganti
+    salinan checkpoint, jadi selalu baca timeline.simulator). cache: PrefixStateCache opsional untuk menjalankan
+    potongan unitary (hanya untuk simulator dengan state yang bisa di-set, mis. QuantumSimulator).
+    optimize: potongan unitary dijalankan lewat compile_circuit (riwayat tetap menyimpan operasi asli).
+    """
+    def __init__(self, simulator, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL,
+                 max_checkpoint_bytes=DEFAULT_CHECKPOINT_BYTES, cache=None, optimize=False):
+        self.simulator = simulator
+        self.num_qubits = simulator.num_qubits
+        self.checkpoint_interval = int(checkpoint_interval)
+        self.max_checkpoint_bytes = int(max_checkpoint_bytes)
+        self.cache = cache
+        self.optimize = optimize
+        self.operations = []
+        # Hasil ukur per operasi (None untuk gate unitary atau operasi bersyarat yang dilewati)
+        self.outcomes = []
+        self.position = 0
+        self.clbits = {}
+        # Laporan perpindahan terakhir: gate yang diminta, dilewati cache, operasi yang dijalankan
+        self.last_run = {"gates": 0, "skipped": 0, "passes": 0}
+        # Posisi -> (salinan simulator, bit klasik); posisi 0 tidak disimpan (dibangun dengan reset())
+        self._checkpoints = {}
+        self.gates_replayed = 0
+        self.gates_inverted = 0
+
+    @property
+    def circuit(self):
+        """Circuit operasi yang sudah diterapkan (sampai posisi saat ini)"""
+        return Circuit(self.num_qubits, self.operations[:self.position])
+
+    def __len__(self):
+        return len(self.operations)
+
+    @property
+    def can_undo(self):
+        return self.position > 0
+
+    @property
+    def can_redo(self):
+        return self.position < len(self.operations)
+
+    def _step(self, op, outcome=None, rng=None):
+        """Satu operasi maju pada simulator; MEASURE/RESET memakai hasil tercatat jika ada"""
+        if op.condition is not None and self.clbits.get(op.condition[0], 0) != op.condition[1]:
+            return None
+        if op.kind == "MEASURE":
+            outcome = self.simulator.measure_qubit(op.targets[0], outcome, rng)
+            self.clbits[op.params[0]] = outcome
+            return outcome
+        if op.kind == "RESET":
+            return self.simulator.reset_qubit(op.targets[0], outcome, rng)
+        apply_operation(self.simulator, op)
+        return None
+
+    def _checkpoint_bytes(self):
+        """Total byte semua checkpoint"""
+        return sum(_footprint(sim) for sim, _ in self._checkpoints.values())
+
+    def _checkpoint(self):
+        """Simpan checkpoint di kelipatan interval; batas memori dicek sebelum menyalin"""
+        if not self.position or self.position % self.checkpoint_interval or self.position in self._checkpoints:
+            return
+        size = _footprint(self.simulator)
+        limit = self.max_checkpoint_bytes
+        budget = getattr(self.simulator, "memory_budget", None)
+        if budget is not None:
+            # Salinan ikut dihitung dalam anggaran simulator (di samping state yang sedang dipakai)
+            limit = min(limit, budget - self.simulator.memory_footprint()["total"])
+        if size > limit:
+            return
+        while self._checkpoint_bytes() + size > limit:
+            # Grid kelipatan 2k adalah subset grid k, jadi replay tetap dibatasi interval baru
+            self.checkpoint_interval *= 2
+            self._checkpoints = {i: c for i, c in self._checkpoints.items() if i % self.checkpoint_interval == 0}
+            if self.position % self.checkpoint_interval:
+                return
+        self._checkpoints[self.position] = (self.simulator.copy(), dict(self.clbits))
+
+    def _advance(self, target, rng=None):
+        """Maju dari posisi saat ini ke target, checkpoint di setiap kelipatan interval"""
+        while self.position < target:
+            stop = min(target, (self.position // self.checkpoint_interval + 1) * self.checkpoint_interval)
+            chunk = self.operations[self.position:stop]
+            unitary = all(operation_key(op) is not None for op in chunk)
+            if unitary and self.cache is not None:
+                # Potongan unitary: lewat cache prefiks bersama (bisa lanjut dari sesi lain)
+                report = self.cache.run(self.simulator, Circuit(self.num_qubits, self.operations[:stop]),
+                                        self.position, self.optimize)
+            elif unitary and self.optimize:
+                compiled, _ = compile_circuit(Circuit(self.num_qubits, chunk))
+                for op in compiled:
+                    apply_operation(self.simulator, op)
+                report = {"gates": len(chunk), "skipped": 0, "passes": len(compiled)}
+            else:
+                for i in range(self.position, stop):
+                    self.outcomes[i] = self._step(self.operations[i], self.outcomes[i], rng)
+                report = {"gates": len(chunk), "skipped": 0, "passes": len(chunk)}
+            for key, value in report.items():
+                self.last_run[key] += value
+            self.position = stop
+            self._checkpoint()
+
+    def _truncate(self):
+        """Buang redo tail (operasi dan checkpoint setelah posisi saat ini)"""
+        del self.operations[self.position:]
+        del self.outcomes[self.position:]
+        self._checkpoints = {i: c for i, c in self._checkpoints.items() if i <= self.position}
+
+    def apply(self, op, rng=None):
+        """Terapkan satu Operation baru (redo tail dibuang); kembalikan hasil ukur atau None"""
+        return self.extend([op], rng)[-1]
+
+    def extend(self, ops, rng=None):
+        """Terapkan beberapa Operation baru berurutan; kembalikan daftar hasil ukur"""
+        self._truncate()
+        start = self.position
+        self.operations += list(ops)
+        self.outcomes += [None] * len(ops)
+        self.last_run = {"gates": 0, "skipped": 0, "passes": 0}
+        self._advance(len(self.operations), rng)
+        return self.outcomes[start:]
+
+    def append(self, kind, targets, controls=(), params=(), matrix=None, label=None, condition=None, rng=None):
+        """Seperti Circuit.append, tetapi langsung diterapkan; kembalikan Operation-nya"""
+        op = Operation(kind, targets, controls, params, matrix, label, condition)
+        self.apply(op, rng)
+        return op
+
+    def seek(self, index):
+        """Pindah ke keadaan setelah `index` operasi pertama (0 = state awal)"""
+        index = int(index)
+        if not 0 <= index <= len(self.operations):
+            raise ValueError(f"Timeline position must be within 0..{len(self.operations)}, got {index}")
+        if index == self.position:
+            return self
+        self.last_run = {"gates": 0, "skipped": 0, "passes": 0}
+        base = max((i for i in self._checkpoints if i <= index), default=0)
+        if index < self.position:
+            span = self.operations[index:self.position]
+            if all(is_self_inverse(op) for op in span) and len(span) <= index - base:
+                # Invers in-place: gate self-inverse diterapkan lagi dengan urutan terbalik
+                for op in reversed(span):
+                    apply_operation(self.simulator, op)
+                self.gates_inverted += len(span)
+                self.last_run.update(gates=len(span), passes=len(span))
+                self.position = index
+                return self
+        elif base <= self.position:
+            # Maju dari posisi saat ini lebih dekat daripada dari checkpoint
+            self._advance(index)
+            return self
+        if base:
+            simulator, clbits = self._checkpoints[base]
+            self.simulator = simulator.copy()
+            self.clbits = dict(clbits)
+        else:
+            self.simulator.reset()
+            self.clbits = {}
+        self.position = base
+        self.gates_replayed += index - base
+        self._advance(index)
+        return self
+
+    def undo(self):
+        """Mundur satu operasi"""
+        return self.seek(self.position - 1) if self.can_undo else self
+
+    def redo(self):
+        """Maju satu operasi yang sebelumnya di-undo"""
+        return self.seek(self.position + 1) if self.can_redo else self
+
+    def memory_footprint(self):
+        """Byte checkpoint dan jumlahnya"""
+        return {"checkpoints": self._checkpoint_bytes(), "count": len(self._checkpoints)}
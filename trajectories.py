@@ -0,0 +1,192 @@
+# trajectories.py
+# Monte Carlo trajectory noise simulation: each trajectory is a pure state on
+# QuantumSimulator where every Kraus channel picks one operator at random
+# (p_i = ‖K_i ψ‖²). Trajectories are split into fixed-size chunks, each with its
+# own SeedSequence child stream, and fanned out over a ProcessPoolExecutor;
+# results do not depend on the number of workers.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np # type: ignore
+
+from simulator import QuantumSimulator
+from circuit import NON_UNITARY, apply_operation
+
+
+# Jumlah trajectory per chunk (unit kerja worker dan unit stream RNG)
+DEFAULT_CHUNK_SIZE = 64
+
+
+def _prepare_channel(kraus_ops):
+    """Analisis channel sekali: bobot tetap dan unitary per cabang jika K_i = sqrt(p_i)·U_i"""
+    kraus_ops = [np.asarray(k, dtype=complex) for k in kraus_ops]
+    grams = [k.conj().T @ k for k in kraus_ops]
+    if not all(np.allclose(g, g[0, 0] * np.eye(2)) for g in grams):
+        # Bobot bergantung state (misalnya amplitude/phase damping)
+        return {"kraus": kraus_ops, "cdf": None}
+    weights = np.array([g[0, 0].real for g in grams])
+    unitaries = []
+    for k, w in zip(kraus_ops, weights):
+        u = k / np.sqrt(w) if w > 0 else k
+        # Cabang identitas (sampai fase global) tidak perlu pass pada state
+        unitaries.append(None if np.allclose(u, u[0, 0] * np.eye(2)) else u)
+    return {"kraus": kraus_ops, "cdf": np.cumsum(weights) / weights.sum(), "unitaries": unitaries}
+
+
+def _apply_channel(sim, channel, qubit, rng):
+    """Pilih satu operator Kraus secara acak (p_i = ‖K_i ψ‖²) dan terapkan pada state"""
+    kraus_ops = channel["kraus"]
+    if channel["cdf"] is not None:
+        choice = min(int(np.searchsorted(channel["cdf"], rng.random(), side="right")), len(kraus_ops) - 1)
+        if channel["unitaries"][choice] is not None:
+            sim.apply_gate(channel["unitaries"][choice], qubit)
+        return
+    # p_i = Tr(K_i ρ_q K_i†) dari density matrix tereduksi 2x2 qubit ini
+    view = sim.state.reshape(2 ** qubit, 2, -1)
+    rho = np.einsum("aib,ajb->ij", view, view.conj())
+    weights = np.clip([np.trace(k @ rho @ k.conj().T).real for k in kraus_ops], 0.0, None)
+    cdf = np.cumsum(weights)
+    choice = min(int(np.searchsorted(cdf, rng.random() * cdf[-1], side="right")), len(kraus_ops) - 1)
+    k = kraus_ops[choice]
+    # Operator non-unitary: update langsung pada dua setengah sumbu, lalu normalisasi
+    a0 = view[:, 0, :].copy()
+    view[:, 0, :] *= k[0, 0]
+    view[:, 0, :] += k[0, 1] * view[:, 1, :]
+    view[:, 1, :] *= k[1, 1]
+    view[:, 1, :] += k[1, 0] * a0
+    sim.version += 1
+    sim.renormalize()
+
+
+def _flip_readout(outcomes, confusions, rng):
+    """Terapkan readout error per shot: flip bit secara acak menurut matrix konfusi per posisi"""
+    k = len(confusions)
+    for position, confusion in enumerate(confusions):
+        bit = 1 << (k - 1 - position)
+        ones = (outcomes & bit) != 0
+        # P(baca 1 | sebenarnya 0) = confusion[1, 0], P(baca 0 | sebenarnya 1) = confusion[0, 1]
+        flip = rng.random(len(outcomes)) < np.where(ones, confusion[0, 1], confusion[1, 0])
+        outcomes = outcomes ^ (flip * bit)
+    return outcomes
+
+
+def _expectation(state, num_qubits, matrix, qubits):
+    """⟨ψ|O|ψ⟩ untuk observable lokal O pada qubits (kontraksi lokal, tanpa matrix 2^n)"""
+    k = len(qubits)
+    psi = state.reshape((2,) * num_qubits)
+    op = np.asarray(matrix, dtype=complex).reshape((2,) * (2 * k))
+    out = np.moveaxis(np.tensordot(op, psi, axes=(list(range(k, 2 * k)), list(qubits))), list(range(k)), list(qubits))
+    return float(np.vdot(psi, out).real)
+
+
+def _run_chunk(circuit, noise_model, trajectories, seed, shots, qubits, observables):
+    """Jalankan satu chunk trajectory (fungsi worker); kembalikan jumlah parsial"""
+    rng = np.random.default_rng(seed)
+    ops = circuit.operations
+    # Channel per operasi dianalisis sekali per chunk
+    channels = [[] for _ in ops]
+    if noise_model is not None:
+        prepared = {}
+        for i, op in enumerate(ops):
+            if op.kind in NON_UNITARY:
+                continue
+            for kraus_ops, qubit in noise_model.channels_for(op):
+                key = id(kraus_ops)
+                if key not in prepared:
+                    prepared[key] = _prepare_channel(kraus_ops)
+                channels[i].append((prepared[key], qubit))
+    # Prefix tanpa noise dan tanpa measure/reset dihitung sekali per chunk
+    prefix = 0
+    while prefix < len(ops) and ops[prefix].kind not in NON_UNITARY and not channels[prefix]:
+        prefix += 1
+    base = QuantumSimulator(circuit.num_qubits)
+    for op in ops[:prefix]:
+        apply_operation(base, op)
+    counts = {}
+    freq_sq = {}
+    sums = {name: [0.0, 0.0] for name in observables}
+    width = circuit.num_clbits
+    for t in range(trajectories):
+        sim = base.copy() if t < trajectories - 1 else base
+        clbits = {}
+        for i in range(prefix, len(ops)):
+            op = ops[i]
+            apply_operation(sim, op, clbits, rng)
+            if op.kind == "MEASURE" and noise_model is not None and noise_model.readout_errors:
+                clbit = op.params[0]
+                confusion = noise_model.confusion_matrix(op.targets[0])
+                clbits[clbit] = int(_flip_readout(np.array([clbits[clbit]]), [confusion], rng)[0])
+            for channel, qubit in channels[i]:
+                _apply_channel(sim, channel, qubit, rng)
+        if width:
+            # Circuit dengan MEASURE: hasil = bit klasik trajectory ini
+            keys = ["".join(str(clbits.get(c, 0)) for c in range(width))]
+            hits = [shots]
+        else:
+            outcomes = sim.measure(shots, rng, qubits)
+            if noise_model is not None and noise_model.readout_errors:
+                outcomes = _flip_readout(outcomes, [noise_model.confusion_matrix(q) for q in qubits], rng)
+            indices, hits = np.unique(outcomes, return_counts=True)
+            keys = [format(int(i), f"0{len(qubits)}b") for i in indices]
+        for key, hit in zip(keys, hits):
+            counts[key] = counts.get(key, 0) + int(hit)
+            freq_sq[key] = freq_sq.get(key, 0.0) + (hit / shots) ** 2
+        for name, (matrix, targets) in observables.items():
+            value = _expectation(sim.state, circuit.num_qubits, matrix, targets)
+            sums[name][0] += value
+            sums[name][1] += value * value
+    return counts, freq_sq, sums
+
+
+def _mean_error(total, total_sq, n):
+    """Rata-rata dan standard error dari jumlah dan jumlah kuadrat n sampel"""
+    mean = total / n
+    variance = max(total_sq / n - mean * mean, 0.0) * n / max(n - 1, 1)
+    return mean, float(np.sqrt(variance / n))
+
+
+def run_trajectories(circuit, noise_model=None, trajectories=1000, shots=1, qubits=None,
+                     observables=None, workers=None, seed=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Simulasi noise dengan N trajectory state murni, paralel di ProcessPoolExecutor
+
+    shots: shot per trajectory; qubits: register yang diukur (qubits[0] = bit kiri);
+    observables: dict nama -> (matrix Hermitian lokal, qubits). workers=1 berjalan
+    di proses ini. Hasil: counts, probabilitas dan ekspektasi dengan standard error.
+    """
+    qubits = list(range(circuit.num_qubits)) if qubits is None else [int(q) for q in qubits]
+    observables = dict(observables or {})
+    sizes = [min(chunk_size, trajectories - start) for start in range(0, trajectories, chunk_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(circuit, noise_model, size, s, shots, qubits, observables) for size, s in zip(sizes, seeds)]
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        parts = [_run_chunk(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(_run_chunk, *zip(*jobs)))
+
+    counts, freq_sq = {}, {}
+    sums = {name: [0.0, 0.0] for name in observables}
+    for part_counts, part_sq, part_sums in parts:
+        for key, hit in part_counts.items():
+            counts[key] = counts.get(key, 0) + hit
+            freq_sq[key] = freq_sq.get(key, 0.0) + part_sq[key]
+        for name, (total, total_sq) in part_sums.items():
+            sums[name][0] += total
+            sums[name][1] += total_sq
+    probabilities, probability_errors = {}, {}
+    for key in sorted(counts):
+        probabilities[key], probability_errors[key] = _mean_error(counts[key] / shots, freq_sq[key], trajectories)
+    expectations, expectation_errors = {}, {}
+    for name, (total, total_sq) in sums.items():
+        expectations[name], expectation_errors[name] = _mean_error(total, total_sq, trajectories)
+    return {
+        "counts": dict(sorted(counts.items())),
+        "probabilities": probabilities,
+        "probability_errors": probability_errors,
+        "expectations": expectations,
+        "expectation_errors": expectation_errors,
+        "trajectories": trajectories,
+        "shots": trajectories * shots,
+    }
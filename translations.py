@@ -35,38 +35,90 @@ When measured, a qubit **collapses** to one of the basis states (|0⟩ or |1⟩)
         "sidebar_settings": "⚙️ Simulation Settings",
         "num_qubits_label": "Number of Qubits:",
         "num_qubits_help": "Select the number of qubits for the quantum system (1-3 qubits)",
+        "large_register_label": "🧠 Large register mode",
+        "large_register_help": "Allow up to {max_qubits} qubits, limited by a memory budget",
+        "memory_budget_label": "Memory budget (MiB):",
+        "precision_label": "Precision:",
+        "precision_help": "complex64 halves memory and bandwidth; the norm is renormalized only when accumulated drift exceeds the tolerance",
+        "memory_error": "⛔ {num_qubits} qubits need about {needed} (state + buffers), budget is {budget}",
+        "memory_suggest_precision": "💡 This would fit with single precision ({dtype})",
+        "memory_suggest_qubits": "💡 At most {num_qubits} qubits fit in this budget",
+        "memory_footprint_label": "💾 Memory: {used}",
+        "norm_drift_label": "📏 Norm drift: {drift:.2e} ({count} renormalizations)",
+        "state_cache_label": "🗃️ Shared state cache: {hit_rate:.0f}% hits, {used}, {evictions} evictions",
+        "backend_label": "🧮 Backend: {backend}",
+        "backend_stabilizer": "Stabilizer (Clifford circuit)",
+        "backend_statevector": "State Vector",
         "add_gate_header": "🎛️ Add Quantum Gate",
         "select_gate": "Select Gate:",
         "select_gate_help": "Select the quantum gate to apply",
+        "rotation_angle_label": "Rotation angle θ (radians):",
         "target_qubit": "Target Qubit:",
         "target_qubit_help": "Qubit that will receive the gate",
         "apply_gate_btn": "➕ Apply Gate",
         "gate_applied_success": "✅ {gate_name} applied to Q{target}",
-        
-        # CNOT section
-        "cnot_header": "🔗 CNOT Gate (2-Qubit)",
+        "measure_qubit_btn": "📏 Measure Qubit",
+        "reset_qubit_btn": "↩️ Reset Qubit",
+        "qubit_measured_success": "📏 Q{target} measured: {outcome} (stored in c{clbit}), state collapsed",
+        "qubit_reset_success": "↩️ Q{target} reset to |0⟩",
+        "algorithms_header": "📚 Algorithms",
+        "algorithm_label": "Prebuilt algorithm",
+        "algorithm_qft": "Quantum Fourier Transform",
+        "algorithm_iqft": "Inverse QFT",
+        "algorithm_grover": "Grover search",
+        "algorithm_dj": "Deutsch-Jozsa",
+        "algorithm_bv": "Bernstein-Vazirani",
+        "grover_marked_label": "Marked state",
+        "bv_secret_label": "Secret string",
+        "dj_function_label": "Oracle function",
+        "dj_constant": "Constant",
+        "dj_balanced": "Balanced",
+        "load_algorithm_btn": "▶️ Load Algorithm",
+        "algorithm_loaded_success": "✅ {name} loaded ({count} gates)",
+        
+        # Multi-qubit gate section
+        "multi_qubit_header": "🔗 Multi-Qubit Gates",
+        "multi_qubit_gate_label": "Gate:",
         "control_label": "Control:",
         "target_label": "Target:",
         "cnot_info": "🔗 **CNOT**: Flip target qubit if control qubit = |1⟩",
-        "apply_cnot_btn": "➕ Apply CNOT",
-        "cnot_applied_success": "✅ CNOT applied (C: Q{control}, T: Q{target})",
+        "cz_info": "🔗 **CZ**: Flip the phase of |11⟩ (symmetric in control and target)",
+        "swap_info": "🔗 **SWAP**: Exchange the states of the two target qubits",
+        "ccx_info": "🔗 **CCX (Toffoli)**: Flip target qubit if both control qubits = |1⟩",
+        "apply_multi_qubit_btn": "➕ Apply {gate_name}",
+        "multi_qubit_applied_success": "✅ Applied {operation}",
         
         # Reset
         "reset_btn": "🔄 Reset System",
         "reset_warning": "⚠️ System reset to |0...0⟩",
+        "undo_btn": "↩️ Undo",
+        "redo_btn": "↪️ Redo",
+        "timeline_label": "🕒 Timeline (gates applied)",
+        "timeline_help": "Step through the circuit. States are checkpointed every {interval} gates, so any step replays at most that many gates; self-inverse gates are undone in place.",
+        "timeline_stats": "🕒 {checkpoints} checkpoints · {replayed} gates replayed · {inverted} inverted in place",
         
         # Main area
         "state_vector_header": " State Vector Visualization",
         "save_state_vector_btn": "💾 Save State Vector Graph",
         "measurement_header": " Measurement Simulation",
         "shots_label": "Number of Shots:",
+        "measured_qubits_label": "Measured Qubits:",
+        "measured_qubits_help": "Only the selected register is measured; the histogram shows its 2^k outcomes (first selected qubit = leftmost bit)",
         "save_measurement_btn": "💾 Save Measurement Histogram",
+        "show_bloch": "🌐 Show Bloch Spheres",
+        "bloch_header": "🌐 Bloch Spheres",
+        "bloch_qubits_label": "Qubits to draw",
+        "bloch_title": "Q{qubit} (|r| = {length:.3f})",
+        "rdm_qubits_label": "Reduced density matrix of qubits",
+        "rdm_title": "ρ ({qubits})",
         
         # State info
         "state_info_header": " State Information",
         "current_state": "#### 📍 Current State:",
         "circuit_history": "#### 🔧 Circuit History:",
         "no_gates_applied": "No gates applied yet",
+        "history_hidden": "… {count} earlier operations not shown",
+        "compile_report": "⚙️ Last run: {before} gates compiled to {after} passes over the state vector ({skipped} resumed from cache)",
         "show_matrix": "📐 Show Gate Matrix",
         "matrix_title": "Matrix",
         
@@ -92,6 +144,9 @@ When measured, a qubit **collapses** to one of the basis states (|0⟩ or |1⟩)
         "gate_pauli_z_desc": "Phase flip: changes the phase of |1⟩ to -|1⟩",
         "gate_s_desc": "Phase shift π/2: adds phase i to |1⟩",
         "gate_t_desc": "Phase shift π/4: important for universal computation",
+        "gate_rx_desc": "Rotation by angle θ around the X axis of the Bloch sphere",
+        "gate_ry_desc": "Rotation by angle θ around the Y axis: real amplitudes, tunable superposition",
+        "gate_rz_desc": "Rotation by angle θ around the Z axis: relative phase e^{iθ}",
         
         # Language selector
         "language_label": "🌐 Language:",
@@ -129,38 +184,90 @@ Saat diukur, qubit **collapse** ke salah satu basis state (|0⟩ atau |1⟩) den
         "sidebar_settings": "⚙️ Pengaturan Simulasi",
         "num_qubits_label": "Jumlah Qubit:",
         "num_qubits_help": "Pilih jumlah qubit untuk sistem kuantum (1-3 qubit)",
+        "large_register_label": "🧠 Mode register besar",
+        "large_register_help": "Izinkan hingga {max_qubits} qubit, dibatasi anggaran memori",
+        "memory_budget_label": "Anggaran memori (MiB):",
+        "precision_label": "Presisi:",
+        "precision_help": "complex64 memakai separuh memori dan bandwidth; norm dinormalisasi ulang hanya jika drift terakumulasi melewati toleransi",
+        "memory_error": "⛔ {num_qubits} qubit membutuhkan sekitar {needed} (state + buffer), anggaran {budget}",
+        "memory_suggest_precision": "💡 Muat jika memakai presisi tunggal ({dtype})",
+        "memory_suggest_qubits": "💡 Maksimal {num_qubits} qubit muat dalam anggaran ini",
+        "memory_footprint_label": "💾 Memori: {used}",
+        "norm_drift_label": "📏 Drift norm: {drift:.2e} ({count} renormalisasi)",
+        "state_cache_label": "🗃️ Cache state bersama: {hit_rate:.0f}% hit, {used}, {evictions} eviction",
+        "backend_label": "🧮 Backend: {backend}",
+        "backend_stabilizer": "Stabilizer (circuit Clifford)",
+        "backend_statevector": "State Vector",
         "add_gate_header": "🎛️ Tambahkan Quantum Gate",
         "select_gate": "Pilih Gate:",
         "select_gate_help": "Pilih quantum gate yang akan diterapkan",
+        "rotation_angle_label": "Sudut rotasi θ (radian):",
         "target_qubit": "Target Qubit:",
         "target_qubit_help": "Qubit yang akan dikenai gate",
         "apply_gate_btn": "➕ Aplikasikan Gate",
         "gate_applied_success": "✅ {gate_name} diterapkan pada Q{target}",
-        
-        # CNOT section
-        "cnot_header": "🔗 CNOT Gate (2-Qubit)",
+        "measure_qubit_btn": "📏 Ukur Qubit",
+        "reset_qubit_btn": "↩️ Reset Qubit",
+        "qubit_measured_success": "📏 Q{target} diukur: {outcome} (disimpan di c{clbit}), state collapse",
+        "qubit_reset_success": "↩️ Q{target} direset ke |0⟩",
+        "algorithms_header": "📚 Algoritma",
+        "algorithm_label": "Algoritma siap pakai",
+        "algorithm_qft": "Quantum Fourier Transform",
+        "algorithm_iqft": "QFT Invers",
+        "algorithm_grover": "Pencarian Grover",
+        "algorithm_dj": "Deutsch-Jozsa",
+        "algorithm_bv": "Bernstein-Vazirani",
+        "grover_marked_label": "State yang ditandai",
+        "bv_secret_label": "String rahasia",
+        "dj_function_label": "Fungsi oracle",
+        "dj_constant": "Konstan",
+        "dj_balanced": "Seimbang",
+        "load_algorithm_btn": "▶️ Muat Algoritma",
+        "algorithm_loaded_success": "✅ {name} dimuat ({count} gate)",
+        
+        # Multi-qubit gate section
+        "multi_qubit_header": "🔗 Gate Multi-Qubit",
+        "multi_qubit_gate_label": "Pilih Gate:",
         "control_label": "Control:",
         "target_label": "Target:",
         "cnot_info": "🔗 **CNOT**: Flip target qubit jika control qubit = |1⟩",
-        "apply_cnot_btn": "➕ Aplikasikan CNOT",
-        "cnot_applied_success": "✅ CNOT diterapkan (C: Q{control}, T: Q{target})",
+        "cz_info": "🔗 **CZ**: Membalik fase |11⟩ (simetris antara control dan target)",
+        "swap_info": "🔗 **SWAP**: Menukar state kedua target qubit",
+        "ccx_info": "🔗 **CCX (Toffoli)**: Flip target qubit jika kedua control qubit = |1⟩",
+        "apply_multi_qubit_btn": "➕ Aplikasikan {gate_name}",
+        "multi_qubit_applied_success": "✅ Diterapkan: {operation}",
         
         # Reset
         "reset_btn": "🔄 Reset Sistem",
         "reset_warning": "⚠️ Sistem direset ke |0...0⟩",
+        "undo_btn": "↩️ Urungkan",
+        "redo_btn": "↪️ Ulangi",
+        "timeline_label": "🕒 Timeline (gate diterapkan)",
+        "timeline_help": "Telusuri circuit langkah demi langkah. State disimpan sebagai checkpoint setiap {interval} gate, jadi setiap langkah memutar ulang paling banyak sejumlah itu; gate self-inverse dibatalkan langsung di tempat.",
+        "timeline_stats": "🕒 {checkpoints} checkpoint · {replayed} gate diputar ulang · {inverted} dibalik di tempat",
         
         # Main area
         "state_vector_header": " Visualisasi State Vector",
         "save_state_vector_btn": "💾 Simpan Grafik State Vector",
         "measurement_header": " Simulasi Pengukuran",
         "shots_label": "Jumlah Shots:",
+        "measured_qubits_label": "Qubit yang Diukur:",
+        "measured_qubits_help": "Hanya register terpilih yang diukur; histogram menampilkan 2^k hasilnya (qubit pertama yang dipilih = bit paling kiri)",
         "save_measurement_btn": "💾 Simpan Histogram Pengukuran",
+        "show_bloch": "🌐 Tampilkan Bloch Sphere",
+        "bloch_header": "🌐 Bloch Sphere",
+        "bloch_qubits_label": "Qubit yang digambar",
+        "bloch_title": "Q{qubit} (|r| = {length:.3f})",
+        "rdm_qubits_label": "Reduced density matrix untuk qubit",
+        "rdm_title": "ρ ({qubits})",
         
         # State info
         "state_info_header": " Informasi State",
         "current_state": "#### 📍 State Saat Ini:",
         "circuit_history": "#### 🔧 Riwayat Circuit:",
         "no_gates_applied": "Belum ada gate yang diterapkan",
+        "history_hidden": "… {count} operasi sebelumnya tidak ditampilkan",
+        "compile_report": "⚙️ Run terakhir: {before} gate di-compile menjadi {after} pass pada state vector ({skipped} dilanjutkan dari cache)",
         "show_matrix": "📐 Tampilkan Matrix Gate",
         "matrix_title": "Matrix",
         
@@ -186,6 +293,9 @@ Saat diukur, qubit **collapse** ke salah satu basis state (|0⟩ atau |1⟩) den
         "gate_pauli_z_desc": "Phase flip: mengubah tanda fase |1⟩ menjadi -|1⟩",
         "gate_s_desc": "Phase shift π/2: menambah fase i pada |1⟩",
         "gate_t_desc": "Phase shift π/4: penting untuk komputasi universal",
+        "gate_rx_desc": "Rotasi sebesar sudut θ terhadap sumbu X Bloch sphere",
+        "gate_ry_desc": "Rotasi sebesar sudut θ terhadap sumbu Y: amplitudo real, superposisi yang bisa diatur",
+        "gate_rz_desc": "Rotasi sebesar sudut θ terhadap sumbu Z: fase relatif e^{iθ}",
         
         # Language selector
         "language_label": "🌐 Bahasa:",
@@ -223,38 +333,90 @@ Al medirse, un qubit **colapsa** a uno de los estados base (|0⟩ o |1⟩) con p
         "sidebar_settings": "⚙️ Configuración de Simulación",
         "num_qubits_label": "Número de Qubits:",
         "num_qubits_help": "Seleccione el número de qubits para el sistema cuántico (1-3 qubits)",
+        "large_register_label": "🧠 Modo de registro grande",
+        "large_register_help": "Permite hasta {max_qubits} qubits, limitado por un presupuesto de memoria",
+        "memory_budget_label": "Presupuesto de memoria (MiB):",
+        "precision_label": "Precisión:",
+        "precision_help": "complex64 reduce a la mitad la memoria y el ancho de banda; la norma solo se renormaliza cuando la deriva acumulada supera la tolerancia",
+        "memory_error": "⛔ {num_qubits} qubits necesitan unos {needed} (estado + búferes), el presupuesto es {budget}",
+        "memory_suggest_precision": "💡 Cabría con precisión simple ({dtype})",
+        "memory_suggest_qubits": "💡 Caben como máximo {num_qubits} qubits en este presupuesto",
+        "memory_footprint_label": "💾 Memoria: {used}",
+        "norm_drift_label": "📏 Deriva de la norma: {drift:.2e} ({count} renormalizaciones)",
+        "state_cache_label": "🗃️ Caché de estados compartida: {hit_rate:.0f}% aciertos, {used}, {evictions} desalojos",
+        "backend_label": "🧮 Backend: {backend}",
+        "backend_stabilizer": "Estabilizador (circuito Clifford)",
+        "backend_statevector": "Vector de Estado",
         "add_gate_header": "🎛️ Añadir Puerta Cuántica",
         "select_gate": "Seleccionar Puerta:",
         "select_gate_help": "Seleccione la puerta cuántica a aplicar",
+        "rotation_angle_label": "Ángulo de rotación θ (radianes):",
         "target_qubit": "Qubit Objetivo:",
         "target_qubit_help": "Qubit que recibirá la puerta",
         "apply_gate_btn": "➕ Aplicar Puerta",
         "gate_applied_success": "✅ {gate_name} aplicado a Q{target}",
-        
-        # CNOT section
-        "cnot_header": "🔗 Puerta CNOT (2-Qubit)",
+        "measure_qubit_btn": "📏 Medir Qubit",
+        "reset_qubit_btn": "↩️ Reiniciar Qubit",
+        "qubit_measured_success": "📏 Q{target} medido: {outcome} (guardado en c{clbit}), estado colapsado",
+        "qubit_reset_success": "↩️ Q{target} reiniciado a |0⟩",
+        "algorithms_header": "📚 Algoritmos",
+        "algorithm_label": "Algoritmo predefinido",
+        "algorithm_qft": "Transformada Cuántica de Fourier",
+        "algorithm_iqft": "QFT inversa",
+        "algorithm_grover": "Búsqueda de Grover",
+        "algorithm_dj": "Deutsch-Jozsa",
+        "algorithm_bv": "Bernstein-Vazirani",
+        "grover_marked_label": "Estado marcado",
+        "bv_secret_label": "Cadena secreta",
+        "dj_function_label": "Función oráculo",
+        "dj_constant": "Constante",
+        "dj_balanced": "Balanceada",
+        "load_algorithm_btn": "▶️ Cargar algoritmo",
+        "algorithm_loaded_success": "✅ {name} cargado ({count} puertas)",
+        
+        # Multi-qubit gate section
+        "multi_qubit_header": "🔗 Puertas Multi-Qubit",
+        "multi_qubit_gate_label": "Puerta:",
         "control_label": "Control:",
         "target_label": "Objetivo:",
         "cnot_info": "🔗 **CNOT**: Invierte el qubit objetivo si el qubit de control = |1⟩",
-        "apply_cnot_btn": "➕ Aplicar CNOT",
-        "cnot_applied_success": "✅ CNOT aplicado (C: Q{control}, T: Q{target})",
+        "cz_info": "🔗 **CZ**: Invierte la fase de |11⟩ (simétrica entre control y objetivo)",
+        "swap_info": "🔗 **SWAP**: Intercambia los estados de los dos qubits objetivo",
+        "ccx_info": "🔗 **CCX (Toffoli)**: Invierte el qubit objetivo si ambos qubits de control = |1⟩",
+        "apply_multi_qubit_btn": "➕ Aplicar {gate_name}",
+        "multi_qubit_applied_success": "✅ Aplicado: {operation}",
         
         # Reset
         "reset_btn": "🔄 Reiniciar Sistema",
         "reset_warning": "⚠️ Sistema reiniciado a |0...0⟩",
+        "undo_btn": "↩️ Deshacer",
+        "redo_btn": "↪️ Rehacer",
+        "timeline_label": "🕒 Línea de tiempo (puertas aplicadas)",
+        "timeline_help": "Recorre el circuito paso a paso. Se guarda un punto de control cada {interval} puertas, así que cada paso reproduce como mucho esa cantidad; las puertas autoinversas se deshacen en el lugar.",
+        "timeline_stats": "🕒 {checkpoints} puntos de control · {replayed} puertas reproducidas · {inverted} invertidas en el lugar",
         
         # Main area
         "state_vector_header": " Visualización del Vector de Estado",
         "save_state_vector_btn": "💾 Guardar Gráfico del Vector de Estado",
         "measurement_header": " Simulación de Medición",
         "shots_label": "Número de Disparos:",
+        "measured_qubits_label": "Qubits Medidos:",
+        "measured_qubits_help": "Solo se mide el registro seleccionado; el histograma muestra sus 2^k resultados (primer qubit seleccionado = bit más a la izquierda)",
         "save_measurement_btn": "💾 Guardar Histograma de Medición",
+        "show_bloch": "🌐 Mostrar Esferas de Bloch",
+        "bloch_header": "🌐 Esferas de Bloch",
+        "bloch_qubits_label": "Qubits a dibujar",
+        "bloch_title": "Q{qubit} (|r| = {length:.3f})",
+        "rdm_qubits_label": "Matriz de densidad reducida de los qubits",
+        "rdm_title": "ρ ({qubits})",
         
         # State info
         "state_info_header": " Información del Estado",
         "current_state": "#### 📍 Estado Actual:",
         "circuit_history": "#### 🔧 Historial del Circuito:",
         "no_gates_applied": "Aún no se han aplicado puertas",
+        "history_hidden": "… {count} operaciones anteriores no se muestran",
+        "compile_report": "⚙️ Última ejecución: {before} puertas compiladas en {after} pasadas sobre el vector de estado ({skipped} retomadas de la caché)",
         "show_matrix": "📐 Mostrar Matriz de la Puerta",
         "matrix_title": "Matriz",
         
@@ -280,6 +442,9 @@ Al medirse, un qubit **colapsa** a uno de los estados base (|0⟩ o |1⟩) con p
         "gate_pauli_z_desc": "Inversión de fase: cambia la fase de |1⟩ a -|1⟩",
         "gate_s_desc": "Desplazamiento de fase π/2: añade fase i a |1⟩",
         "gate_t_desc": "Desplazamiento de fase π/4: importante para computación universal",
+        "gate_rx_desc": "Rotación de ángulo θ alrededor del eje X de la esfera de Bloch",
+        "gate_ry_desc": "Rotación de ángulo θ alrededor del eje Y: amplitudes reales, superposición ajustable",
+        "gate_rz_desc": "Rotación de ángulo θ alrededor del eje Z: fase relativa e^{iθ}",
         
         # Language selector
         "language_label": "🌐 Idioma:",
@@ -317,38 +482,90 @@ Al medirse, un qubit **colapsa** a uno de los estados base (|0⟩ o |1⟩) con p
         "sidebar_settings": "⚙️ 模拟设置",
         "num_qubits_label": "量子比特数量：",
         "num_qubits_help": "选择量子系统的量子比特数量（1-3个量子比特）",
+        "large_register_label": "🧠 大寄存器模式",
+        "large_register_help": "允许最多 {max_qubits} 个量子比特，受内存预算限制",
+        "memory_budget_label": "内存预算（MiB）：",
+        "precision_label": "精度：",
+        "precision_help": "complex64 将内存和带宽减半；仅当累计漂移超过容差时才重新归一化",
+        "memory_error": "⛔ {num_qubits} 个量子比特约需 {needed}（态矢量 + 缓冲区），预算为 {budget}",
+        "memory_suggest_precision": "💡 使用单精度（{dtype}）即可容纳",
+        "memory_suggest_qubits": "💡 此预算最多容纳 {num_qubits} 个量子比特",
+        "memory_footprint_label": "💾 内存：{used}",
+        "norm_drift_label": "📏 范数漂移：{drift:.2e}（{count} 次重新归一化）",
+        "state_cache_label": "🗃️ 共享状态缓存：命中率 {hit_rate:.0f}%，{used}，淘汰 {evictions} 次",
+        "backend_label": "🧮 后端：{backend}",
+        "backend_stabilizer": "稳定子（Clifford电路）",
+        "backend_statevector": "态矢量",
         "add_gate_header": "🎛️ 添加量子门",
         "select_gate": "选择门：",
         "select_gate_help": "选择要应用的量子门",
+        "rotation_angle_label": "旋转角度θ（弧度）：",
         "target_qubit": "目标量子比特：",
         "target_qubit_help": "将接收门操作的量子比特",
         "apply_gate_btn": "➕ 应用门",
         "gate_applied_success": "✅ {gate_name} 已应用于 Q{target}",
-        
-        # CNOT section
-        "cnot_header": "🔗 CNOT门（2量子比特）",
+        "measure_qubit_btn": "📏 测量量子比特",
+        "reset_qubit_btn": "↩️ 重置量子比特",
+        "qubit_measured_success": "📏 Q{target} 测量结果：{outcome}（存入 c{clbit}），状态已坍缩",
+        "qubit_reset_success": "↩️ Q{target} 已重置为 |0⟩",
+        "algorithms_header": "📚 算法",
+        "algorithm_label": "预置算法",
+        "algorithm_qft": "量子傅里叶变换",
+        "algorithm_iqft": "逆 QFT",
+        "algorithm_grover": "Grover 搜索",
+        "algorithm_dj": "Deutsch-Jozsa",
+        "algorithm_bv": "Bernstein-Vazirani",
+        "grover_marked_label": "标记态",
+        "bv_secret_label": "秘密字符串",
+        "dj_function_label": "Oracle 函数",
+        "dj_constant": "常数",
+        "dj_balanced": "平衡",
+        "load_algorithm_btn": "▶️ 加载算法",
+        "algorithm_loaded_success": "✅ 已加载 {name}（{count} 个门）",
+        
+        # Multi-qubit gate section
+        "multi_qubit_header": "🔗 多量子比特门",
+        "multi_qubit_gate_label": "门：",
         "control_label": "控制：",
         "target_label": "目标：",
         "cnot_info": "🔗 **CNOT**：当控制量子比特 = |1⟩ 时翻转目标量子比特",
-        "apply_cnot_btn": "➕ 应用CNOT",
-        "cnot_applied_success": "✅ CNOT已应用（控制：Q{control}，目标：Q{target}）",
+        "cz_info": "🔗 **CZ**：翻转 |11⟩ 的相位（控制与目标对称）",
+        "swap_info": "🔗 **SWAP**：交换两个目标量子比特的状态",
+        "ccx_info": "🔗 **CCX（Toffoli）**：当两个控制量子比特均为 |1⟩ 时翻转目标量子比特",
+        "apply_multi_qubit_btn": "➕ 应用{gate_name}",
+        "multi_qubit_applied_success": "✅ 已应用：{operation}",
         
         # Reset
         "reset_btn": "🔄 重置系统",
         "reset_warning": "⚠️ 系统已重置为 |0...0⟩",
+        "undo_btn": "↩️ 撤销",
+        "redo_btn": "↪️ 重做",
+        "timeline_label": "🕒 时间线（已应用的门）",
+        "timeline_help": "逐步浏览电路。每 {interval} 个门保存一次状态检查点，因此任一步最多重放这么多门；自逆门直接原地撤销。",
+        "timeline_stats": "🕒 {checkpoints} 个检查点 · 重放 {replayed} 个门 · 原地逆转 {inverted} 个",
         
         # Main area
         "state_vector_header": " 状态向量可视化",
         "save_state_vector_btn": "💾 保存状态向量图",
         "measurement_header": " 测量模拟",
         "shots_label": "测量次数：",
+        "measured_qubits_label": "测量的量子比特：",
+        "measured_qubits_help": "仅测量所选寄存器；直方图显示其2^k个结果（第一个所选量子比特 = 最左边的位）",
         "save_measurement_btn": "💾 保存测量直方图",
+        "show_bloch": "🌐 显示布洛赫球",
+        "bloch_header": "🌐 布洛赫球",
+        "bloch_qubits_label": "要绘制的量子比特",
+        "bloch_title": "Q{qubit} (|r| = {length:.3f})",
+        "rdm_qubits_label": "量子比特的约化密度矩阵",
+        "rdm_title": "ρ ({qubits})",
         
         # State info
         "state_info_header": " 状态信息",
         "current_state": "#### 📍 当前状态：",
         "circuit_history": "#### 🔧 电路历史：",
         "no_gates_applied": "尚未应用任何门",
+        "history_hidden": "… 未显示之前的 {count} 个操作",
+        "compile_report": "⚙️ 上次运行：{before} 个门编译为 {after} 次态矢量遍历（{skipped} 个从缓存恢复）",
         "show_matrix": "📐 显示门矩阵",
         "matrix_title": "矩阵",
         
@@ -374,6 +591,9 @@ Al medirse, un qubit **colapsa** a uno de los estados base (|0⟩ o |1⟩) con p
         "gate_pauli_z_desc": "相位翻转：将 |1⟩ 的相位变为 -|1⟩",
         "gate_s_desc": "相位偏移π/2：为 |1⟩ 添加相位i",
         "gate_t_desc": "相位偏移π/4：对通用计算很重要",
+        "gate_rx_desc": "绕布洛赫球X轴旋转角度θ",
+        "gate_ry_desc": "绕Y轴旋转角度θ：实振幅，可调叠加",
+        "gate_rz_desc": "绕Z轴旋转角度θ：相对相位e^{iθ}",
         
         # Language selector
         "language_label": "🌐 语言：",
@@ -411,6 +631,9 @@ def get_gate_description(lang, gate_name):
         "Pauli-Z": "gate_pauli_z_desc",
         "S Gate": "gate_s_desc",
         "T Gate": "gate_t_desc",
+        "Rx": "gate_rx_desc",
+        "Ry": "gate_ry_desc",
+        "Rz": "gate_rz_desc",
     }
     
     key = gate_desc_map.get(gate_name, "")